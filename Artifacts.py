@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+Columnar per-game artifact of the tables created by `GameStats.All`.
+
+Each table (the plays, prior5, Momentum, SumStats, XY tables, penalties, etc.) is saved as an
+uncompressed `.npz` file in `Data/<season>/<game_id>/artifact`, with one NumPy array per
+column. Since the arrays of an `.npz` file are only read when they are accessed, a table can
+be loaded with only the columns that are needed. The remaining (small) attributes of the game
+are pickled together in `attrs.pkl`, and `manifest.json` records the artifact version, the
+state (and hash) of the feeds it was created from, and the key of each stage's output
+(see `GameStats.StageKeys`).
+    
+    tables, attrs = LoadArtifact(data_dir, columns={'plays': ['event_type', 'elapsed_s']})
+    plays = ReadArtifactTable(data_dir, 'plays', ['event_type', 'elapsed_s'])
+
+Created on Sun Oct 18 14:47:52 2026
+
+@author: grega
+"""
+import os
+import json
+import time
+import pickle
+import numpy as np
+import pandas as pd
+
+from FeedCache import ReadMeta, Replace
+
+# Increment whenever the tables created by `GameStats.All` (or how they are saved) change,
+# so that artifacts saved by an older version are recomputed instead of loaded
+ARTIFACT_VERSION = 1
+
+def ArtifactDir(data_dir):
+    """The directory a game's artifact is saved in."""
+    return os.path.join(data_dir, 'artifact')
+
+def ObjectArray(values):
+    """Create a 1-D object array (which keeps tuples, e.g. MultiIndex labels, intact)."""
+    values = list(values)
+    arr    = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
+
+def SaveTable(path, df):
+    """
+    Save a df as an `.npz` file with one array per column.
+    
+    Parameters
+    ----------
+    path : str
+        The `.npz` file.
+    df : pd.DataFrame
+        The table. Timezone aware columns are saved in UTC, and any other pandas specific
+        dtypes are saved as objects, then restored by `ReadTable`.
+    
+    Returns
+    -------
+    None.
+    
+    """
+    arrays = dict()
+    dtypes = []
+    for i in range(df.shape[1]):
+        col = df.iloc[:, i]
+        if isinstance(col.dtype, pd.DatetimeTZDtype):
+            arr = col.dt.tz_convert('UTC').dt.tz_localize(None).to_numpy()
+        elif isinstance(col.dtype, np.dtype):
+            arr = col.to_numpy()
+        else:
+            arr = col.to_numpy(dtype=object)
+        arrays[f'c{i}'] = arr
+        dtypes.append(str(col.dtype))
+    
+    # Save the index (a RangeIndex only needs its start, stop, and step)
+    index = df.index
+    if isinstance(index, pd.RangeIndex):
+        layout = dict(index='range', range=[index.start, index.stop, index.step])
+    else:
+        layout = dict(index='multi' if isinstance(index, pd.MultiIndex) else 'index')
+        arrays['index'] = ObjectArray(index) if layout['index'] == 'multi' else index.to_numpy()
+    layout['index_names'] = list(index.names)
+    
+    # Save the column labels (as tuples for a MultiIndex)
+    layout['columns_multi'] = isinstance(df.columns, pd.MultiIndex)
+    layout['column_names']  = list(df.columns.names)
+    arrays['columns'] = ObjectArray(df.columns)
+    arrays['dtypes'] = np.array(dtypes)
+    arrays['layout'] = np.array(json.dumps(layout, default=str))
+    
+    Replace(path, lambda f: np.savez(f, **arrays))
+
+def ReadTable(path, columns=None):
+    """
+    Read a df saved by `SaveTable`.
+    
+    Parameters
+    ----------
+    path : str
+        The `.npz` file.
+    columns : list, optional
+        The columns to read. The default is None, which reads every column.
+    
+    Returns
+    -------
+    pd.DataFrame
+    
+    """
+    with np.load(path, allow_pickle=True) as z:
+        layout = json.loads(z['layout'].item())
+        labels = list(z['columns'])
+        dtypes = list(z['dtypes'])
+        
+        if layout['index'] == 'range':
+            index = pd.RangeIndex(*layout['range'])
+        elif layout['index'] == 'multi':
+            index = pd.MultiIndex.from_tuples(
+                [tuple(i) for i in z['index']], names=layout['index_names']
+            )
+        else:
+            index = pd.Index(z['index'])
+        index.names = layout['index_names']
+        
+        # Only the arrays of the requested columns are read from the file
+        keep = range(len(labels)) if columns is None else \
+            [i for i, c in enumerate(labels) if c in set(columns)]
+        data = dict()
+        for i in keep:
+            arr, dtype = z[f'c{i}'], pd.api.types.pandas_dtype(dtypes[i])
+            if isinstance(dtype, pd.DatetimeTZDtype):
+                col = pd.Series(arr, index=index).dt.tz_localize('UTC').dt.tz_convert(dtype.tz)
+            elif dtype != arr.dtype:
+                col = pd.Series(arr, index=index).astype(dtype)
+            else:
+                col = pd.Series(arr, index=index)
+            data[i] = col
+    
+    df = pd.DataFrame(data, index=index)
+    df.columns = [labels[i] for i in keep]
+    if layout['columns_multi']:
+        df.columns = pd.MultiIndex.from_tuples(df.columns, names=layout['column_names'])
+    else:
+        df.columns.names = layout['column_names']
+    
+    return df
+
+def SaveArtifact(data_dir, game_id, tables, attrs, stages=None):
+    """
+    Save a game's artifact.
+    
+    Parameters
+    ----------
+    data_dir : str
+        The game's data directory.
+    game_id : int
+        The NHL game id.
+    tables : dict
+        The dfs to save, by name.
+    attrs : dict
+        The other (picklable) attributes to save, by name.
+    stages : dict, optional
+        The key of each stage's output, by stage name. The default is None.
+    
+    Returns
+    -------
+    None.
+    
+    """
+    art_dir = ArtifactDir(data_dir)
+    os.makedirs(art_dir, exist_ok=True)
+    
+    for name, df in tables.items():
+        SaveTable(os.path.join(art_dir, f'{name}.npz'), df)
+    Replace(os.path.join(art_dir, 'attrs.pkl'), lambda f: pickle.dump(attrs, f))
+    
+    # The manifest is written last, so a partially saved artifact is never loaded
+    feeds    = ReadMeta(data_dir) or dict()
+    manifest = dict(
+        version    = ARTIFACT_VERSION,
+        game_id    = int(game_id),
+        game_state = feeds.get('game_state'),
+        fetched    = feeds.get('fetched'),
+        feed_hash  = feeds.get('hash'),
+        stages     = stages or dict(),
+        saved      = time.time(),
+        tables     = {name: [str(c) for c in df.columns] for name, df in tables.items()}
+    )
+    Replace(
+        os.path.join(art_dir, 'manifest.json'), lambda f: json.dump(manifest, f), mode='w'
+    )
+
+def ReadManifest(data_dir):
+    """
+    Read the manifest of a game's artifact.
+    
+    Returns None if there is no artifact, it was saved by a different `ARTIFACT_VERSION`,
+    or the contents of the game's cached feeds have changed since the artifact was saved.
+    
+    """
+    try:
+        with open(os.path.join(ArtifactDir(data_dir), 'manifest.json'), 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if manifest.get('version') != ARTIFACT_VERSION:
+        return None
+    
+    feeds = ReadMeta(data_dir) or dict()
+    if feeds.get('hash') is None or feeds.get('hash') != manifest.get('feed_hash'):
+        return None
+    
+    return manifest
+
+def LoadArtifact(data_dir, tables=None, columns=None):
+    """
+    Load a game's artifact.
+    
+    Parameters
+    ----------
+    data_dir : str
+        The game's data directory.
+    tables : list, optional
+        The tables to load. The default is None, which loads every table.
+    columns : dict, optional
+        The columns to load for any of the tables, e.g. {'plays': ['event_type']}.
+        The default is None, which loads every column.
+    
+    Returns
+    -------
+    tables : dict
+        The dfs, by name.
+    attrs : dict
+        The other attributes, by name.
+    
+    Returns None instead if the artifact can't be used (see `ReadManifest`).
+    
+    """
+    manifest = ReadManifest(data_dir)
+    if manifest is None:
+        return None
+    
+    columns = columns or dict()
+    names   = manifest['tables'] if tables is None else tables
+    tables  = {name: ReadArtifactTable(data_dir, name, columns.get(name)) for name in names}
+    
+    return tables, ReadAttrs(data_dir)
+
+def ReadArtifactTable(data_dir, name, columns=None):
+    """Read one of the tables (`name`) of a game's artifact (see `ReadTable`)."""
+    return ReadTable(os.path.join(ArtifactDir(data_dir), f'{name}.npz'), columns)
+
+def ReadAttrs(data_dir):
+    """Read the attributes (other than the tables) saved in a game's artifact."""
+    with open(os.path.join(ArtifactDir(data_dir), 'attrs.pkl'), 'rb') as f:
+        return pickle.load(f)
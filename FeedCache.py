@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+"""
+On-disk cache of the raw plays and shifts feeds that the nhlstats module collects from the
+NHL API for an individual game. (The shots are a subset of the plays, so they are not
+collected separately. See `GameStats.__init__`)
+
+The feeds are saved as JSON files in the game's data directory (`Data/<season>/<game_id>`)
+along with a small `feed_meta.json` file recording the state of the game when the feeds
+were collected. Whether the cached feeds can be used is based on that state:
+    
+    Final - The game is over (the plays include the GAME_END event) and the shift chart has
+            been published through the last period, so the feeds can't change and are
+            always served from disk.
+    Live  - The game has not ended (or its shift chart is missing or incomplete, since it is
+            usually published after the game ends). The feeds are collected again once they
+            are older than `max_age` seconds (by default, every time they are requested).
+
+When several games are about to be processed, `Prefetch` collects their feeds in background
+threads so the network calls for the later games overlap with the processing of the earlier
+ones. `LoadFeeds` then waits on (and uses) the prefetched feeds for a game. Every call shares
+the same pool of threads.
+    
+    Prefetch(Games.game_id)
+    for game_id in Games.game_id:
+        gs = GameStats(game_id)
+        gs.All()
+
+Created on Sun Oct 18 11:02:15 2026
+
+@author: grega
+"""
+import os
+import json
+import time
+import hashlib
+import tempfile
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+
+from nhlstats import list_plays, list_shifts
+
+# The feeds collected for each game, and the nhlstats function used to collect each one
+FEEDS = {'plays': list_plays, 'shifts': list_shifts}
+
+# Increment whenever the rules `GameState` uses to decide a game is final change, so caches
+# that were marked 'Final' by the old rules are checked again
+STATE_VERSION = 2
+
+# The most prefetched feeds kept in memory until they are used. (Only games that have not
+# ended are kept, see `_Release`)
+MAX_PENDING = 64
+
+# The feeds being collected in background threads (see `Prefetch`), keyed by the process id
+# and the game's data directory. Each entry is the time the prefetch was requested and its
+# future. (A forked worker process inherits a copy of this dictionary, but not the threads,
+# so it should only use the prefetches that it made itself)
+_pending = dict()
+_pending_lock = Lock()
+
+# The pool of threads shared by every `Prefetch`, and the id of the process that created it
+_executor = None
+_executor_pid = None
+
+def GameDir(game_id):
+    """The game's data directory (`Data/<season>/<game_id>` in the current working directory)."""
+    return os.path.join(os.getcwd(), 'Data', str(game_id)[:4], str(game_id))
+
+def GameState(plays, shifts):
+    """
+    Determine the state of a game from its raw plays and shifts feeds.
+    
+    Parameters
+    ----------
+    plays : list
+        The raw plays feed (a list of dictionaries) provided by `list_plays`.
+    shifts : list
+        The raw shifts feed provided by `list_shifts`.
+    
+    Returns
+    -------
+    str
+        'Final' if the game has ended and the shifts reach the last period that was played
+        (shootouts have no shifts), otherwise 'Live'.
+    
+    """
+    if not any(p.get('event_type') == 'GAME_END' for p in plays):
+        return 'Live'
+    
+    periods = [
+        int(p['period']) for p in plays
+        if p.get('period') is not None and p.get('period_type') != 'SHOOTOUT'
+    ]
+    shift_periods = [int(s['period']) for s in shifts if s.get('period') is not None]
+    if not shift_periods or max(shift_periods) < max(periods, default=1):
+        return 'Live'
+    
+    return 'Final'
+
+def FeedHash(feeds):
+    """
+    Hash the contents of a game's raw feeds.
+    
+    The hash is saved in the cache's meta data, and identifies the input of every stage of
+    `GameStats.All` (see `GameStats.StageKeys`).
+    
+    Parameters
+    ----------
+    feeds : dict
+        The raw 'plays' and 'shifts' feeds.
+    
+    Returns
+    -------
+    str
+        The SHA-256 hash (hex) of the feeds.
+    
+    """
+    h = hashlib.sha256()
+    for name in FEEDS:
+        h.update(json.dumps(feeds[name], sort_keys=True, default=str).encode())
+    
+    return h.hexdigest()
+
+def Replace(path, write, mode='wb'):
+    """
+    Write a file in full (with `write(f)`) before replacing the old version.
+    
+    Each write goes through its own temporary file in the same directory, so threads or
+    processes saving the same file at the same time can't mix their contents.
+    """
+    f = tempfile.NamedTemporaryFile(
+        mode, dir=os.path.dirname(path) or '.', prefix=os.path.basename(path) + '.',
+        suffix='.tmp', delete=False
+    )
+    try:
+        with f:
+            write(f)
+        os.replace(f.name, path)
+    except BaseException:
+        if os.path.exists(f.name):
+            os.remove(f.name)
+        raise
+
+def WriteMeta(data_dir, meta):
+    """Write the cache's meta data for a game (written in full before replacing the old version)."""
+    path = os.path.join(data_dir, 'feed_meta.json')
+    Replace(path, lambda f: json.dump(meta, f, default=str), mode='w')
+
+def ReadMeta(data_dir):
+    """Read the cache's meta data for a game (None if the feeds have not been cached)."""
+    try:
+        with open(os.path.join(data_dir, 'feed_meta.json'), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def IsFresh(data_dir, max_age=0):
+    """
+    Determine if the cached feeds for a game can be used instead of the NHL API.
+    
+    Parameters
+    ----------
+    data_dir : str
+        The game's data directory.
+    max_age : float, optional
+        The number of seconds that the feeds of a game that has not ended can be reused for.
+        The default is 0.
+    
+    Returns
+    -------
+    bool
+    
+    """
+    meta = ReadMeta(data_dir)
+    if meta is None:
+        return False
+    
+    # Every feed must have been saved
+    if not all(os.path.isfile(os.path.join(data_dir, f'{name}.json')) for name in FEEDS):
+        return False
+    
+    if meta.get('game_state') == 'Final' and meta.get('state_version') == STATE_VERSION:
+        return True
+    
+    return time.time() - meta.get('fetched', 0) <= max_age
+
+def LoadFeeds(game_id, data_dir, call=None, max_age=0):
+    """
+    Collect the raw plays and shifts feeds for a game.
+    
+    If the game's feeds are being prefetched (see `Prefetch`), the prefetched feeds are used.
+    A prefetch that has already finished is only used if it was requested no more than
+    `max_age` seconds ago. Otherwise, see `CollectFeeds`.
+    
+    Parameters
+    ----------
+    game_id : int
+        The NHL game id.
+    data_dir : str
+        The game's data directory (created if needed).
+    call : function, optional
+        Used to make the calls to the NHL API as `call(func, game_id, game_id=game_id)`
+        (e.g. `Timings.call`). The default is None, which calls `func(game_id)` directly.
+    max_age : float, optional
+        The number of seconds that the feeds of a game that has not ended can be reused for.
+        The default is 0.
+    
+    Returns
+    -------
+    feeds : dict
+        The raw 'plays' and 'shifts' feeds (lists of dictionaries).
+    cached : bool
+        True if the feeds were read from disk.
+    
+    """
+    # Each prefetch is only used once, so a game that is still being played is collected
+    # again the next time it is requested
+    with _pending_lock:
+        requested, future = _pending.pop((os.getpid(), data_dir), (None, None))
+    
+    if future is not None and Stale(requested, future, max_age):
+        future = None
+    
+    if future is not None:
+        try:
+            return future.result()
+        except Exception as e:
+            print(f'Game: {game_id}\nUnable to prefetch the feeds ({e!r}). Trying again.\n')
+    
+    return CollectFeeds(game_id, data_dir, call, max_age)
+
+def CollectFeeds(game_id, data_dir, call=None, max_age=0):
+    """
+    Collect the raw plays and shifts feeds for a game, from the cache or the NHL API.
+    
+    The feeds are read from the game's data directory when the cache is fresh (see
+    `IsFresh`), otherwise they are collected from the NHL API and saved to the directory.
+    
+    Parameters
+    ----------
+    game_id : int
+        The NHL game id.
+    data_dir : str
+        The game's data directory (created if needed).
+    call : function, optional
+        Used to make the calls to the NHL API as `call(func, game_id, game_id=game_id)`
+        (e.g. `Timings.call`). The default is None, which calls `func(game_id)` directly.
+    max_age : float, optional
+        The number of seconds that the feeds of a game that has not ended can be reused for.
+        The default is 0.
+    
+    Returns
+    -------
+    feeds : dict
+        The raw 'plays' and 'shifts' feeds (lists of dictionaries).
+    cached : bool
+        True if the feeds were read from disk.
+    
+    """
+    if IsFresh(data_dir, max_age):
+        feeds = dict()
+        for name in FEEDS:
+            with open(os.path.join(data_dir, f'{name}.json'), 'r') as f:
+                feeds[name] = json.load(f)
+        
+        # Feeds cached before their contents were hashed are hashed once now
+        meta = ReadMeta(data_dir)
+        if 'hash' not in meta:
+            meta['hash'] = FeedHash(feeds)
+            WriteMeta(data_dir, meta)
+        
+        return feeds, True
+    
+    # Collect the feeds from the NHL API
+    if call is None:
+        call = lambda func, *args, **kwargs: func(*args)
+    feeds = {name: call(func, game_id, game_id=game_id) for name, func in FEEDS.items()}
+    
+    # Save the feeds. Each file is written in full before replacing the old version, and
+    # the meta data is written last so a partially saved cache is never considered fresh.
+    os.makedirs(data_dir, exist_ok=True)
+    meta = dict(
+        game_id       = game_id,
+        game_state    = GameState(feeds['plays'], feeds['shifts']),
+        state_version = STATE_VERSION,
+        fetched       = time.time(),
+        hash          = FeedHash(feeds)
+    )
+    for name, data in feeds.items():
+        path = os.path.join(data_dir, f'{name}.json')
+        Replace(path, lambda f: json.dump(data, f, default=str), mode='w')
+    WriteMeta(data_dir, meta)
+    
+    return feeds, False
+
+def Stale(requested, future, max_age=0):
+    """
+    Determine if a prefetch is too old to use.
+    
+    A prefetch that is still running is never stale (its feeds are the newest that can be
+    collected). Once it has finished, its feeds are stale after `max_age` seconds from the
+    time it was requested.
+    """
+    return future.done() and time.time() - requested > max_age
+
+def Executor(max_workers=4):
+    """
+    The pool of threads shared by every `Prefetch`.
+    
+    The pool is created by the first call (with `max_workers` threads). A forked worker process
+    inherits the pool but not its threads, so it creates a pool of its own.
+    """
+    global _executor, _executor_pid
+    with _pending_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(max_workers, thread_name_prefix='Prefetch')
+            _executor_pid = os.getpid()
+        
+        return _executor
+
+def _Release(key, future):
+    """
+    Drop a prefetch once it is done, unless its feeds are still needed in memory.
+    
+    The feeds of a game that has ended are read back from the cache by `LoadFeeds`, and a
+    failed prefetch is just collected again, so only the feeds of games that have not ended
+    are kept (at most `MAX_PENDING`, the oldest are dropped first).
+    """
+    keep = future.exception() is None and not IsFresh(key[1])
+    with _pending_lock:
+        if not keep:
+            if _pending.get(key, (None, None))[1] is future:
+                del _pending[key]
+            return
+        
+        done = [k for k, (requested, f) in _pending.items() if f.done()]
+        for k in done[:max(len(done) - MAX_PENDING, 0)]:
+            del _pending[k]
+
+def Prefetch(game_ids, max_workers=4, max_age=0, timings=None):
+    """
+    Start collecting the feeds for a list of games in background threads.
+    
+    At most `max_workers` games are collected at a time. The feeds are picked up by
+    `LoadFeeds` (and so by `GameStats`) when each game is processed. Games that are already
+    being prefetched are skipped, unless their prefetch has finished and is older than
+    `max_age` (see `Stale`). (See `_Release` for how long the feeds are kept)
+    
+    Parameters
+    ----------
+    game_ids : list
+        The NHL game ids, in the order they will be processed.
+    max_workers : int, optional
+        The number of games collected at the same time. The default is 4. (Only used by the
+        first call, which creates the shared pool of threads, see `Executor`)
+    max_age : float, optional
+        The number of seconds that the feeds of a game that has not ended can be reused for.
+        The default is 0.
+    timings : Timings, optional
+        Records the calls made to the NHL API (see `Timings.call`). The default is None.
+    
+    Returns
+    -------
+    None.
+    
+    """
+    call = timings.call if timings is not None and timings.enabled else None
+    pool = Executor(max_workers)
+    submitted = dict()
+    with _pending_lock:
+        for game_id in game_ids:
+            game_id  = int(game_id)
+            data_dir = GameDir(game_id)
+            key      = (os.getpid(), data_dir)
+            if key not in _pending or Stale(*_pending[key], max_age):
+                submitted[key] = pool.submit(CollectFeeds, game_id, data_dir, call, max_age)
+                _pending[key]  = (time.time(), submitted[key])
+    
+    # Added once the lock is released, since the callback runs right away (and takes the lock)
+    # if the game has already been collected
+    for key, future in submitted.items():
+        future.add_done_callback(lambda f, key=key: _Release(key, f))
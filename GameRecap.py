@@ -16,7 +16,8 @@ from PuckPlot import PuckPlot
 from StatsTables import StatsTables
 from TeamStats import TeamStats
 from DataPanePost import DataPane
-from nhlstats import list_games
+from Schedule import GetSchedule
+from Teams import GetTeams
 
 # Import the necessary standard modules
 import pandas as pd
@@ -49,40 +50,32 @@ class GameRecap:
         self.publish      = publish
         
         # Identify the game day, as well as the home and away team for the game
-        Games = pd.DataFrame(
-            list_games(
-                start_date=f'{str(game_id)[:4]}-07-21',
-                end_date=dt.date.today()
-            )
-        )
-        Teams     = Games[Games.game_id == game_id]
-        GameDay   = Teams.date.iloc[0]
-        GameState = Teams.game_state.iloc[0]
-        Home = Teams.home_team.iloc[0]
-        Away = Teams.away_team.iloc[0]
+        Teams     = GetSchedule(str(game_id)[:4], refresh=True).Game(game_id)
+        if Teams is None:
+            raise ValueError(f'{game_id} is not a game in the NHL schedule')
+        GameDay   = Teams.date
+        GameState = Teams.game_state
+        Home = Teams.home_team
+        Away = Teams.away_team
         
         # Collect the team abbreviations and colors, and direction of attack for the relevant arena
-        # Collect team info provided in teamList.csv file in my github repo.
-        tLUrl = 'https://raw.githubusercontent.com/AmeriFinn/LiveNHLstats/master/teamList.csv'
-        tL = pd.read_csv(tLUrl, index_col=0)
+        # Collect team info provided in the teamList.csv file.
+        Teams = GetTeams()
         
         # Collect team abbreviations recognized by the NHL
-        HomeAbrv = tL[tL.team_name == Home].team_abbrv.values[0]
-        AwayAbrv = tL[tL.team_name == Away].team_abbrv.values[0]
+        HomeAbrv = Teams.Abbrv(Home)
+        AwayAbrv = Teams.Abbrv(Away)
         
         # Collect the two primary colors (in Hex code format) listed in team logo copyright
-        Home_Color1 = tL[tL.team_abbrv == HomeAbrv].home_c.values[0]
-        Home_Color2 = tL[tL.team_abbrv == HomeAbrv].away_c.values[0]
-        
-        Away_Color1 = tL[tL.team_abbrv == AwayAbrv].away_c.values[0]
-        Away_Color2 = tL[tL.team_abbrv == AwayAbrv].home_c.values[0]
+        Home_Color1, Home_Color2 = Teams.Colors(HomeAbrv)
+        Away_Color2, Away_Color1 = Teams.Colors(AwayAbrv)
         
         # Determine if this teams arena records x/y stat data the "normal" way, or backwards.
         # Note: Some arenas are less consistent about x/y stat data.
         # Both within games (where goals/shots/hits/etc. aren't recorded properly by period)
         # or between games (where the home team will have 1st period stats recorded on
         # opposite ends of the rink). This is the best solution I have currently.
-        direct_of_attack = tL[tL.team_abbrv == HomeAbrv].normal_direct_of_play.values[0]
+        direct_of_attack = Teams.DirectOfPlay(HomeAbrv)
         
         # Assign class attributes
         self.GameDay   = GameDay
@@ -98,7 +91,6 @@ class GameRecap:
     def Recap(self):
         #
         game_id   = self.game_id
-        game_type = self.game_type
         template  = self.template
         txtColor  = '#FFFFFF' if template == 'plotly_dark' else '#000000'
         GameDay   = self.GameDay
@@ -112,7 +104,7 @@ class GameRecap:
         direct_of_attack = self.direct_of_attack
         
         # Utilize GameStats to aggregate all stats for the desired game
-        gs = GameStats(game_id, game_type = game_type)
+        gs = GameStats(game_id)
         gs.All()
         
         # Assign the GameStats class as an attribute of GameRecap
@@ -21,104 +21,625 @@ classes separately when creating game recaps.
 # Import necessary modules
 import os
 import pickle
+import hashlib
 import pandas as pd
-from math import floor
+from concurrent.futures import ProcessPoolExecutor
 from datetime import *
 import datetime as dt
 from dateutil import tz
+from functools import lru_cache
 import numpy as np
 
 # import nhlstats
-from nhlstats import list_plays, list_shots, list_games, list_shifts
+from Timings import Timings
+from FeedCache import LoadFeeds, GameDir, Prefetch, ReadMeta
+from Schedule import GetSchedule
+from Teams import GetTeams
+from Artifacts import SaveArtifact, ReadManifest, ReadArtifactTable, ReadAttrs
 
-def InHouse(x, y):
+def in_house(xs, ys):
+    """
+    Determine which events occured within "the house" for an entire array of events.
+    
+    The house is made up of a large rectangle between the top of the faceoff circles and
+    the hash marks, a small rectangle in front of the net, and the two triangles connecting
+    the large rectangle to the goal posts. Missing x/y data is handled the same way as the
+    original row by row check: a None coordinate is treated as 0, while a NaN coordinate
+    never falls within the house.
     
-    # Define a useful function for determining if an event falls within the triangular
-    # portions of the house
-    def point_on_line(x):
-        return 22 - ((x - 69) * (18 / 20))
+    Parameters
+    ----------
+    xs : array-like
+        The x coordinates of each event.
+    ys : array-like
+        The y coordinates of each event.
     
-    # Standardize the x input
-    x = 0 if x is None else x
-    y = 0 if y is None else y
-    x = abs(x)
+    Returns
+    -------
+    np.ndarray
+        A boolean mask that is True for each event that occured in the house.
+    
+    """
+    # Standardize the x/y inputs. None values (only possible in object arrays) are replaced
+    # with 0 before casting to float. Every comparison with a NaN value is False.
+    x = np.asarray(xs)
+    y = np.asarray(ys)
+    if x.dtype == object:
+        x = np.where(np.equal(x, None), 0, x)
+    if y.dtype == object:
+        y = np.where(np.equal(y, None), 0, y)
+    x = np.abs(x.astype(float))
+    y = y.astype(float)
     
-    # Check if the event occured in the large rectanglular portion of the house
     # 1st Rectangle | Domain: [54, 69],    Range: [-22, 22]
-    if 54 <= x <= 69:
-        if -22 <= y <= 22:
-            return True
-        
-    # Check if the event occured in the small rectanglular portion of the house,
-    # or the two triangular areas
+    big_rect = (54 <= x) & (x <= 69) & (-22 <= y) & (y <= 22)
+    
     # 2nd Rectangle | Domain: (69, 89],    Range: [-4, 4]
     # 1st Triangele | Domain: (69, 89],    Range: [4, 22]
     # 2nd Triangele | Domain: (69, 89],    Range: [-22, -4]
-    if 69 < x <= 89:
-        if -4 <= y <= 4:
-            return True
-        
-        elif 4 < abs(y) <= 22:
-            y = abs(y)
-            if y <= point_on_line(x):
-                return True
+    # The triangles are bounded by the line running from (69, 22) to (89, 4)
+    low_zone   = (69 < x) & (x <= 89)
+    small_rect = low_zone & (-4 <= y) & (y <= 4)
+    point_on_line = 22 - ((x - 69) * (18 / 20))
+    triangles  = low_zone & (4 < np.abs(y)) & (np.abs(y) <= 22) & (np.abs(y) <= point_on_line)
+    
+    return big_rect | small_rect | triangles
+
+def InHouse(x, y):
+    """Determine if a single event occured within "the house". See `in_house`."""
+    return bool(in_house([x], [y])[0])
+
+def TallyEvents(plays, Home, Away):
+    """
+    Build the rolling totals of each teams goals, shots, hits, etc. in a single pass.
+    
+    Each event type is identified with a boolean mask over the entire plays df, and the
+    team that gets credit for the event is stored as a column index into an (n x 2) array
+    (Away = 0, Home = 1). The rolling totals are then the cummulative sum of those arrays.
+    
+    Parameters
+    ----------
+    plays : pd.DataFrame
+        The plays df (after `ModifyDFs`) with a default RangeIndex.
+    Home : str
+        The home team abbreviation.
+    Away : str
+        The away team abbreviation.
+    
+    Returns
+    -------
+    tally : pd.DataFrame
+        The rolling totals for each team/stat column, in the same order as the columns
+        previously created row by row in `AggregateData`.
+    
+    """
+    # Define new columns for goals, shots, hits, attempts, etc.
+    ## Away: Even index numbs, Home: Odd index numbs
+    stats = [
+        "Goals", "Shots", "Hits", "Shot Attempts", "Blocked Shots", "Missed Shots",
+        "Takeaways", "Giveaways", "Faceoff Wins", "House Shots", "House Attempts"
+    ]
+    n = plays.shape[0]
     
-    return False
+    # Collect the event types, the team each event was recorded for, and the x/y data
+    event = plays['event_type'].to_numpy()
+    team  = plays['team_for'].to_numpy()
+    
+    # Column index of the team credited with the event (Away = 0, Home = 1), and the
+    # column index of the opposing team. Blocked shots are recorded for the blocking team,
+    # so the shot attempt is credited to the opposition. Any event without a recognized
+    # team is attributed to the away team, mirroring the original `oppo_ident` helper.
+    team_idx = (team == Home).astype(np.int64)
+    oppo_idx = (team == Away).astype(np.int64)
+    
+    # Identify the rows for each event type
+    is_goal    = event == 'GOAL'
+    is_shot    = is_goal | (event == 'SHOT')
+    is_missed  = event == 'MISSED_SHOT'
+    is_attempt = is_shot | is_missed
+    is_blocked = event == 'BLOCKED_SHOT'
+    
+    # Only check if an event occured in the house for the shot type events
+    house = np.zeros(n, dtype=bool)
+    check = is_attempt | is_blocked
+    if check.any():
+        xs = plays.loc[check, 'x'].to_numpy()
+        ys = plays.loc[check, 'y'].to_numpy()
+        house[check] = in_house(xs, ys)
+    
+    def record(mask, idx):
+        # Record a 1 for the appropiate team in each row where the event occured
+        arr  = np.zeros((n, 2), dtype=np.int64)
+        rows = np.flatnonzero(mask)
+        arr[rows, idx[rows]] = 1
+        return arr
+    
+    counts = {
+        "Goals":          record(is_goal, team_idx),
+        "Shots":          record(is_shot, team_idx),
+        "Hits":           record(event == 'HIT', team_idx),
+        # Shot attempts include the attempts blocked by the opposition
+        "Shot Attempts":  record(is_attempt, team_idx) | record(is_blocked, oppo_idx),
+        "Blocked Shots":  record(is_blocked, team_idx),
+        "Missed Shots":   record(is_missed, team_idx),
+        "Takeaways":      record(event == 'TAKEAWAY', team_idx),
+        "Giveaways":      record(event == 'GIVEAWAY', team_idx),
+        "Faceoff Wins":   record(event == 'FACEOFF', team_idx),
+        "House Shots":    record(is_shot & house, team_idx),
+        "House Attempts": record(is_attempt & house, team_idx) |
+                          record(is_blocked & house, oppo_idx),
+    }
+    
+    # Calculate the cummulative sum over the course of the game for each stat
+    tally = dict()
+    for stat in stats:
+        cum = counts[stat].cumsum(axis=0)
+        tally[f"{Away} {stat}"] = cum[:, 0]
+        tally[f"{Home} {stat}"] = cum[:, 1]
+    
+    return pd.DataFrame(tally, index=plays.index)
+
+def PenaltySweep(plays, Home, Away):
+    """
+    Collect the PP/PK data for every penalty in a game with an interval sweep.
+    
+    Each penalty is converted into an interval of rows in the plays df (from the row the
+    penalty was called, up to the end of the penalty or a power play goal). The men on ice,
+    power plays, PIM, PPG, and SHG for each team are then recorded as +/- markers at the
+    interval boundaries and the columns are built from cummulative sums of those markers.
+    
+    Penalties are resolved in the order they were called, so a power play goal can only end
+    the first penalty that it is scored against, and a short handed goal is only counted once.
+    
+    Parameters
+    ----------
+    plays : pd.DataFrame
+        The plays df sorted by `elapsed_s`, with a default RangeIndex.
+    Home : str
+        The home team abbreviation.
+    Away : str
+        The away team abbreviation.
+    
+    Returns
+    -------
+    cols : dict
+        The new columns for the plays df, keyed by column name.
+    pen_Home : list
+        A list of (start, end) `dt.time`s for the penalties taken by the home team.
+    pen_Away : list
+        A list of (start, end) times for the penalties taken by the away team.
+    intervals : pd.DataFrame
+        One row per penalty with the team that took the penalty, the PIM, the start/end
+        game time (in seconds), the first/last row of the plays df the penalty covers,
+        and whether the penalty was ended by a power play goal.
+    
+    """
+    # minors is currently unused.
+    # Instead of checking that a penalty is in this list,
+    # I will assume the penalty is a minor and use conditional
+    # statemnts to check that assumption.
+    minors = ['Boarding', 'Charging', 'Clipping', 'Elbowing', 'Hooking',
+              'Illegal check to the head', 'Kneeing', 'Roughing',
+              'Throwing equipment', 'Holding', 'Hooking', 'Interference',
+              'Tripping', 'Cross checking', 'Hi-sticking', 'Slashing',
+              'Delaying Game - Puck over glass', 'Delay of game',
+              'Delaying the game', 'Embellishment',
+              'Closing hand on puck', 'Interference - Goalkeeper',
+              'Too many men on the ice', 'Unsportsmanlike conduct']
+    double = ['Hi stick - double minor', 'Cross check - double minor',
+              'Spearing']
+    majors = ['Fighting', 'Kicking', 'Slew-footing',
+              'Butt-ending', 'Match penalty']
+    miscon = ['Instigator - Misconduct', 'Misconduct', 'Game misconduct']
+    
+    # Collect the necessary columns as arrays
+    n        = plays.shape[0]
+    event    = plays['event_type'].to_numpy()
+    team_for = plays['team_for'].to_numpy()
+    pen_type = plays['event_secondary_type'].to_numpy()
+    player_1 = plays['player_1'].to_numpy()
+    time_s   = plays['elapsed_s'].to_numpy()
+    minute   = plays['Minute'].to_numpy()
+    second   = plays['Second'].to_numpy()
+    
+    # Storage arrays for the markers at each interval boundary.
+    # The men on ice array has an extra row so an interval can be closed after the last row.
+    moi = {Home: np.zeros(n + 1, dtype=np.int64), Away: np.zeros(n + 1, dtype=np.int64)}
+    pps = {Home: np.zeros(n, dtype=np.int64), Away: np.zeros(n, dtype=np.int64)}
+    pim = {Home: np.zeros(n, dtype=np.int64), Away: np.zeros(n, dtype=np.int64)}
+    ppg = {Home: np.zeros(n, dtype=np.int64), Away: np.zeros(n, dtype=np.int64)}
+    shg = {Home: np.zeros(n, dtype=np.int64), Away: np.zeros(n, dtype=np.int64)}
+    is_ppg = {Home: np.zeros(n, dtype=bool), Away: np.zeros(n, dtype=bool)}
+    is_shg = {Home: np.zeros(n, dtype=bool), Away: np.zeros(n, dtype=bool)}
+    
+    # The rows where each team scored a goal
+    goal_rows = {
+        team: np.flatnonzero((event == 'GOAL') & (team_for == team)) for team in [Home, Away]
+    }
+    
+    pen_Home, pen_Away, intervals = [], [], []
+    for i in np.flatnonzero(event == 'PENALTY'):
+        # Define refernces for short-handed team and power play team
+        team = team_for[i]
+        if team == Home:
+            shTeam, ppTeam = Home, Away
+        else:
+            shTeam, ppTeam = Away, Home
+        
+        # Check if the penalty qualifies as a dobule minor or a major
+        PenType = pen_type[i]
+        p_min = 4 if PenType in double else 2
+        p_min = 5 if PenType in majors else p_min
+        
+        # Misconducts count towards the teams PIM, but don't reduce MOI
+        if PenType in miscon:
+            pim[shTeam][i] += 10
+            continue
+        
+        # A minor followed by a misconduct for the same player is treated as a major
+        if (player_1[i] == player_1[i + 1]) & (pen_type[i + 1] in miscon) & (p_min != 5):
+            p_min = 5
+        
+        # Record one power play for the pp team and the PIM for the penalized team
+        pps[ppTeam][i] += 1
+        pim[shTeam][i] += p_min
+        
+        # Define the starting and ending game time (in seconds) for the penalty.
+        # Penalties that carry over into (or are called in) OT simply run on the game clock.
+        start = int(time_s[i])
+        end   = start + 60 * p_min
+        
+        # The last row of the plays df that falls within the penalty
+        last = max(int(np.searchsorted(time_s, end, side='right')) - 1, i)
+        
+        # Check for a PP goal (that has not already ended a penalty) within the penalty
+        rows = goal_rows[ppTeam]
+        rows = rows[(rows > i) & (rows <= last)]
+        rows = rows[~is_ppg[ppTeam][rows]]
+        pp_goal = rows.size > 0
+        stop = rows[0] if pp_goal else last
+        
+        # Record any SH goals scored before the penalty ended. The short handed
+        # team is recorded as one more man down on the row of the goal.
+        rows = goal_rows[shTeam]
+        rows = rows[(rows > i) & (rows <= stop)]
+        rows = rows[~is_shg[shTeam][rows]]
+        shg[shTeam][rows] += 1
+        is_shg[shTeam][rows] = True
+        moi[shTeam][rows] -= 1
+        moi[shTeam][rows + 1] += 1
+        
+        # Take one man away from the short handed team for the length of the penalty
+        moi[shTeam][i] -= 1
+        moi[shTeam][stop + 1] += 1
+        
+        if pp_goal:
+            # PP team scores. Record PPG & end the penalty at the time of the goal.
+            # (In OT, the penalty and game end)
+            ppg[ppTeam][stop] += 1
+            is_ppg[ppTeam][stop] = True
+            end = int(time_s[stop])
+        
+        elif (last == n - 1) & (last > i):
+            # End of plays df has been reached. Happens when penalty is currently
+            # happening, or game ends with time left on penalty.
+            # The hour of the last row is kept, with its minute and second capped at 59.
+            end = 3600 * (int(time_s[n - 1]) // 3600) + \
+                  60 * min(int(minute[n - 1]), 59) + min(int(second[n - 1]), 59)
+        
+        intervals.append([team, p_min, start, end, i, stop, pp_goal])
+        
+        # Append penalty data for relevant team
+        # Adjust start/end time to round seconds to nearest 5 second interval
+        # This is necessary so plotly doesn't get confused :/...
+        # Not the ideal solution, but one that works.
+        start = game_time(start - start % 60 + min(5 * round(start % 60 / 5), 55))
+        end   = game_time(end - end % 60 + min(5 * round(end % 60 / 5), 55))
+        pen_Home.append((start, end)) if team == Home else \
+            pen_Away.append((start, end))
+    
+    # Each team starts with 5 men on ice, 0 PPG, 0 SHG, & 0 Penalties.
+    # Build the final columns from the cummulative sums of the markers.
+    cols = dict()
+    for stat in ['Men On Ice', 'PPG', 'SHG', 'is_ppg', 'is_shg', 'Power Plays', 'PIM']:
+        for team in [Home, Away]:
+            if stat == 'Men On Ice':
+                cols[f'{team} {stat}'] = 5 + moi[team].cumsum()[:n]
+            elif stat == 'PPG':
+                cols[f'{team} {stat}'] = ppg[team].cumsum()
+            elif stat == 'SHG':
+                cols[f'{team} {stat}'] = shg[team].cumsum()
+            elif stat == 'is_ppg':
+                cols[f'{team} {stat}'] = is_ppg[team]
+            elif stat == 'is_shg':
+                cols[f'{team} {stat}'] = is_shg[team]
+            elif stat == 'Power Plays':
+                cols[f'{team} {stat}'] = pps[team].cumsum()
+            else:
+                cols[f'{team} {stat}'] = pim[team].cumsum()
+    
+    intervals = pd.DataFrame(
+        intervals,
+        columns=['team', 'pim', 'start', 'end', 'start_row', 'end_row', 'pp_goal']
+    )
+    
+    return cols, pen_Home, pen_Away, intervals
+
+def XYEvents(shots, plays, Home, Away, direct_of_attack):
+    """
+    Collect the X/Y data for every event plotted in the rink scatters into one table.
+    
+    The coordinates are normalized in one pass so the away team attacks to the left
+    (negative x values) and the home team attacks to the right (positive x values).
+    Each event is labeled by category:
+        
+        G  - Goals
+        S  - Shots
+        SA - Shot attempts (missed + blocked shots)
+        H  - Hits
+        T  - Takeaways
+        GA - Giveaways
+        FO - Faceoff wins
+    
+    Parameters
+    ----------
+    shots : pd.DataFrame
+        The shots df provided by the nhlstats module.
+    plays : pd.DataFrame
+        The plays df provided by the nhlstats module (before `ModifyDFs`).
+    Home : str
+        The home team abbreviation.
+    Away : str
+        The away team abbreviation.
+    direct_of_attack : bool
+        If True, the coordinates are flipped for the arena the game is played in.
+    
+    Returns
+    -------
+    xy : pd.DataFrame
+        One row per event with the event's `category`, its `number` within the team's
+        events of that category (starting at 1), and the `MarkerStyle` used in the rink
+        scatters (goals, shots, and shot attempts only). The index is the row of the event
+        in the shots or plays df.
+    
+    """
+    # Define the list of columns to collect
+    cols = ['event_type', 'team_for', 'x', 'y', 'period',
+            'player_1', 'player_2', 'player_3', 'player_4', 'period_time']
+    
+    # Label the events of each df with their category
+    categories = [
+        (shots, {'GOAL': 'G', 'SHOT': 'S', 'MISSED_SHOT': 'SA', 'BLOCKED_SHOT': 'SA'}),
+        (plays, {'HIT': 'H', 'TAKEAWAY': 'T', 'GIVEAWAY': 'GA', 'FACEOFF': 'FO'})
+    ]
+    dfs = []
+    for df, labels in categories:
+        # Drop any of the above columns from the list if they do not appear in the JSON file
+        df = df[[c for c in cols if c in df.columns]]
+        df = df[df.event_type.isin(list(labels)) & df.team_for.isin([Home, Away])]
+        dfs.append(df.assign(category = df.event_type.map(labels)))
+    xy = pd.concat(dfs)
+    
+    # Odd logic problem where adjustments for direction of attack is not
+    # consistent across all arenas. Introduced the direct_of_attack variable
+    # in the __init__ method to solve this issue.
+    # Flip the game stat locations for even-numbered periods (P2, OT1, OT3, etc.)
+    flip = np.where(xy.period.to_numpy() % 2 == 0, -1, 1)
+    flip = -flip if direct_of_attack else flip
+    
+    # TODO - Make necessary adjustments to the comments below
+    # Transpoe the blocked shot data by 180 degrees since the data provided by the NHL
+    # records the blocked shot data for the team that had the puck hit their player.
+    flip = np.where(xy.event_type.to_numpy() == 'BLOCKED_SHOT', -flip, flip)
+    xy['x'] = xy.x * flip
+    xy['y'] = xy.y * flip
+    
+    # Number each team's events by category and assign the relevant marker styles
+    # to use in the Rink Scatters (goals are marked with the goal number)
+    xy['number'] = xy.groupby(['team_for', 'category']).cumcount() + 1
+    styles = {'S': 'circle', 'SA': 'x'}
+    xy['MarkerStyle'] = xy.category.map(styles).where(
+        xy.category != 'G', xy.number.astype(str)
+    )
+    
+    return xy
+
+class XYView:
+    """
+    Lazy view of one team's events of one category in `GameStats.XY` (e.g. `HomeG`).
+    
+    The view is only created when the attribute is accessed.
+    
+    """
+    
+    def __init__(self, side, category):
+        self.side     = side
+        self.category = category
+    
+    def __get__(self, gs, owner=None):
+        if gs is None:
+            return self
+        return gs.XY_View(self.side, self.category)
+
+def game_time(seconds):
+    """
+    Convert game seconds elapsed into a `dt.time` (e.g. 3725 -> 01:02:05).
+    
+    Only used to label the game clock for display, everything else works in seconds.
+    
+    """
+    seconds = int(seconds)
+    return dt.time(seconds // 3600, (seconds % 3600) // 60, seconds % 60)
+
+class GameClock:
+    """
+    The 5 second interval index for an entire game.
+    
+    The index is stored as a read-only array of the game seconds elapsed. The `dt.time`
+    version of the index (used to expand the plays df and for the plotly x-axes) is only
+    created the first time it is needed.
+    
+    """
+    
+    def __init__(self, ot_minutes=0):
+        self.ot_minutes = ot_minutes
+        
+        # 60 minutes of regulation plus any OT, in 5 second intervals
+        seconds = np.arange(0, (60 + ot_minutes) * 60, 5, dtype=np.int32)
+        seconds.flags.writeable = False
+        self.seconds = seconds
+        self._times  = None
+    
+    @property
+    def times(self):
+        """The index as a tuple of `dt.time` objects."""
+        if self._times is None:
+            self._times = tuple(game_time(s) for s in self.seconds.tolist())
+        return self._times
+
+@lru_cache(maxsize=None)
+def game_clock(ot_minutes=0):
+    """
+    Return the shared `GameClock` for a game with the given length of OT.
+    
+    Parameters
+    ----------
+    ot_minutes : int, optional
+        0 for a game decided in regulation, 5 for regular season OT, or 20 per OT period
+        played in the playoffs. The default is 0.
+    
+    Returns
+    -------
+    GameClock
+        The 5 second interval index, built once per process for each length of OT.
+    
+    """
+    return GameClock(ot_minutes)
+
+def OT_Minutes(periods, game_type):
+    """
+    Determine the minutes of OT that need to be included in the game clock.
+    
+    Parameters
+    ----------
+    periods : array-like
+        The periods recorded in the plays df.
+    game_type : str
+        The 2 digit game type from the game id ('01', '02', or '03').
+    
+    Returns
+    -------
+    int
+        The minutes of OT to include in the game clock.
+    
+    """
+    periods = [int(p) for p in pd.Series(periods).dropna().unique()]
+    if 4 not in periods:
+        return 0
+    
+    # Regular season OT is 5 minutes (a shootout is recorded as period 5).
+    # Playoff OT periods are full 20 minute periods.
+    if game_type == '03':
+        return 20 * (max(periods) - 3)
+    
+    return 5
 
 class GameStats:
     """
     Collect, clean, and summarize all stats for an individual NHL game.
     
+    Parameters
+    ----------
+    game_id : int
+        The NHL game id.
+    gr : GameRecap, optional
+        The `GameRecap` calling this class (if any). The default is None.
+    timings : Timings or bool, optional
+        Record the wall time, CPU time, peak memory, and rows of each stage of `All` and each
+        call to the NHL API in `gs.timings` (see `Timings`). Pass True to record them for this
+        game only, or a `Timings` object to share across games. The default is None (off).
+    
     Returns
     -------
     None.
     
     """
     
-    def __init__(self, game_id, gr=None):
+    # The version of each stage of `All`. Increment a stage's version whenever the output it
+    # creates changes, so that the saved output of the stage (and of every stage after it)
+    # is recomputed instead of being loaded from the game's artifact (see `StageKeys`).
+    STAGES = dict(
+        ModifyDFs     = 1,
+        AggregateData = 1,
+        Prior5Stats   = 1,
+        MenOnIce      = 1,
+        GoalsDF       = 1,
+        SumDF         = 1,
+        XY_GSA_HTG    = 1
+    )
+    
+    # The stages that modify the `plays` df in place
+    MODIFIES_PLAYS = ['ModifyDFs', 'AggregateData', 'MenOnIce']
+    
+    # Views of the X/Y data used in the Rink Scatters, created from `XY` when accessed
+    HomeG,  HomeS,  HomeSA = XYView('Home', 'G'), XYView('Home', 'S'), XYView('Home', 'SA')
+    AwayG,  AwayS,  AwaySA = XYView('Away', 'G'), XYView('Away', 'S'), XYView('Away', 'SA')
+    HomeH,  HomeT,  HomeGA = XYView('Home', 'H'), XYView('Home', 'T'), XYView('Home', 'GA')
+    AwayH,  AwayT,  AwayGA = XYView('Away', 'H'), XYView('Away', 'T'), XYView('Away', 'GA')
+    HomeFO, AwayFO         = XYView('Home', 'FO'), XYView('Away', 'FO')
+    
+    def __init__(self, game_id, gr=None, timings=None):
         # Store game id as a class attribute
         self.game_id   = game_id
         self.gr        = gr
+        
+        # Set up the (opt-in) timing records
+        if timings is True:
+            timings = Timings()
+        self.timings   = timings if timings else Timings(enabled=False)
         season         = str(game_id)[:4]
         self.season    = season
         game_type      = str(game_id)[4:6]
         self.game_type = game_type
         
-        # Check if the directory exists for plays, shots, and shifts
-        data_dir = os.path.join(os.getcwd(), 'Data', season, str(game_id))
-        data_svd = os.path.isdir(data_dir)
-        self.data_svd = data_svd
-        self.data_dir = data_dir
+        # Collect the plays/shift JSON files provided by the nhlstats
+        # module. The raw feeds are saved in the game's data directory, and read back
+        # in (instead of calling the NHL API) once the game is final.
+        data_dir = GameDir(game_id)
+        call = self.timings.call
+        with self.timings.stage('LoadFeeds', game_id) as rec:
+            feeds, data_svd = LoadFeeds(game_id, data_dir, call=call)
+            rec['rows'] = len(feeds['plays'])
+        self.data_svd  = data_svd
+        self.data_dir  = data_dir
+        self.feed_hash = (ReadMeta(data_dir) or dict()).get('hash')
         if data_svd:
-            
-            # If it does exist, read the raw data in and assign relative class attributes
             print('Data already saved locally')
-            
-        else:
-            os.mkdir(data_dir)
         
-        # Collect the plays/shots/shift JSON files provided by the nhlstats
-        # module. Simultaneously convert JSON's into a pandas dataframe.
-        self.plays = pd.DataFrame(list_plays(game_id))
-        self.shots = pd.DataFrame(list_shots(game_id))
-        self.shift = pd.DataFrame(list_shifts(game_id))
+        # Simultaneously convert JSON's into a pandas dataframe.
+        self.plays = pd.DataFrame(feeds['plays'])
+        self.shift = pd.DataFrame(feeds['shifts'])
         
-        # Create copies of the above dataframes that will be manipulated and used
-        # for the X/Y positional data used in the RinkScatter plots.
+        # The shots are the subset of the plays that `list_shots` would return
+        # (shots, missed/blocked shots, and goals), so there is no need to collect them again.
+        event = self.plays.event_type
+        shots = event.str.contains('SHOT', na=False) | (event == 'GOAL')
+        self.shots = self.plays[shots.to_numpy()].reset_index(drop=True)
+        
+        # Create copies of the above dataframes that will be used for the X/Y positional
+        # data used in the RinkScatter plots. Only the plays df is modified in place
+        # (in `ModifyDFs`), so the shots and shifts df's can be shared.
         self.plays_xy = self.plays.copy()
-        self.shots_xy = self.shots.copy()
-        self.shift_xy = self.shift.copy()
+        self.shots_xy = self.shots
+        self.shift_xy = self.shift
         
         if gr is None:
             # If GameStats was called outside of GameRecap, define the necessary attributes
             # Collect the gameday info, which forever reason is usually wrong...
             gameDay  = pd.to_datetime(self.plays['datetime']).iloc[0].date()
-            allGames = pd.DataFrame(
-                list_games(
-                    str(dt.date(gameDay.year - 1, 10, 12)),
-                    str(gameDay)
-                )
-            )
+            with self.timings.stage('GetSchedule', game_id) as rec:
+                allGames = GetSchedule(season).Games(end_date=gameDay)
+                rec['rows'] = allGames.shape[0]
             
             # Subset out the desired type of game (i.e. preseason, regular, playoffs)
             allGames = allGames[allGames.game_id.astype('str').str.slice(4, 6) == game_type]
@@ -136,13 +657,12 @@ class GameStats:
             self.Home  = self.Teams.home_team.iloc[0]
             self.Away  = self.Teams.away_team.iloc[0]
             
-            # Collect team info provided in teamList.csv file in my github repo.
-            tLUrl = 'https://raw.githubusercontent.com/AmeriFinn/LiveNHLstats/master/teamList.csv'
-            tL = pd.read_csv(tLUrl)
+            # Collect team info provided in the teamList.csv file.
+            Teams = GetTeams()
             
             # Collect team abbreviations recognized by the NHL
-            self.HomeAbrv = tL[tL.team_name == self.Home].team_abbrv.max()
-            self.AwayAbrv = tL[tL.team_name == self.Away].team_abbrv.max()
+            self.HomeAbrv = Teams.Abbrv(self.Home)
+            self.AwayAbrv = Teams.Abbrv(self.Away)
             
             # Determine if this teams arena records x/y stat data the "normal"
             # way, or backwards. Note: Some arenas are less consistent about x/y
@@ -150,8 +670,7 @@ class GameStats:
             # recorded properly by period) or between games (where the home team
             # will have 1st period stats recorded on opposite ends of the rink).
             # This is the best solution I have currently.
-            self.direct_of_attack = \
-                tL[tL.team_abbrv == self.HomeAbrv].normal_direct_of_play.max()
+            self.direct_of_attack = Teams.DirectOfPlay(self.HomeAbrv)
         else:
             # If GameStats was called from GameRecap, inherit the necessary attributes
             self.GameDay          = gr.GameDay
@@ -170,61 +689,36 @@ class GameStats:
         None.
         
         """
-        # Add columns to plays DF for time elapsed.
-        # Relevant for adding line markers for goals in plots.
-        self.plays['Time']   = pd.to_datetime(
-            self.plays.period_time, format="%M:%S"
-        )
+        # Add a column to plays DF for the game seconds elapsed. This is the key used
+        # for sorting, windowing, and the penalty intervals throughout the pipeline.
+        period = self.plays.period.to_numpy(dtype=np.int32)
+        clock  = self.plays.period_time.str.split(':', expand=True).astype(np.int32)
+        minute, second = clock[0].to_numpy(), clock[1].to_numpy()
+        self.plays['elapsed_s'] = (1200 * (period - 1) + 60 * minute + second).astype(np.int32)
+        
         # Then separate out the Hour, Minute, and Second for each play
-        self.plays['Hour']   = self.plays['Time'].dt.hour
-        self.plays['Minute'] = self.plays['Time'].dt.minute
-        self.plays['Second'] = self.plays['Time'].dt.second
-        
-        # Change Time column to the game time elapsed
-        for i in range(2, self.plays.period.unique().max() + 1):
-            self.plays.loc[self.plays.period == i, 'Time'] = \
-                self.plays[self.plays.period == i].Time + \
-                dt.timedelta(minutes= 20 * (i - 1))
-            
-            self.plays.loc[self.plays.period == i, 'Minute'] = \
-                self.plays[self.plays.period == i].Minute + (20 * (i - 1))
-            
-            if i >= 4:
-                self.plays.loc[self.plays.period == i, 'Hour'] = \
-                    self.plays[self.plays.period == i].Hour + (floor((i - 3) / 3))
-        
-        # Create a time index that with intervals of 5 seconds for entire game
-        secns = [int(s) for s in range(0, 60, 5)] * 60
-        mints = [floor(len(secns[:s]) / 12) for s in range(len(secns))]
-        hours = [int(0) for m in mints]
-        
-        # Determine if the index needs to be adjusted for OT
-        ## Additional adjustments will need to be made for playoff OT
-        if 4 in self.plays.period.unique():
-            OTsec = [int(s) for s in range(0, 60, 5)] * 5
-            secns += OTsec
-            mints += [floor(len(OTsec[:s]) / 12) for s in range(len(OTsec))]
-            hours += [int(1) for s in OTsec]
-        
-        index = [dt.time(h, m, s) for h, m, s in zip(hours, mints, secns)]
-        s     = pd.Series(index, name='Time')
-        
-        # Clean Time column format
-        self.plays.Time = pd.Series(
-            [dt.time(d.hour, d.minute, d.second) for d in self.plays.Time]
-        )
+        self.plays['Hour']   = np.where(period >= 4, (period - 3) // 3, 0)
+        self.plays['Minute'] = minute + 20 * (period - 1)
+        self.plays['Second'] = second
+        
+        # Collect the time index with intervals of 5 seconds for entire game.
+        # The index is adjusted for regular season or playoff OT as needed.
+        self.clock = game_clock(OT_Minutes(self.plays.period, self.game_type))
+        s = pd.DataFrame({'elapsed_s': self.clock.seconds})
         
         # Add in player_4 column in case the JSON file does not contain one
         if 'player_4' not in self.plays.columns:
             self.plays.loc[:, 'player_4'] = ''
             
         # Merge the new index with the plays, shots, and shifts df's
-        # (This expands the dataframe to allow for prettier P5 charts)
-        self.plays = pd.concat(
-            [self.plays, pd.DataFrame(s)],
-            ignore_index=True, join='outer', keys='Time'
-        )
-        self.plays.sort_values(by='Time', inplace=True, ascending=True)
+        # (This expands the dataframe to allow for prettier P5 charts).
+        # The sort is stable, so events keep the order of the feed and fall
+        # ahead of the 5 second index row at the same game time.
+        self.plays = pd.concat([self.plays, s], ignore_index=True, join='outer')
+        self.plays.sort_values(by='elapsed_s', inplace=True, kind='stable')
+        
+        # Label the game time elapsed for display (used for the plot x-axes)
+        self.plays['Time'] = [game_time(t) for t in self.plays.elapsed_s.tolist()]
         self.plays['datetime'] = pd.to_datetime(self.plays['datetime'])
         
     def AggregateData(self):
@@ -236,125 +730,14 @@ class GameStats:
         None.
         
         """
-        def oppo_ident(team: str, Both: list) -> int:
-            """
-            Determines the index of the opposing team name in the list of both team acronyms.
-            i.e. if team == 'COL' and Both == ['LAK', 'COL'], this returns 0. If team == 'LAK',
-            then the function returns 1.
-            This function ONLY works as intended when `Both` is exactly of length 2.
-            
-            Parameters
-            ----------
-            team : str
-                The team that an event was recorded for.
-            Both : list
-                The 2-item list containing the Home and Away team abbreviations.
-                
-            Returns
-            -------
-            int
-                The list index of the opposition team (always 0 or 1).
-                
-            """
-            if len(Both) != 2:
-                print(f"{Both} is not a list of length 2!")
-                return 0
-            
-            for i, item in enumerate(Both):
-                if item != team:
-                    return i
-            
-            return 0
-        
         Away, Home, plays = self.AwayAbrv, self.HomeAbrv, self.plays
-        Both = [Away, Home]
-        
-        # Define new columns for goals, shots, hits, attempts, etc.
-        ## Away: Even index numbs, Home: Odd index numbs
-        newC = [
-            Away + " Goals", Home + " Goals",
-            Away + " Shots", Home + " Shots",
-            Away + " Hits", Home + " Hits",
-            Away + " Shot Attempts", Home + " Shot Attempts",
-            Away + " Blocked Shots", Home + " Blocked Shots",
-            Away + " Missed Shots", Home + " Missed Shots",
-            Away + " Takeaways", Home + " Takeaways",
-            Away + " Giveaways", Home + " Giveaways",
-            Away + " Faceoff Wins", Home + " Faceoff Wins",
-            Away + " House Shots", Home + " House Shots",
-            Away + " House Attempts", Home + " House Attempts"
-        ]
-        
-        # Create empty columns in plays DF for game stats
-        for S in newC:
-            plays[S] = 0
         
-        # Loop through each row of the plays DF to aggregate event types
+        # Tally every event type for both teams in one vectorized pass, then
+        # append the rolling totals to the plays df
         plays.reset_index(inplace=True, drop=True)
-        for i in plays.index:
-            
-            # Collect relevant items for each iteration
-            event = self.plays.loc[i, 'event_type']
-            team  = self.plays.loc[i, "team_for"]
-            x, y = plays.loc[i, ['x', 'y']]
-            
-            # Record event types for the appropiate team.
-            # There may be multiple event types in each row.
-            ###################### Goals
-            if event == 'GOAL':
-                plays.loc[i, team + ' Goals'] = 1
-                if InHouse(x, y):
-                    plays.loc[i, [team + ' House Shots']] = 1
-            
-            ###################### Shots on Net
-            if event in ['SHOT', 'GOAL']:
-                plays.loc[i, team + ' Shots'] = 1
-                if InHouse(x, y):
-                    plays.loc[i, [team + ' House Shots']] = 1
-            
-            ###################### Shot Attempts
-            if event in ['MISSED_SHOT', 'SHOT', 'GOAL']:
-                plays.loc[i, team + ' Shot Attempts'] = 1
-                if InHouse(x, y):
-                    plays.loc[i, [team + ' House Attempts']] = 1
-            
-            ###################### Blocked Shots
-            # Record the blocked shot for the blocking team,
-            # and the shot attempt for the shooting team
-            if event == 'BLOCKED_SHOT':
-                oppo = Both[oppo_ident(team, Both)]
-                
-                # Record block for team that blocked the shot (is `team`)
-                plays.loc[i, team + ' Blocked Shots'] = 1
-                # Record shot attempt for team that had the shot blocked (is `oppo`)
-                plays.loc[i, oppo + ' Shot Attempts'] = 1
-                if InHouse(x, y):
-                    plays.loc[i, [oppo + ' House Attempts']] = 1
-                
-                
-            ###################### Missed Shots
-            if event == 'MISSED_SHOT':
-                plays.loc[i, team + ' Missed Shots'] = 1
-            
-            ###################### Hits
-            if event == 'HIT':
-                plays.loc[i, team + ' Hits'] = 1
-            
-            ###################### Takeaways
-            if event == 'TAKEAWAY':
-                plays.loc[i, team + ' Takeaways'] = 1
-            
-            ###################### Giveaways
-            if event == 'GIVEAWAY':
-                plays.loc[i, team + ' Giveaways'] = 1
-                
-            ###################### Faceoff Wins
-            if event == 'FACEOFF':
-                plays.loc[i, team + ' Faceoff Wins'] = 1
-            
-        # Calculate the cummulative sum over the course of the game for each
-        # of the new stat columns.
-        plays[newC] = plays[newC].cumsum(axis = 0)
+        tally = TallyEvents(plays, Home, Away)
+        for S in tally.columns:
+            plays[S] = tally[S]
         
         # Calculate the Shot Differential
         plays['Shot Differential'] = \
@@ -362,105 +745,165 @@ class GameStats:
         
         self.plays = plays
         
-    def prior_5(plays, Home, Away, col='Shots'):
+    def prior_5(plays, Home, Away, col='Shots', clock=None):
         """
         Calculate rolling stats over a 5 minute window for the entire game.
         
+        The stats over each of the prior 1, 2, ..., 5 minutes are calculated by shifting the
+        rolling totals back by 12 rows (12 x 5 second intervals) at a time, so every stat is
+        handled with a handful of array operations rather than cell by cell.
+        
         Parameters
         ----------
-        plays : TYPE
-            DESCRIPTION.
-        Home : TYPE
-            DESCRIPTION.
-        Away : TYPE
-            DESCRIPTION.
-        col : TYPE, optional
-            DESCRIPTION. The default is 'Shots'.
+        plays : pd.DataFrame
+            The plays df with the rolling totals created in `AggregateData`.
+        Home : str
+            The home team abbreviation.
+        Away : str
+            The away team abbreviation.
+        col : str or list, optional
+            The stat to calculate the prior 5 minute data for. A list of stats can also be
+            provided to calculate all of them in one call. The default is 'Shots'.
+        clock : GameClock, optional
+            The game clock for the game. If None, the clock is determined from the periods
+            in the plays df (assuming regular season OT). The default is None.
         
         Returns
         -------
-        None.
+        pd.DataFrame or dict
+            The prior 5 minute df for the stat. If a list of stats was provided, a dictionary
+            of prior 5 minute df's keyed by stat is returned instead.
         
         """
-        # Create the 5-second interval index for each stat
-        secns = [int(s) for s in range(0, 60, 5)] * 60
-        mints = [floor(len(secns[:s]) / 12) for s in range(len(secns))]
-        hours = [int(0) for m in mints]
-        
-        # Make adjustments for OT if needed
-        if 4 in plays.period.unique():
+        # Collect the 5-second interval index for each stat
+        if clock is None:
+            clock = game_clock(5 if 4 in plays.period.unique() else 0)
+        
+        # Include the end of regulation in the index if the game did not go to OT
+        last = clock.seconds[-1] + (5 if clock.ot_minutes == 0 else 0)
+        
+        # Collect the rows of the plays df that fall on the 5 second interval index
+        elapsed = plays.elapsed_s.to_numpy()
+        rows = (elapsed % 5 == 0) & (elapsed <= last)
+        pos  = np.arange(rows.sum())
+        
+        def lag(values, k):
+            # The value k rows prior to each row (the first row for the first k rows)
+            return values[np.maximum(pos - k, 0)]
+        
+        stats = [col] if isinstance(col, str) else list(col)
+        dfs   = dict()
+        for stat in stats:
+            prior_5 = plays.loc[rows, [f'{Home} {stat}', f'{Away} {stat}', 'Time']].copy()
+            prior_5.reset_index(inplace=True, drop=True)
             
-            OTsec = [int(s) for s in range(0, 60, 5)] * 5
-            secns += OTsec
-            mints += [floor(len(OTsec[:s]) / 12) for s in range(len(OTsec) + 1)]
-            hours += [int(1) for s in OTsec]
+            new_cols = dict()
+            for team in [Home, Away]:
+                totals = prior_5[f'{team} {stat}'].to_numpy()
+                
+                # Weight the events across the prior 1, 2, ... , 5 minutes and sum them
+                weighted = [
+                    (lag(totals, 12 * j) - lag(totals, 12 * (j + 1))) * ((5 - j) / 5)
+                    for j in range(5)
+                ]
+                time_sum = weighted[0]
+                for w in weighted[1:]:
+                    time_sum = time_sum + w
+                
+                # Sum the stats over the prior 5 minutes to use in the P5 plots.
+                # Within the first 5 minutes of play, this is simply the rolling total.
+                new_cols[f'{team} {stat} - Prior 5 min'] = \
+                    np.where(pos <= 60, totals, totals - lag(totals, 60))
+                new_cols[f'{team} {stat} - Time Sum Weighted'] = time_sum
             
-            # Create the full list
-            prior_5 = [dt.time(h, m, s) for h, m, s in zip(hours, mints, secns)]
-        else:
-            prior_5 = [dt.time(h, m, s) for h, m, s in zip(hours, mints, secns)]
-            prior_5.append(dt.time(1, 0, 0))
+            # Order the new columns as: Prior 5 min (Home, Away), Time Sum Weighted (Home, Away)
+            for c in ['Prior 5 min', 'Time Sum Weighted']:
+                for team in [Home, Away]:
+                    prior_5[f'{team} {stat} - {c}'] = new_cols[f'{team} {stat} - {c}']
+            
+            dfs[stat] = prior_5
         
-        prior_5 = plays[(plays.Time.isin(prior_5))][
-            [f'{Home} {col}', f'{Away} {col}', 'Time']
-        ]
+        return dfs[col] if isinstance(col, str) else dfs
         
-        # Create empty columns for the stat over the past 1, 2, 3, 4, and 5 minutes
-        for i in range(1, 6):
-            prior_5.loc[:, f"{Home} {col} - Prior {i} min"] = 0
-            prior_5.loc[:, f"{Away} {col} - Prior {i} min"] = 0
+    def momentum(P5, Home, Away, w_goal=5, w_shot=3, w_hit=2, w_attmpt=1):
+        """
+        Calculate each team's momentum from the time weighted prior 5 minute stats.
         
-        # Loop through plays to to populate prior_{n}_minutes
-        for i in range(prior_5.shape[0]):
-            # for m, n in zip([3, 5], [0, 1]):
-            for j in range(5):
-                
-                # Calculate prior j min stats - Home
-                prior_5.iloc[i, 3 + (2 * j)] = \
-                    (prior_5.iloc[max(0, i - (12 * j)), 0] - \
-                     prior_5.iloc[max(0, i - (12 * (j + 1))), 0]) * ((5 - j) / 5)
-                
-                # Calculate prior j min stats - Home
-                prior_5.iloc[i, 4 + (2 * j)] = \
-                    (prior_5.iloc[max(0, i - (12 * j)), 1] - \
-                     prior_5.iloc[max(0, i - (12 * (j + 1))), 1]) * ((5 - j) / 5)
-                
-        # Sum the weighted events across prior 1, 2, ... , 5 minutes
-        prior_5.loc[:, f"{Home} {col} - Time Sum Weighted"] = \
-            prior_5.loc[:, [f"{Home} {col} - Prior {i} min" for i in range(1, 6)]].sum(axis = 1)
+        A team's momentum is the weighted sum of its time weighted goals, shots, shot attempts,
+        and hits, calculated for both teams at once as the product of the weights and a
+        (team x stat x time) array. The 1 and 5 minute moving averages of momentum and the net
+        momentum (Home 5Min MA - Away 5Min MA) are calculated in the same pass.
         
-        prior_5.loc[:, f"{Away} {col} - Time Sum Weighted"] = \
-            prior_5.loc[:, [f"{Away} {col} - Prior {i} min" for i in range(1, 6)]].sum(axis = 1)
+        Parameters
+        ----------
+        P5 : dict
+            The prior 5 minute df's created by `prior_5`, keyed by stat. Must include the
+            'Goals', 'Shots', 'Shot Attempts', and 'Hits' df's.
+        Home : str
+            The home team abbreviation.
+        Away : str
+            The away team abbreviation.
+        w_goal : float, optional
+            The weight of a goal. The default is 5.
+        w_shot : float, optional
+            The weight of a shot. The default is 3.
+        w_hit : float, optional
+            The weight of a hit. The default is 2.
+        w_attmpt : float, optional
+            The weight of a shot attempt. The default is 1.
         
-        # Sum the stats over the prior 1, 2, ... , 5 minutes to use in the P5 plots
-        prior_5.reset_index(inplace = True, drop = True)
-        for i in prior_5.index:
-            for team in [Home, Away]:
-                
-                # Still within first 5 minutes of play
-                if i <= 60:
-                    prior_5.loc[i, f'{team} {col} - Prior 5 min'] = prior_5.loc[i, f'{team} {col}']
-                    
-                # Outside of first 5 minutes of play. Can calculate stats as usual
-                else:
-                    prior_5.loc[i, f'{team} {col} - Prior 5 min'] = \
-                        prior_5.loc[i, f'{team} {col}'] - prior_5.loc[i - 60, f'{team} {col}']
-                    
-        # for team in [Home, Away]:
-        #     prior_5.loc[:, f"{team} {col} - Prior 5 min"] = \
-        #         prior_5.loc[:, f"{team} {col} - Prior 5 min"] + \
-        #         (prior_5.loc[:, f"{team} {col} - Prior 4 min"] / 0.8) + \
-        #         (prior_5.loc[:, f"{team} {col} - Prior 3 min"] / 0.6) + \
-        #         (prior_5.loc[:, f"{team} {col} - Prior 2 min"] / 0.4) + \
-        #         (prior_5.loc[:, f"{team} {col} - Prior 1 min"] / 0.2)
-        
-        # prior_5.loc[:, f"{Away} {col} - Prior 5 min"] = \
-        #     prior_5.loc[:, [f"{Away} {col} - Prior {j} min" for j in range(1, 6)]].sum(axis = 1)
-        
-        # Drop unnecessary columns
-        prior_5.drop([c for c in prior_5.columns if ('min' in c) and ('5' not in c)], axis = 1, inplace = True)
-        
-        return prior_5
+        Returns
+        -------
+        momentum : pd.DataFrame
+            The prior 5 minute stats used, each team's momentum, the moving averages, and the
+            net momentum, indexed by the game `Time`. The away team's moving averages are
+            negated so they plot below the x-axis.
+        
+        """
+        stats   = ['Goals', 'Shots', 'Shot Attempts', 'Hits']
+        weights = np.array([w_goal, w_shot, w_hit, w_attmpt], dtype=float)
+        
+        # Keep the prior 5 minute columns of each stat with one row per game time
+        times = P5[stats[0]].Time
+        rows  = ~times.duplicated().to_numpy()
+        momentum = pd.DataFrame(
+            {
+                f'{team} {stat} - {c}': P5[stat][f'{team} {stat} - {c}'].to_numpy()[rows]
+                for stat in stats
+                for c in ['Prior 5 min', 'Time Sum Weighted']
+                for team in [Home, Away]
+            },
+            index = pd.Index(times[rows], name='Time')
+        )
+        
+        # Weight the time weighted stats of both teams with one matrix-vector product.
+        # (einsum sums the stats in order, so the moving averages round the same as before)
+        X = np.stack([
+            np.stack([
+                momentum[f'{team} {stat} - Time Sum Weighted'].to_numpy(dtype=float)
+                for stat in ['Goals', 'Shots', 'Hits', 'Shot Attempts']
+            ])
+            for team in [Home, Away]
+        ])
+        team_momentum = np.einsum('s,kst->kt', weights, X)
+        momentum[f'{Home} - Momentum'] = team_momentum[0]
+        momentum[f'{Away} - Momentum'] = team_momentum[1]
+        
+        # Calculate the moving average of momentum for each team
+        team_momentum = momentum[[f'{Home} - Momentum', f'{Away} - Momentum']]
+        MA5 = team_momentum.rolling(12).mean().round(1).to_numpy()
+        MA1 = team_momentum.rolling(3).mean().round(1).to_numpy()
+        momentum[f'{Home} 5Min MA'], momentum[f'{Away} 5Min MA'] = MA5[:, 0], MA5[:, 1]
+        momentum[f'{Home} 1Min MA'], momentum[f'{Away} 1Min MA'] = MA1[:, 0], MA1[:, 1]
+        
+        # Calculate the Net Momentum (Home Team Mom. - Away Team Mom.)
+        momentum['Net_Momentum'] = MA5[:, 0] - MA5[:, 1]
+        
+        # Transpose the away team momentum
+        momentum[f'{Away} 5Min MA'] *= -1
+        momentum[f'{Away} 1Min MA'] *= -1
+        
+        return momentum
         
     def Prior5Stats(self):
         """
@@ -475,12 +918,13 @@ class GameStats:
         Away, Home, plays = self.AwayAbrv, self.HomeAbrv, self.plays
         
         # Collect the prior 5 minute data needed to calculate a teams momentum
-        shots     = GameStats.prior_5(plays, Home, Away, 'Shots')
-        hits      = GameStats.prior_5(plays, Home, Away, 'Hits')
-        goals     = GameStats.prior_5(plays, Home, Away, 'Goals')
-        attempts  = GameStats.prior_5(plays, Home, Away, 'Shot Attempts')
-        giveaways = GameStats.prior_5(plays, Home, Away, 'Giveaways')
-        takeaways = GameStats.prior_5(plays, Home, Away, 'Takeaways')
+        P5 = GameStats.prior_5(
+            plays, Home, Away,
+            ['Shots', 'Hits', 'Goals', 'Shot Attempts', 'Giveaways', 'Takeaways'],
+            clock = self.clock
+        )
+        shots, hits, goals = P5['Shots'], P5['Hits'], P5['Goals']
+        attempts, giveaways, takeaways = P5['Shot Attempts'], P5['Giveaways'], P5['Takeaways']
         
         # Append the prior 5 minute df's for the selected stats
         # to their own attributes
@@ -497,66 +941,8 @@ class GameStats:
             axis=1
         )
         
-        # Parse selected stats into one dataframe for calculating momentum
-        momentum = pd.concat(
-            [goals, shots, attempts, hits],
-            axis = 1,
-            levels = 'Time'
-        )
-        # Drop any columns that don't follow the naming conventions
-        # for prior 5 stats (mostly just drops the rolling total columns)
-        momentum = momentum[
-            [col for col in momentum.columns if ' - ' in col] + ['Time']
-        ]
-        # Drop any duplicate rows/columns and set the index to the time column
-        momentum = momentum.loc[
-            ~momentum.Time.duplicated(),
-            ~momentum.columns.duplicated()
-        ]
-        momentum.set_index('Time', inplace = True, drop = True)
-        
-        # Define a quick function to calculate weighted momentum based on event type
-        def TeamMomentum(P5_goals, P5_shots, P5_atts, P5_hits):
-            w_goal   = 5  # 1      # 6
-            w_shot   = 3  # 2 / 3  # 4
-            w_hit    = 2  # 1 / 2  # 3
-            w_attmpt = 1  # 1 / 3  # 1
-            
-            return (P5_goals * w_goal) + (P5_shots * w_shot) + \
-                    (P5_hits * w_hit) + (P5_atts * w_attmpt)
-        
-        # Calculate momentum for each team
-        HMcols = [col for col in momentum.columns if Home in col]
-        AMcols = [col for col in momentum.columns if Away in col]
-        
-        momentum.loc[:, f'{Home} - Momentum'] = momentum.apply(
-            lambda x: TeamMomentum(
-                x[HMcols[1]], x[HMcols[3]], x[HMcols[5]], x[HMcols[7]]
-            ),
-            axis=1
-        )
-        momentum.loc[:, f'{Away} - Momentum'] = momentum.apply(
-            lambda x: TeamMomentum(
-                x[AMcols[1]], x[AMcols[3]], x[AMcols[5]], x[AMcols[7]]
-            ),
-            axis=1
-        )
-        
-        # Calculate the moving average of momentum for each team
-        momentum[f'{Home} 5Min MA'] = momentum[f'{Home} - Momentum'].rolling(12).mean().round(1)
-        momentum[f'{Away} 5Min MA'] = momentum[f'{Away} - Momentum'].rolling(12).mean().round(1)
-        momentum[f'{Home} 1Min MA'] = momentum[f'{Home} - Momentum'].rolling(3).mean().round(1)
-        momentum[f'{Away} 1Min MA'] = momentum[f'{Away} - Momentum'].rolling(3).mean().round(1)
-            
-        # Calculate the Net Momentum (Home Team Mom. - Away Team Mom.)
-        # momentum.loc[:, 'Net_Momentum'] = \
-        #     momentum[f'{Home} - Momentum'] - momentum[f'{Away} - Momentum']
-        momentum.loc[:, 'Net_Momentum'] = \
-            momentum[f'{Home} 5Min MA'] - momentum[f'{Away} 5Min MA']
-        
-        # Transpose the away team momentum
-        momentum[f'{Away} 5Min MA'] *= -1
-        momentum[f'{Away} 1Min MA'] *= -1
+        # Calculate the momentum of each team from the prior 5 minute data
+        momentum = GameStats.momentum(P5, Home, Away)
         
         # Create separate df's for the time periods where the home teams
         # momentum is dominant and when the away teams momentum is dominant.
@@ -588,190 +974,18 @@ class GameStats:
             A list of start and end times for the away teams power plays.
         
         """
-        # Define function w/in MenOnIce to determine PP/PK stats
-        def PenaltyComp(team, i, Home, Away, plays, pen_Home, pen_Away):
-            # Input team as the team that took the penalty
-            # Define refernces for short-handed team and power play team
-            if team == Home:
-                shTeam, ppTeam = Home, Away
-            else:
-                shTeam, ppTeam = Away, Home
-            
-            PenType = plays.loc[i, 'event_secondary_type']
-            pim = 0
-            
-            # minors is currently unused.
-            # Instead of checking that a penalty is in this list,
-            # I will assume the penalty is a minor and use conditional
-            # statemnts to check that assumption.
-            minors = ['Boarding', 'Charging', 'Clipping', 'Elbowing', 'Hooking',
-                      'Illegal check to the head', 'Kneeing', 'Roughing',
-                      'Throwing equipment', 'Holding', 'Hooking', 'Interference',
-                      'Tripping', 'Cross checking', 'Hi-sticking', 'Slashing',
-                      'Delaying Game - Puck over glass', 'Delay of game',
-                      'Delaying the game', 'Embellishment',
-                      'Closing hand on puck', 'Interference - Goalkeeper',
-                      'Too many men on the ice', 'Unsportsmanlike conduct']
-            double = ['Hi stick - double minor', 'Cross check - double minor',
-                      'Spearing']
-            # Check if the penalty qualifies as a dobule minor
-            pim = 4 if PenType in double else 2
-            
-            # Check if the penalty qualifies as a major
-            majors = ['Fighting', 'Kicking', 'Slew-footing',
-                      'Butt-ending', 'Match penalty']
-            pim = 5 if PenType in majors else pim
-            
-            # Check if the penalty is actually a game misconduct
-            miscon = ['Instigator - Misconduct', 'Misconduct', 'Game misconduct']
-            if PenType in miscon:
-                # Misconducts count towards the teams PIM, but don't reduce MOI
-                pim = 10
-                plays.loc[i:, shTeam + " PIM"] += pim
-                return plays, pen_Home, pen_Away
-            
-            if (plays.loc[i, 'player_1'] == plays.loc[i + 1, 'player_1']) & \
-               (plays.loc[i + 1, 'event_secondary_type'] in miscon) & (pim != 5):
-                pim = 5
-            
-            # Take one man away from "Men on Ice" columns for shTeam
-            # Record one power play for the pp team
-            plays.loc[i, shTeam + " Men On Ice"]   -= 1
-            plays.loc[i:, ppTeam + " Power Plays"] += 1
-            
-            # Record PIM in plays df
-            plays.loc[i:, shTeam + " PIM"] += pim
-            
-            # Create references for start time of penalty and the period
-            tempTime = plays.Time.iloc[i]
-            tempPeri = plays.period.iloc[i]
-            
-            # Handle instances where a penalty occurs in last few minutes of
-            # regulation and/or the game goes into OT
-            if tempTime.minute + pim > 59:
-                # Redefine the end time of the penalty to account
-                # for rolling of the hour hand
-                tempH, tempM = 1, (tempTime.minute + pim) - 60
-            else:
-                # The penalty does not relate to this special case
-                tempH, tempM = 0, tempTime.minute + pim
-            
-            # Handle instances where a penalty is called in OT
-            # The game managers (or ref's) NEVER call penalties in OT though...
-            # ... Unless its so blatantly obvious that the receiving team would
-            # literally call for blood...
-            if tempPeri > 3:
-                tempTime = dt.time(1, tempTime.minute, tempTime.second)
-                tempH, tempM = 1, (tempTime.minute + pim)
-            
-            # Define the starting and ending game time for the penalty
-            start, end = tempTime, dt.time(tempH, tempM, tempTime.second)
-            
-            x = i + 1  # temp row reference
-            # Initiate while loop to handle MOI, PPG, SHG
-            while (plays.Time.iloc[x] <= end):
-                # Record one man down for PK in each row of plays df
-                plays.loc[x, shTeam + " Men On Ice"] -= 1
-                
-                # Short handed goal scored
-                if (plays.event_type.iloc[x] == 'GOAL') & \
-                   (plays.team_for.iloc[x] == shTeam) & \
-                   (plays.loc[x, shTeam + ' is_shg'] == False):
-                    
-                    # Penalized team scores, record SHG
-                    plays.loc[x:, shTeam + " SHG"]    += 1
-                    plays.loc[x, shTeam + ' is_shg']  = True
-                
-                # PP team scores. Record PPG & end penalty comprehension
-                elif (plays.event_type.iloc[x] == 'GOAL') & \
-                     (plays.team_for.iloc[x] == ppTeam) & \
-                     (plays.loc[x, ppTeam + ' is_ppg'] == False):
-                    
-                    # Team on PP scores, record PPG, end the while loop
-                    if plays.period.iloc[x] <= 3:
-                        # In regulation, the penalty simply ends
-                        end = dt.time(plays.Time.iloc[x].hour,
-                                      int(plays.Minute.iloc[x]),
-                                      int(plays.Second.iloc[x]))
-                        plays.loc[x:, ppTeam + " PPG"]  += 1
-                        plays.loc[x, ppTeam + ' is_ppg'] = True
-                        break
-                    
-                    else:
-                        # In OT, the penalty and game end
-                        end = dt.time(plays.Time.iloc[x].hour,
-                                      int(plays.Minute.iloc[x] - 60),
-                                      int(plays.Second.iloc[x]))
-                        plays.loc[x:, ppTeam + " PPG"]  += 1
-                        plays.loc[x, ppTeam + ' is_ppg'] = True
-                        break
-                        
-                else:
-                    # continue with next iteration
-                    x += 1
-                
-                # End while loop if end of plays df has been reached.
-                # Happens when penalty is currently happening, or game
-                # ends with time left on penalty.
-                if x >= plays.shape[0]:
-                    end = dt.time(plays.Time.iloc[x - 1].hour,
-                                  min(int(plays.Minute.iloc[x - 1]), 59),
-                                  min(int(plays.Second.iloc[x - 1]), 59))
-                    break
-            
-            # Append penalty data for relevant team
-            # Adjust start/end time to round seconds to nearest 5 second interval
-            # This is necessary so plotly doesn't get confused :/...
-            # Not the ideal solution, but one that works.
-            start = dt.time(
-                start.hour, start.minute, min(5 * round(start.second / 5), 55)
-            )
-            end   = dt.time(
-                end.hour, end.minute, min(5 * round(end.second / 5), 55)
-            )
-            pen_Home.append((start, end)) if team == Home else \
-                pen_Away.append((start, end))
-            
-            # return updated plays df and penalty lists
-            return plays, pen_Home, pen_Away
-        
         # Collect the necessary attributes
         Away = self.AwayAbrv
         Home = self.HomeAbrv
         plays = self.plays
         
-        # Each team starts with 5 men on ice, 0 PPG, 0 SHG, & 0 Penalties.
-        # Also create boolean reference columns and PIM counter
-        plays[Home + " Men On Ice"], plays[Away + " Men On Ice"] = 5, 5
-        
-        plays[Home + " PPG"], plays[Away + " PPG"] = 0, 0
-        plays[Home + " SHG"], plays[Away + " SHG"] = 0, 0
-        
-        plays[Home + " is_ppg"], plays[Away + " is_ppg"] = False, False
-        plays[Home + " is_shg"], plays[Away + " is_shg"] = False, False
-        
-        plays[Home + " Power Plays"] = 0
-        plays[Away + " Power Plays"] = 0
-        
-        plays[Home + " PIM"] = 0
-        plays[Away + " PIM"] = 0
-        
-        pen_Home = []
-        pen_Away = []
-        
         # Forward fill any missing data for the Hour, Minute, Second column
-        plays[['Minute', 'Second']] = plays[['Minute', 'Second']].fillna(method = 'ffill')
+        plays[['Minute', 'Second']] = plays[['Minute', 'Second']].ffill()
         
-        # Loop through each record of plays df to aggregate PP/PK data
-        for i in range(0, plays.shape[0]):
-            # if (plays.event_type.iloc[i] == 'PENALTY') & \
-            #    (plays.event_secondary_type.iloc[i] != 'Fighting'):
-            if plays.event_type.iloc[i] == 'PENALTY':
-                
-                plays, pen_Home, pen_Away = PenaltyComp(
-                    plays.team_for.iloc[i], i, Home, Away,
-                    plays, pen_Home, pen_Away
-                )
+        # Sweep over each penalty to aggregate PP/PK data
+        cols, pen_Home, pen_Away, Penalties = PenaltySweep(plays, Home, Away)
+        for col in cols:
+            plays[col] = cols[col]
         
         # Convert list of tuples into nested lists with
         # start/end times of penalties.
@@ -780,6 +994,7 @@ class GameStats:
         
         # Update plays df and add penalty list attributes
         self.plays, self.HomePens, self.AwayPens = plays, HomePens, AwayPens
+        self.Penalties = Penalties
         
     def GoalsDF(self):
         """
@@ -829,18 +1044,16 @@ class GameStats:
             if df[(df.event_type == 'GOAL') & (df.team_for == team)].empty:
                 return pd.DataFrame(columns=cols), 0
             
-            df = df[(df.event_type == 'GOAL') & (df.team_for == team)][cols]
+            df = df[(df.event_type == 'GOAL') & (df.team_for == team)][cols + ['elapsed_s']]
             df.reset_index(inplace=True, drop=False)
             
-            # Convert Time column from objects to datetimes
-            df.Time = pd.to_datetime(df.Time, format='%H:%M:%S').dt.time
             # Create a string references
             df['strTime'] = df.Time.apply(lambda x: x.strftime('%H:%M:%S'))
             
             # Parse out the Hour, Minute, and Second that each goal is scored
-            df['Hour'] = pd.to_datetime(df.Time, format='%H:%M:%S').dt.hour
-            df['Minute'] = pd.to_datetime(df.Time, format='%H:%M:%S').dt.minute
-            df['Second'] = pd.to_datetime(df.Time, format='%H:%M:%S').dt.second
+            elapsed = df.pop('elapsed_s')
+            df['Hour'], df['Minute'], df['Second'] = \
+                elapsed // 3600, (elapsed % 3600) // 60, elapsed % 60
             
             # Reset the index and determine total goals scored by the team
             df.set_index('strTime', inplace=True)
@@ -889,108 +1102,66 @@ class GameStats:
                    "S/SA %", "Blocked Shots", "Missed Shots", "House Attempts",
                    "Faceoff Wins", "Hits", "Power Plays", "PPG", "SHG", "PIM",
                    "Takeaways", "Giveaways"]
-        dic = {}
         
-        # Initiate loop through the `plays` df to collect summary stats by period
-        for p in range(1, periods, 1):
-            tempHlst = []  # Reset temp lists for each loop of `p`
-            tempAlst = []
-            
-            for i in myStats:
-                
-                # Calculate each teams shot percentage (goals / shots on net)
-                if i == "Shot %":
-                    tempH = "{:.1%}".format(tempHlst[0] / max(tempHlst[1], 1))
-                    tempA = "{:.1%}".format(tempAlst[0] / max(tempAlst[1], 1))
-                    
-                    tempHlst.append(tempH)
-                    tempAlst.append(tempA)
-                    continue
-                
-                # Calculate each teams shot attempt percentage (shots on net / shot attempts)
-                if i == "S/SA %":
-                    tempH = "{:.1%}".format(tempHlst[1] / max(tempHlst[-1], 1))
-                    tempA = "{:.1%}".format(tempAlst[1] / max(tempAlst[-1], 1))
-                    
-                    tempHlst.append(tempH)
-                    tempAlst.append(tempA)
-                    continue
-                
-                ## TODO: Figure out how to handle instances where the
-                ##       current period has not ended
-                tempH = plays[(plays.event_type == 'PERIOD_OFFICIAL') & \
-                              (plays.period == p)][f"{Home} {i}"].max()
-                tempA = plays[(plays.event_type == 'PERIOD_OFFICIAL') & \
-                              (plays.period == p)][f"{Away} {i}"].max()
-                
-                if (plays[(plays.event_type == 'PERIOD_OFFICIAL') & (plays.period == p)].shape[0] == 0) & (p in plays.period.unique()):
-                    tempH = plays[(plays.period == p)][f"{Home} {i}"].max()
-                    tempA = plays[(plays.period == p)][f"{Away} {i}"].max()
-                
-                tempHlst.append(tempH)
-                tempAlst.append(tempA)
-            
-            p = p if p < 4 else 'OT'
-            dic[(p, Home)] = tempHlst
-            dic[(p, Away)] = tempAlst
+        # Define list of column names used to calculate sum stats by period
+        SCols = [s for s in myStats if '%' not in s]
+        cols  = [f'{team} {S}' for team in [Home, Away] for S in SCols]
+        
+        ## TODO: Figure out how to handle instances where the
+        ##       current period has not ended
+        # Collect the rolling totals at the end of each period in one groupby. Periods that
+        # have ended are summarized by their PERIOD_OFFICIAL row, any other period that has
+        # started uses all of its rows. (The 5 second index rows have no period and are dropped)
+        official = (plays.event_type == 'PERIOD_OFFICIAL').to_numpy()
+        ended    = plays.period.isin(plays.period[official].unique()).to_numpy()
+        totals   = plays.loc[official | ~ended, cols + ['period']] \
+            .groupby('period')[cols].max().astype(object)
+        totals.index = totals.index.astype(int)
+        totals = totals.reindex(range(1, periods))
+        
+        # Group all OT stats together with the final OT period's rolling totals.
+        # Note: This currently groups all OT stats together.
+        #       So, when there is a game that goes to 2OT+ in playoffs,
+        #       all of that data will be grouped. Otherwise the table
+        #       becomes unreadable... Could come back to this if desired
+        if self.OT:
+            totals = pd.concat([totals.loc[[1, 2, 3]], totals.loc[[periods - 1]]])
+            totals.index = [1, 2, 3, 'OT']
+        
+        # Separate out the stats for each period from the rolling totals
+        deltas = totals - totals.shift(1)
+        deltas.iloc[0] = totals.iloc[0]
+        
+        def Layout(df):
+            # Lay out the stats with one row per (period, team) and the stats as columns
+            dic = {}
+            for p in df.index:
+                for team in [Home, Away]:
+                    dic[(p, team)] = [
+                        df.at[p, f'{team} {S}'] if S in SCols else '' for S in myStats
+                    ]
             
-        # Create DF of selected summary stats
-        # (Sum stats are presented as rolling totals here)
-        SumStats = pd.DataFrame.from_dict(dic, orient='columns')
+            # Create DF of selected summary stats
+            df = pd.DataFrame.from_dict(dic, orient='columns').T
+            df.columns = myStats
+            return df
         
-        # Transpose and rename columns for a better looking layout
-        SumStats = SumStats.T
-        SumStats.columns = myStats
-        
-        # Create a pandas index slice reference
-        idx = pd.IndexSlice
+        SumStats = Layout(deltas)
         
         # Determine if an extra column is needed for OT stats
         # Adjustments need to be made for post-season OT (@ CBJ-TBL 2020 RD1 G1)
         if self.OT is False:
-            finalPeriod = plays.period.max()
+            finalPeriod = int(plays.period.max())
         else:
             finalPeriod = 'OT'
         
         # Collect the total game stats
-        FS = SumStats.loc[idx[finalPeriod, :], :]
+        FS = Layout(totals.loc[[finalPeriod]])
         FS.index = pd.MultiIndex.from_tuples(
             [('Game Total', Home), ('Game Total', Away)],
             names=['Period', 'Team']
         )
         
-        # Define list of column names used to calculate sum stats by period
-        SCols = [
-            "Goals", "Shots", "House Shots", "Shot Attempts", "House Attempts",
-            "Blocked Shots", "Missed Shots", "Faceoff Wins", "Hits", "PPG", "Power Plays",
-            "SHG", "PIM", "Takeaways", "Giveaways"
-        ]
-        
-        # Separate out home & away team sum stats for 2nd & 3rd periods
-        for team in [Home, Away]:
-            # Separate out 2nd period stats
-            SumStats.loc[idx[2, team], SCols] = \
-                SumStats.loc[idx[2, team], SCols] - \
-                SumStats.loc[idx[1, team], SCols]
-            
-            # Separate out 3rd period stats
-            SumStats.loc[idx[3, team], SCols] = \
-                SumStats.loc[idx[3, team], SCols] - \
-                SumStats.loc[idx[2, team], SCols] - \
-                SumStats.loc[idx[1, team], SCols]
-            
-            # If needed, separate out the OT stats
-            # Note: This currently groups all OT stats together.
-            #       So, when there is a game that goes to 2OT+ in playoffs,
-            #       all of that data will be grouped. Otherwise the table
-            #       becomes unreadable... Could come back to this if desired
-            if self.OT:
-                SumStats.loc[idx['OT', team], SCols] = \
-                    SumStats.loc[idx['OT', team], SCols] - \
-                    SumStats.loc[idx[3, team], SCols] - \
-                    SumStats.loc[idx[2, team], SCols] - \
-                    SumStats.loc[idx[1, team], SCols]
-        
         # Concat the total game stats with the per-period stats
         SS = pd.concat([FS, SumStats])
         
@@ -1010,199 +1181,206 @@ class GameStats:
         # Transpose the table for a better look in the final visual
         SS = SS.T
         
-        # Calculate the Faceoff win percentages
-        # Collect the index value of the `Faceoff Wins` row
-        row = 9  # Need to figure out a way to dynamically define this variable
-        for i in range(0, len(SS.columns) - 1, 2):
-            HFO = SS.iloc[row, i]
-            AFO = SS.iloc[row, i + 1]
+        # Calculate the Faceoff win percentages for each (Home, Away) pair of columns
+        FO = SS.loc['Faceoff Wins'].tolist()
+        for i in range(0, len(FO) - 1, 2):
+            HFO, AFO = FO[i], FO[i + 1]
             TFO = HFO + AFO
             # Handle instances where the period had technically started,
             # but the puck has not been dropped
             TFO = TFO if TFO != 0 else 1
             
-            SS.iloc[row, i] = f'{str(round(100 * HFO / TFO, 1))}%<br>({str(HFO)})'
-            SS.iloc[row, i + 1] = f'{str(round(100 * AFO / TFO, 1))}%<br>({str(AFO)})'
+            FO[i]     = f'{str(round(100 * HFO / TFO, 1))}%<br>({str(HFO)})'
+            FO[i + 1] = f'{str(round(100 * AFO / TFO, 1))}%<br>({str(AFO)})'
+        SS.loc['Faceoff Wins'] = FO
         
         self.SumStats = SS
         
     def XY_GSA_HTG(self):
         """
-        Subset out the home team and away team goals/shots/attempts, as well as hits/TA's/GA's.
+        Collect the X/Y data for the home team and away team goals/shots/attempts, as well as
+        hits/TA's/GA's.
+        
+        The data is stored in one table (`XY`), and each team's events of each category are
+        available as views (`HomeG`, `HomeS`, `HomeSA`, `HomeH`, `HomeT`, `HomeGA`, `HomeFO`,
+        and the same for the away team).
         
         Returns
         -------
         None.
         
         """
-        # =============================================================================
-        #                                   GSA Data                                  =
-        # =============================================================================
-        shots = self.shots_xy
-        Home = self.HomeAbrv
-        Away = self.AwayAbrv
+        self.XY = XYEvents(
+            self.shots_xy, self.plays_xy, self.HomeAbrv, self.AwayAbrv, self.direct_of_attack
+        )
+        # The rows of `XY` for each (team, category)
+        self._xy_rows = self.XY.groupby(['team_for', 'category']).indices
         
-        # Define the list of columns to collect
-        cols = ['event_type', 'team_for', 'x', 'y', 'period',
-                'player_1', 'player_2', 'player_3', 'player_4', 'period_time']
-        # Drop any of the above columns from the list if they do not appear in the JSON file
-        cols = [c for c in cols if c in shots.columns]
-        
-        # Subset the `shots` df to the desired columns
-        XY_Shots = shots[cols].copy()
-        
-        # Odd logic problem where adjustments for direction of attack is not
-        # consistent across all arenas. Introduced the direct_of_attack variable
-        # in the __init__ method to solve this issue.
-        
-        # Flip the game stat locations for even-numbered periods (P2, OT1, OT3, etc.)
-        XY_Shots.loc[XY_Shots.period % 2 == 0, 'x'] *= -1
-        XY_Shots.loc[XY_Shots.period % 2 == 0, 'y'] *= -1
-        
-        # The above transformations should put away stats on the left (negative x values),
-        # and home stats on the right (positive x values).
-        # Depending on what arena the game is being played in, we may need the opposite of that.
-        if self.direct_of_attack:
-            XY_Shots.loc[:, 'x'] *= -1
-            XY_Shots.loc[:, 'y'] *= -1
-        
-        ## Subset out each team's goals, shots, and shot attempts
-        # Home team stats
-        XYhome = XY_Shots[(XY_Shots.team_for == Home)].copy()
-        # Home team goals
-        XYhomeG = XYhome[XYhome.event_type == 'GOAL'].copy()
-        # Home team shots
-        XYhomeS = XYhome[XYhome.event_type == 'SHOT'].copy()
-        # Home team shot attempts (missed + blocked shots)
-        XYhomeSA = XY_Shots[
-            ((XY_Shots.team_for == Home) & (XY_Shots.event_type == 'MISSED_SHOT')) | \
-            ((XY_Shots.team_for == Home) & (XY_Shots.event_type == 'BLOCKED_SHOT'))
-        ].copy()
-        # Flip coordinates for Shot Attempts
-        # XYhomeSA['x'] *= -1
-        # XYhomeSA['y'] *= -1
-        
-        # TODO - Make necessary adjustments to the comments below
-        # Transpoe the blocked shot data by 180 degrees since the data provided by the NHL
-        # records the blocked shot data for the team that had the puck hit their player.
-        # Therefore, we also need to reassign the `team_for` labels
-        XYhomeSA.loc[XYhomeSA.event_type == 'BLOCKED_SHOT', 'x'] *= -1
-        XYhomeSA.loc[XYhomeSA.event_type == 'BLOCKED_SHOT', 'y'] *= -1
-        XYhomeSA.loc[:, 'team_for'] = Home
-        
-        # Away team stats
-        XYaway = XY_Shots[(XY_Shots.team_for == Away)].copy()
-        # Away team goals
-        XYawayG = XYaway[XYaway.event_type == 'GOAL'].copy()
-        # Away team shots
-        XYawayS = XYaway[XYaway.event_type == 'SHOT'].copy()
-        # Away team shot attempts (missed + blocked shots)
-        XYawaySA = XY_Shots[
-            ((XY_Shots.team_for == Away) & (XY_Shots.event_type == 'MISSED_SHOT')) | \
-            ((XY_Shots.team_for == Away) & (XY_Shots.event_type == 'BLOCKED_SHOT'))
-        ].copy()
-        # Flip coordinates for Shot Attempts
-        # XYawaySA['x'] *= -1
-        # XYawaySA['y'] *= -1
-        
-        # TODO - Make necessary adjustments to the comments below
-        # Transpoe the blocked shot data by 180 degrees since the data provided by the NHL
-        # records the blocked shot data for the team that had the puck hit their player.
-        # Therefore, we also need to reassign the `team_for` labels
-        XYawaySA.loc[XYawaySA.event_type == 'BLOCKED_SHOT', 'x'] *= -1
-        XYawaySA.loc[XYawaySA.event_type == 'BLOCKED_SHOT', 'y'] *= -1
-        XYawaySA.loc[:,'team_for'] = Away
-        
-        # Reset index of each stats df for the home team to start at 1
-        ## TODO - determine if this is relevant for the Shots & Shot Atempts dfs
-        XYhomeS.index  = np.arange(1, len(XYhomeS) + 1)
-        XYhomeSA.index = np.arange(1, len(XYhomeSA) + 1)
-        XYhomeG.index  = np.arange(1, len(XYhomeG) + 1)
-        
-        # Assign relevant market styles to use in the Rink Scatters
-        XYhomeS['MarkerStyle']  = 'circle'
-        XYhomeSA['MarkerStyle'] = 'x'
-        XYhomeG['MarkerStyle']  = XYhomeG.index.copy(dtype='str')
-        
-        # Reset index of each stats df for the home team to start at 1
-        ## TODO - determine if this is relevant for the Shots & Shot Atempts dfs
-        XYawayS.index  = np.arange(1, len(XYawayS) + 1)
-        XYawaySA.index = np.arange(1, len(XYawaySA) + 1)
-        XYawayG.index  = np.arange(1, len(XYawayG) + 1)
-        
-        # Assign relevant market styles to use in the Rink Scatters
-        XYawayS['MarkerStyle']  = 'circle'
-        XYawaySA['MarkerStyle'] = 'x'
-        XYawayG['MarkerStyle']  = XYawayG.index.copy(dtype='str')
-        
-        # Assign home and away team stats as individual class attributes
-        self.HomeG, self.HomeS, self.HomeSA = XYhomeG, XYhomeS, XYhomeSA
-        self.AwayG, self.AwayS, self.AwaySA = XYawayG, XYawayS, XYawaySA
-        
-        # =============================================================================
-        #                                   HTG Data                                  =
-        # =============================================================================
-        plays = self.plays_xy
-        
-        cols = ['event_type', 'team_for', 'x', 'y', 'period',
-                'player_1', 'player_2', 'player_3', 'player_4', 'period_time']
-        cols = [col for col in cols if col in plays.columns]
-        
-        ## Standardize direction of play/attack for each team
-        # Flip the game stat locations for even-numbered periods
-        plays.loc[plays.period % 2 == 0, 'x'] *= -1
-        plays.loc[plays.period % 2 == 0, 'y'] *= -1
-        
-        # Above transformations put away stats on the left, and home stats on the right.
-        # Depending on the rink the game is being played at and from what angle / side of the rink
-        # the stats team views the game, we may need to transform the data again.
-        if self.direct_of_attack:
-            plays.loc[:, 'x'] *= -1
-            plays.loc[:, 'y'] *= -1
-        
-        # Subset out the desired stats
-        hits = plays[plays.event_type == 'HIT'][cols]
-        take = plays[plays.event_type == 'TAKEAWAY'][cols]
-        give = plays[plays.event_type == 'GIVEAWAY'][cols]
-        face = plays[plays.event_type == 'FACEOFF'][cols]
-        
-        # Further subset out the desired stats for each team
-        XYhomeH = hits[hits.team_for == Home]   # x,y data for home team hits
-        XYawayH = hits[hits.team_for == Away]   # x,y data for away team hits
-        
-        XYhomeT = take[take.team_for == Home]   # x,y data for home team takeaways
-        XYawayT = take[take.team_for == Away]   # x,y data for away team takeaways
-        
-        XYhomeGA = give[give.team_for == Home]  # x,y data for home team giveaways
-        XYawayGA = give[give.team_for == Away]  # x,y data for away team giveaways
-        
-        # Possibly useful for looking at draws likely to win/lose
-        XYhomeF = face[face.team_for == Home]   # Home team faceoff wins xy data
-        XYawayF = face[face.team_for == Away]   # Away team faceoff wins xy data
-        
-        # Reset the indexes to start at 1
-        XYhomeH.index  = np.arange(1, len(XYhomeH) + 1)
-        XYhomeT.index  = np.arange(1, len(XYhomeT) + 1)
-        XYhomeGA.index = np.arange(1, len(XYhomeGA) + 1)
-        
-        XYawayH.index  = np.arange(1, len(XYawayH) + 1)
-        XYawayT.index  = np.arange(1, len(XYawayT) + 1)
-        XYawayGA.index = np.arange(1, len(XYawayGA) + 1)
-        
-        # Assign home and away team stats as individual class attributes
-        self.HomeH, self.HomeT, self.HomeGA, self.HomeFO = XYhomeH, XYhomeT, XYhomeGA, XYhomeF
-        self.AwayH, self.AwayT, self.AwayGA, self.AwayFO = XYawayH, XYawayT, XYawayGA, XYawayF
+    def XY_View(self, side, category):
+        """
+        Subset out one team's X/Y data for one category of events.
+        
+        Parameters
+        ----------
+        side : str
+            'Home' or 'Away'.
+        category : str
+            The category of events (see `XYEvents`).
+        
+        Returns
+        -------
+        df : pd.DataFrame
+            The team's events indexed from 1 (faceoffs keep the index of the plays df).
+        
+        """
+        team = self.HomeAbrv if side == 'Home' else self.AwayAbrv
+        rows = self._xy_rows.get((team, category), [])
+        df   = self.XY.iloc[rows]
+        
+        if category == 'FO':
+            # Faceoffs are not plotted, so they don't need a marker or to be re-indexed
+            return df.drop(columns=['category', 'number', 'MarkerStyle'])
         
+        # Only goals, shots, and shot attempts have a marker style (see `XYEvents`)
+        drop = ['category'] if category in ['G', 'S', 'SA'] else ['category', 'MarkerStyle']
+        df = df.set_index('number').drop(columns=drop)
+        df.index.name = None
+        return df
+        
+    def StageKeys(self):
+        """
+        Create the key of each stage's output in `All`.
+        
+        A stage's output is determined by the contents of the raw feeds, the teams (and the
+        direction of attack in their arena), and the version of the stage and every stage
+        before it (see `STAGES`).
+        
+        Returns
+        -------
+        keys : dict
+            The key (a SHA-256 hash) of each stage, or None if the feeds were never hashed.
+        
+        """
+        if self.feed_hash is None:
+            return None
+        
+        info = [self.feed_hash, self.game_type, self.HomeAbrv, self.AwayAbrv,
+                bool(self.direct_of_attack)]
+        h    = hashlib.sha256(repr(info).encode())
+        keys = dict()
+        for stage, version in GameStats.STAGES.items():
+            h.update(f'{stage}={version};'.encode())
+            keys[stage] = h.hexdigest()
+        
+        return keys
+    
+    def StaleStage(self, keys):
+        """
+        Determine the first stage of `All` that needs to be run.
+        
+        Parameters
+        ----------
+        keys : dict
+            The key of each stage's output (see `StageKeys`).
+        
+        Returns
+        -------
+        first : int
+            The position of the first stage to run (`len(STAGES)` if none need to be run).
+        manifest : dict
+            The manifest of the game's artifact (None if it can't be used).
+        
+        """
+        stages   = list(GameStats.STAGES)
+        manifest = ReadManifest(self.data_dir) if keys is not None else None
+        if manifest is None:
+            return 0, None
+        
+        saved = manifest.get('stages', dict())
+        first = next((i for i, s in enumerate(stages) if saved.get(s) != keys[s]), len(stages))
+        
+        # The saved `plays` df has the changes of every stage made to it, so the stages can
+        # only be picked back up from the artifact if none of the stages being rerun modify
+        # the `plays` df in place. Otherwise every stage needs to be rerun.
+        if any(s in GameStats.MODIFIES_PLAYS for s in stages[first:]):
+            return 0, manifest
+        
+        return first, manifest
+    
+    def Restore(self, manifest, keep=(), tables=None, columns=None):
+        """
+        Restore the attributes saved in the game's artifact (see `SaveArtifact`).
+        
+        Each df is read the first time it is accessed (see `__getattr__`).
+        
+        Parameters
+        ----------
+        manifest : dict
+            The manifest of the game's artifact (see `Artifacts.ReadManifest`).
+        keep : list, optional
+            Attributes to keep as they are, instead of restoring. The default is ().
+        tables : list, optional
+            The dfs to restore. The default is None, which restores all of them.
+        columns : dict, optional
+            The columns to read for any of the dfs, e.g. {'plays': ['event_type']}.
+            The default is None, which reads every column.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        keep     = set(keep) | {'data_dir', 'gr', 'timings', 'data_svd'}
+        data_dir = self.data_dir
+        attrs    = ReadAttrs(data_dir)
+        self.__dict__.update({k: v for k, v in attrs.items() if k not in keep})
+        
+        columns = columns or dict()
+        tables  = manifest['tables'] if tables is None else tables
+        lazy    = dict()
+        for name in tables:
+            attr, _, i = name.partition('.')
+            if attr in keep:
+                continue
+            
+            if i:
+                # Put the dfs stored in lists (i.e. `Goals`) back in their place right away
+                getattr(self, attr)[int(i)] = ReadArtifactTable(data_dir, name, columns.get(name))
+            else:
+                self.__dict__.pop(name, None)
+                lazy[name] = columns.get(name)
+        
+        self._lazy_tables = lazy
+    
     def All(self):
         
-        # if self.data_svd is False:
-        self.ModifyDFs()
-        self.AggregateData()
-        self.Prior5Stats()
-        self.MenOnIce()
-        self.GoalsDF()
-        self.SumDF()
-        self.XY_GSA_HTG()
+        # Run each stage, recording the rows of the df each stage creates/modifies.
+        # Stages whose saved output is still current (see `StageKeys`) aren't run again,
+        # their output is restored from the game's artifact instead.
+        stages = [
+            (self.ModifyDFs,     lambda: self.plays.shape[0]),
+            (self.AggregateData, lambda: self.plays.shape[0]),
+            (self.Prior5Stats,   lambda: self.prior5.shape[0]),
+            (self.MenOnIce,      lambda: self.plays.shape[0]),
+            (self.GoalsDF,       lambda: self.Goals[0].shape[0] + self.Goals[1].shape[0]),
+            (self.SumDF,         lambda: self.SumStats.shape[1]),
+            (self.XY_GSA_HTG,    lambda: self.XY.shape[0]),
+        ]
+        keys = self.StageKeys()
+        first, manifest = self.StaleStage(keys)
+        if first > 0:
+            # Keep the attributes created in `__init__`, other than the `plays` df
+            # (which is saved with the changes made by each stage)
+            with self.timings.stage('Restore', self.game_id):
+                self.Restore(manifest, keep=set(self.__dict__) - {'plays'})
+            
+            if first == len(stages):
+                return
+        
+        for stage, rows in stages[first:]:
+            with self.timings.stage(stage.__name__, self.game_id) as rec:
+                stage()
+                rec['rows'] = rows()
         
         # Save a summary dictionary of key stats
         # Start with basic info for each team
@@ -1291,16 +1469,183 @@ class GameStats:
         #     test = pickle.load(f)
         #     f.close()
             
-        # Save the entire class object with summarized and cleaned data
-        with open(os.path.join(self.data_dir, 'cleaned_data.bin'), 'wb') as f:
-            pickle.dump(self, f)
-            f.close()
+        # Save the summarized and cleaned data as the game's artifact (see `GameStats.load`)
+        with self.timings.stage('SaveArtifact', self.game_id):
+            self.SaveArtifact(keys)
+    
+    def SaveArtifact(self, keys=None):
+        """
+        Save every df created by `All` (and the other attributes needed to recreate the class)
+        as the game's columnar artifact (see `Artifacts`).
         
-        # # Test the load feature
-        # with open(os.path.join(self.data_dir, 'cleaned_data.bin'), 'rb') as f:
-        #     test = pickle.load(f)
-        #     f.close()
+        Parameters
+        ----------
+        keys : dict, optional
+            The key of each stage's output (see `StageKeys`). The default is None.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        # Read any dfs restored from the previous artifact that haven't been accessed yet
+        for name in list(self.__dict__.get('_lazy_tables', [])):
+            getattr(self, name)
+        
+        attrs = self.__getstate__()
+        for attr in ['gr', 'timings', '_lazy_tables']:
+            attrs.pop(attr, None)
+        
+        # Each df (including the dfs stored in lists, i.e. `Goals`) is saved as its own table
+        tables = dict()
+        for name, value in list(attrs.items()):
+            if isinstance(value, pd.DataFrame):
+                tables[name] = attrs.pop(name)
+            elif isinstance(value, list):
+                for i, item in enumerate(value):
+                    if isinstance(item, pd.DataFrame):
+                        tables[f'{name}.{i}'] = item
+                        value = value[:i] + [None] + value[i + 1:]
+                attrs[name] = value
+        
+        SaveArtifact(self.data_dir, self.game_id, tables, attrs, keys)
+    
+    def load(game_id, tables=None, columns=None):
+        """
+        Load a game's summarized and cleaned data from its artifact instead of recomputing it.
+        
+        Called directly from the class, i.e. `GameStats.load(game_id)`.
+        The artifact is only used for games that are final, and only if it was saved from the
+        feeds that are currently cached. Otherwise, the game is run with `GameStats.All`.
+        
+        Only the small attributes are read right away. Each df is read from the artifact the
+        first time it is accessed (e.g. `gs.SumStats`), so only the dfs that are used are read.
+        
+        Parameters
+        ----------
+        game_id : int
+            The NHL game id.
+        tables : list, optional
+            The dfs to load, e.g. ['SumStats', 'XY']. The default is None, which loads all.
+        columns : dict, optional
+            The columns to load for any of the dfs, e.g. {'plays': ['event_type']}.
+            The default is None, which loads every column.
+        
+        Returns
+        -------
+        gs : GameStats
+        
+        """
+        data_dir = GameDir(game_id)
+        manifest = ReadManifest(data_dir)
+        if manifest is None or manifest['game_state'] != 'Final':
+            gs = GameStats(game_id)
+            gs.All()
+            return gs
+        
+        # Recreate the class without running `__init__`
+        gs = GameStats.__new__(GameStats)
+        gs.data_dir = data_dir
+        gs.gr       = None
+        gs.timings  = Timings(enabled=False)
+        gs.data_svd = True
+        gs.Restore(manifest, tables=tables, columns=columns)
+        
+        return gs
+    
+    def __getattr__(self, name):
+        # Only called when an attribute is missing. For a game loaded from its artifact
+        # (see `load` and `Restore`), read the df the first time it is accessed.
+        lazy = self.__dict__.get('_lazy_tables')
+        if not lazy or name not in lazy:
+            raise AttributeError(f"'GameStats' object has no attribute '{name}'")
+        
+        df = ReadArtifactTable(self.data_dir, name, lazy.pop(name))
+        setattr(self, name, df)
+        return df
+    
+    def __getstate__(self):
+        # Once `XY` has been created, the X/Y copies of the raw feeds are no longer needed,
+        # so they are left out when the class is pickled (i.e. when returned from a worker
+        # process in `compute_many`), and from the game's artifact
+        state = self.__dict__.copy()
+        if 'XY' in state or 'XY' in state.get('_lazy_tables', []):
+            for attr in ['plays_xy', 'shots_xy', 'shift_xy']:
+                state.pop(attr, None)
+        
+        return state
+    
+    def compute_many(game_ids, workers=None, timings=None):
+        """
+        Run `GameStats.All` for a list of games, spread across a pool of worker processes.
+        
+        Called directly from the class, i.e. `GameStats.compute_many(game_ids)`.
+        The games are split evenly between the workers, and each worker prefetches the feeds
+        for its own games (see `Prefetch`), so its network calls for the later games overlap
+        with the processing of the earlier ones. The finished `GameStats` objects are sent back
+        without the raw X/Y feeds.
+        
+        Parameters
+        ----------
+        game_ids : list
+            The NHL game ids.
+        workers : int, optional
+            The number of worker processes. The default is None, which uses one per CPU.
+            With 1 worker, the games are run in this process (with their feeds prefetched).
+        timings : Timings, optional
+            Collects the timing records of every game (see `Timings`). The default is None.
+        
+        Returns
+        -------
+        list
+            The `GameStats` object of each game, in the order of `game_ids`.
+        
+        """
+        game_ids = [int(g) for g in game_ids]
+        workers  = min(workers or os.cpu_count() or 1, len(game_ids))
+        
+        if workers <= 1:
+            return RunGames(game_ids, timings)[0]
+        
+        # Every n-th game goes to the same worker (by position, so the results can be put
+        # back in order). Each worker records its own timings, which are collected once all
+        # of its games are done.
+        record = timings is not None and timings.enabled
+        worker_timings = Timings(memory=timings.memory) if record else None
+        shares = [list(range(k, len(game_ids), workers)) for k in range(workers)]
+        with ProcessPoolExecutor(workers) as pool:
+            results = pool.map(
+                RunGames, [[game_ids[p] for p in share] for share in shares],
+                [worker_timings] * workers
+            )
+            games = [None] * len(game_ids)
+            for share, (share_games, share_timings) in zip(shares, results):
+                for p, gs in zip(share, share_games):
+                    games[p] = gs
+                if record:
+                    for rec in share_timings.records:
+                        timings.add(rec)
+        
+        return games
+
+def RunGames(game_ids, timings=None):
+    """
+    Run `GameStats.All` for a list of games, with their feeds prefetched (the unit of work of
+    each worker in `GameStats.compute_many`).
+    
+    Returns the `GameStats` object of each game, and the `timings` they were recorded in.
+    """
+    Prefetch(game_ids, timings=timings)
+    
+    return [RunGame(game_id, timings) for game_id in game_ids], timings
+
+def RunGame(game_id, timings=None):
+    """Run `GameStats.All` for a game (see `RunGames`)."""
+    gs = GameStats(game_id, timings=timings)
+    gs.All()
+    
+    return gs
 
-game_id = 2021030111
-gs = GameStats(game_id)
-gs.All()
+# game_id = 2021030111
+# gs = GameStats(game_id)
+# gs.All()
@@ -13,7 +13,8 @@ from StatsTables import StatsTables
 from PuckPlot import PuckPlot
 from TeamStats import TeamStats
 from DataPanePost import DataPane
-from nhlstats import list_games
+from Schedule import GetSchedule, SeasonOf
+from Teams import GetTeams
 
 # Import the necessary standard modules
 import pandas as pd
@@ -49,16 +50,13 @@ class NightRecap:
         self.txtColor = '#FFFFFF' if template == 'plotly_dark' else '#000000'
         
         # Collect games played on the given date
-        Games_df = pd.DataFrame(
-            list_games(GameDay, GameDay)
-        )
+        Games_df = GetSchedule(SeasonOf(GameDay), refresh=True).OnDate(GameDay)
         Games_df = Games_df[~Games_df.game_state.isin(['Postponed', 'Scheduled', 'Pre-Game'])]
         GamesN = Games_df.shape[0]
         
         # Collect the team abbreviations and colors, and direction of attack for the relevant arena
-        # Collect team info provided in teamList.csv file in my github repo.
-        tLUrl = 'https://raw.githubusercontent.com/AmeriFinn/LiveNHLstats/master/teamList.csv'
-        tL = pd.read_csv(tLUrl, index_col=0)
+        # Collect team info provided in the teamList.csv file.
+        tL = GetTeams()
         
         self.Games_df = Games_df
         self.GamesN   = GamesN
@@ -80,6 +78,10 @@ class NightRecap:
         GameData   = []
         TeamData   = []
         GameColors = []
+        
+        # Collect the game stats for every game at once, spread across the available CPUs
+        GameStor = GameStats.compute_many(Games_df.game_id)
+        GameStor = dict(zip(Games_df.game_id, GameStor))
         for row in Games_df.index:
             # Collect the home and away team names
             Home    = Games_df.loc[row, 'home_team']
@@ -88,8 +90,8 @@ class NightRecap:
             print(f'{Away} @ {Home}\t| {game_id}')
             
             # Determine the Home and Away colors to be used
-            HCol = tL[tL.team_name == Home]['home_c'].values[0]
-            ACol = tL[tL.team_name == Away]['away_c'].values[0]
+            HCol = tL.Team(Home)['home_c']
+            ACol = tL.Team(Away)['away_c']
             GameTeams.append([Home, Away])
             GameColors.append([HCol, ACol])
             
@@ -116,8 +118,7 @@ class NightRecap:
             GameTitles.append('GSA by Player')
             
             # Collect the game stats
-            gs = GameStats(game_id)
-            gs.All()
+            gs = GameStor[game_id]
             GameData.append(gs)
             
             # Collect the team stats for the game
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+"""
+Local store of player info (name, jersey number, and position) keyed by the NHL player id.
+
+Player info is collected from, in order of preference:
+    
+    1. The plays feed that has already been collected for a game (names, ids, and the
+       position of goalies).
+    2. The roster of a game in the NHL API's live feed, which provides the jersey number
+       and position of every player dressed for the game in a single call.
+    3. The NHL API's page for an individual player, for anyone still missing.
+
+Collected info is saved to `Data/players.json` and reused until it is older than `max_age`
+seconds (jersey numbers and positions occasionally change).
+    
+    Players = GetPlayers()
+    Players.FromPlays(gs.plays)
+    Players.Lookup([8477492, 8480069], game_ids=[game_id])
+
+The name <-> id lookups for the players in a single game's plays df are built separately by
+`PlayerIndex`, which doesn't need the NHL API.
+    
+    index = PlayerIndex(gs.plays)
+    index.ids['Nathan MacKinnon']  # 8477492
+    index.names[8477492]           # 'Nathan MacKinnon'
+
+Created on Sun Oct 18 13:58:26 2026
+
+@author: grega
+"""
+import os
+import json
+import time
+import requests
+import pandas as pd
+from threading import Lock
+
+from nhlstats.apiclient import BASE_URL, LIVE_PLAYS_URL
+
+from FeedCache import Replace
+
+# The NHL API's page for an individual player
+PEOPLE_URL = BASE_URL + '/api/v1/people/{player_id}'
+
+# By default, collected player info is reused for 30 days
+MAX_AGE = 30 * 24 * 60 * 60
+
+class PlayerStore:
+    """
+    Player info keyed by player id, saved locally between runs.
+    
+    Parameters
+    ----------
+    path : str, optional
+        The JSON file the player info is saved in.
+        The default is None, which uses `Data/players.json` in the current working directory.
+    max_age : float, optional
+        The number of seconds a player's jersey number and position are reused for before
+        they are collected again. The default is 30 days.
+    
+    """
+    
+    def __init__(self, path=None, max_age=MAX_AGE):
+        self.path    = path or os.path.join(os.getcwd(), 'Data', 'players.json')
+        self.max_age = max_age
+        self.lock    = Lock()
+        
+        # Read the saved player info. Keys are the player ids as strings (JSON keys)
+        try:
+            with open(self.path, 'r') as f:
+                self.players = json.load(f)
+        except (OSError, ValueError):
+            self.players = dict()
+    
+    def Save(self):
+        """Save the player info (written in full before replacing the old version)."""
+        with self.lock:
+            players = dict(self.players)
+        
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        Replace(self.path, lambda f: json.dump(players, f), mode='w')
+    
+    def Update(self, player_id, fetched=None, **info):
+        """
+        Update the info for a player.
+        
+        Parameters
+        ----------
+        player_id : int
+            The NHL player id.
+        fetched : float, optional
+            The time the jersey number and position were collected from the NHL API.
+            The default is None, which leaves the current value unchanged.
+        **info
+            The player's `name`, `number`, and/or `position`. None values are ignored.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        with self.lock:
+            rec = self.players.setdefault(str(int(player_id)), dict())
+            rec.update({k: v for k, v in info.items() if v is not None})
+            if fetched is not None:
+                rec['fetched'] = fetched
+    
+    def FromPlays(self, plays):
+        """
+        Record the names and ids of the players in a game's plays df (and goalie positions).
+        
+        Parameters
+        ----------
+        plays : pd.DataFrame
+            The plays df (see `GameStats.plays`).
+        
+        Returns
+        -------
+        None.
+        
+        """
+        for i in range(1, 5):
+            if f'player_{i}_id' not in plays.columns:
+                continue
+            
+            cols = [f'player_{i}_id', f'player_{i}', f'player_{i}_type']
+            df   = plays[[c for c in cols if c in plays.columns]].dropna(subset=cols[:2])
+            df   = df.drop_duplicates(subset=cols[0])
+            for rec in df.to_dict('records'):
+                goalie = rec.get(f'player_{i}_type') == 'Goalie'
+                self.Update(
+                    rec[cols[0]],
+                    name     = rec[cols[1]],
+                    position = 'G' if goalie else None
+                )
+    
+    def IsFresh(self, player_id):
+        """Determine if a player's jersey number and position have been collected recently."""
+        rec = self.players.get(str(int(player_id)), dict())
+        return time.time() - rec.get('fetched', 0) <= self.max_age
+    
+    def FetchGame(self, game_id):
+        """
+        Collect the jersey number and position of every player dressed for a game.
+        
+        Parameters
+        ----------
+        game_id : int
+            The NHL game id.
+        
+        Returns
+        -------
+        int
+            The number of players collected.
+        
+        """
+        try:
+            resp    = requests.get(LIVE_PLAYS_URL.format(game_id=game_id), timeout=30)
+            players = resp.json()['gameData']['players']
+        except (requests.RequestException, ValueError, KeyError):
+            print(f'Game: {game_id}\nUnable to collect the roster from the NHL API\n')
+            return 0
+        
+        fetched = time.time()
+        for p in players.values():
+            self.Update(
+                p['id'],
+                fetched  = fetched,
+                name     = p.get('fullName'),
+                number   = p.get('primaryNumber', ''),
+                position = p.get('primaryPosition', {}).get('abbreviation', '')
+            )
+        
+        return len(players)
+    
+    def FetchPlayer(self, player_id):
+        """
+        Collect the jersey number and position of an individual player.
+        
+        Parameters
+        ----------
+        player_id : int
+            The NHL player id.
+        
+        Returns
+        -------
+        bool
+            True if the player's info was collected.
+        
+        """
+        try:
+            resp = requests.get(PEOPLE_URL.format(player_id=int(player_id)), timeout=30)
+            p    = resp.json()['people'][0]
+        except (requests.RequestException, ValueError, KeyError, IndexError):
+            print(f'Unable to collect info for player {player_id} from the NHL API\n')
+            return False
+        
+        self.Update(
+            player_id,
+            fetched  = time.time(),
+            name     = p.get('fullName'),
+            number   = p.get('primaryNumber', ''),
+            position = p.get('primaryPosition', {}).get('abbreviation', '')
+        )
+        
+        return True
+    
+    def Lookup(self, player_ids, game_ids=()):
+        """
+        Collect the info for a group of players, fetching only what is missing or stale.
+        
+        Players whose info is missing or stale are collected from the rosters of `game_ids`
+        (one call per game, in the order given, stopping once everyone has been found), and
+        then individually for any player that still hasn't been found.
+        
+        Parameters
+        ----------
+        player_ids : list
+            The NHL player ids.
+        game_ids : list, optional
+            Games the players played in (most useful first). The default is ().
+        
+        Returns
+        -------
+        pd.DataFrame
+            The 'Player', '#', and 'Pos.' of each player, indexed by player id.
+            Info that could not be collected is left as an empty string.
+        
+        """
+        player_ids = list(dict.fromkeys(int(p) for p in player_ids))
+        missing    = [p for p in player_ids if not self.IsFresh(p)]
+        fetched    = bool(missing)
+        
+        # Collect the rosters of the relevant games until everyone has been found
+        for game_id in game_ids:
+            if not missing:
+                break
+            if self.FetchGame(game_id):
+                missing = [p for p in missing if not self.IsFresh(p)]
+        
+        # Collect anyone left over individually
+        for player_id in missing:
+            self.FetchPlayer(player_id)
+        
+        if fetched:
+            self.Save()
+        
+        # Create the lookup table
+        recs = [self.players.get(str(p), dict()) for p in player_ids]
+        df   = pd.DataFrame(
+            {
+                'Player': [rec.get('name', '') for rec in recs],
+                '#':      [rec.get('number', '') for rec in recs],
+                'Pos.':   [rec.get('position', '') for rec in recs]
+            },
+            index = pd.Index(player_ids, name='ID')
+        )
+        
+        return df
+
+class PlayerIndex:
+    """
+    Name <-> id lookups for every player mentioned in a game's plays df.
+    
+    The lookups are built in one pass over the `player_i` / `player_i_id` column pairs, so
+    they can be reused for every player (and by everything that summarizes the game) instead
+    of searching the plays df for each player.
+    
+    Parameters
+    ----------
+    plays : pd.DataFrame
+        The plays df (see `GameStats.plays`).
+    
+    Attributes
+    ----------
+    ids : pd.Series
+        Each player's id, indexed by their name.
+    names : pd.Series
+        Each player's name, indexed by their id.
+    
+    """
+    
+    def __init__(self, plays):
+        # Stack the (name, id) pairs of each player column. The later player columns come
+        # first, so they take precedence if a name was recorded with more than one id
+        pairs = [
+            plays[[f'player_{i}', f'player_{i}_id']].set_axis(['name', 'id'], axis=1)
+            for i in range(4, 0, -1)
+            if f'player_{i}' in plays.columns and f'player_{i}_id' in plays.columns
+        ]
+        pairs = pd.concat(pairs, ignore_index=True) if pairs else \
+            pd.DataFrame(columns=['name', 'id'])
+        pairs = pairs.dropna()
+        pairs['id'] = pairs.id.astype(int)
+        
+        self.ids   = pairs.drop_duplicates(subset='name').set_index('name').id
+        self.names = pairs.drop_duplicates(subset='id').set_index('id').name
+    
+    def Missing(self, names):
+        """The names (in the order given) that are not in the index."""
+        return [name for name in names if name not in self.ids.index]
+
+# The player stores that have been loaded in this process
+_stores = dict()
+_stores_lock = Lock()
+
+def GetPlayers(path=None):
+    """
+    Return the player store, reading it from disk the first time it is requested.
+    
+    Parameters
+    ----------
+    path : str, optional
+        The JSON file the player info is saved in.
+        The default is None, which uses `Data/players.json` in the current working directory.
+    
+    Returns
+    -------
+    PlayerStore
+    
+    """
+    path = path or os.path.join(os.getcwd(), 'Data', 'players.json')
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = PlayerStore(path)
+        
+        return _stores[path]
@@ -14,7 +14,8 @@ from PuckPlot import PuckPlot
 from StatsTables import StatsTables
 from TeamStats import TeamStats
 from DataPanePost import DataPane
-from nhlstats import list_games
+from Schedule import GetSchedule
+from Teams import GetTeams
 
 # Import the necessary standard modules
 import pandas as pd
@@ -46,17 +47,15 @@ class PlayoffRecaps:
         self.publish      = publish
         
         # Identify the game day, as well as the home and away team for the game
-        Games = pd.DataFrame(
-            list_games(
-                start_date=f'{str(game_id)[:4]}-07-21',
-                end_date=dt.date.today() + dt.timedelta(days = 7)
-            )
-        )
-        Teams     = Games[Games.game_id == game_id]
-        GameDay   = Teams.date.iloc[0]
-        GameState = Teams.game_state.iloc[0]
-        Home = Teams.home_team.iloc[0]
-        Away = Teams.away_team.iloc[0]
+        Schedule  = GetSchedule(str(game_id)[:4], refresh=True)
+        Games     = Schedule.Games(end_date=dt.date.today() + dt.timedelta(days = 7))
+        Teams     = Schedule.Game(game_id)
+        if Teams is None:
+            raise ValueError(f'{game_id} is not a game in the NHL schedule')
+        GameDay   = Teams.date
+        GameState = Teams.game_state
+        Home = Teams.home_team
+        Away = Teams.away_team
         
         # Subset out all games played between the two teams in the regular season
         Season_Series = Games[
@@ -69,27 +68,23 @@ class PlayoffRecaps:
         Season_Series.reset_index(inplace = True, drop = True)
         
         # Collect the team abbreviations and colors, and direction of attack for the relevant arena
-        # Collect team info provided in teamList.csv file in my github repo.
-        tLUrl = 'https://raw.githubusercontent.com/AmeriFinn/LiveNHLstats/master/teamList.csv'
-        tL = pd.read_csv(tLUrl, index_col=0)
+        # Collect team info provided in the teamList.csv file.
+        Teams = GetTeams()
         
         # Collect team abbreviations recognized by the NHL
-        HomeAbrv = tL[tL.team_name == Home].team_abbrv.values[0]
-        AwayAbrv = tL[tL.team_name == Away].team_abbrv.values[0]
+        HomeAbrv = Teams.Abbrv(Home)
+        AwayAbrv = Teams.Abbrv(Away)
         
         # Collect the two primary colors (in Hex code format) listed in team logo copyright
-        Home_Color1 = tL[tL.team_abbrv == HomeAbrv].home_c.values[0]
-        Home_Color2 = tL[tL.team_abbrv == HomeAbrv].away_c.values[0]
-        
-        Away_Color1 = tL[tL.team_abbrv == AwayAbrv].away_c.values[0]
-        Away_Color2 = tL[tL.team_abbrv == AwayAbrv].home_c.values[0]
+        Home_Color1, Home_Color2 = Teams.Colors(HomeAbrv)
+        Away_Color2, Away_Color1 = Teams.Colors(AwayAbrv)
         
         # Determine if this teams arena records x/y stat data the "normal" way, or backwards.
         # Note: Some arenas are less consistent about x/y stat data.
         # Both within games (where goals/shots/hits/etc. aren't recorded properly by period)
         # or between games (where the home team will have 1st period stats recorded on
         # opposite ends of the rink). This is the best solution I have currently.
-        direct_of_attack = tL[tL.team_abbrv == HomeAbrv].normal_direct_of_play.values[0]
+        direct_of_attack = Teams.DirectOfPlay(HomeAbrv)
         
         # Assign class attributes
         self.season_key         = season_key
@@ -135,12 +130,10 @@ class PlayoffRecaps:
         Season_Series = Season_Series[['Game'] + [c for c in Season_Series.columns if c != 'Game']]
         
         # Collect stats for each game
-        game_stor = list()
+        game_stor = GameStats.compute_many(Season_Series.game_id)
         for i, game in enumerate(Season_Series.game_id):
             print(f'Gameid: {game}')
-            gs = GameStats(game, game_type = self.season_key)
-            gs.All()
-            game_stor.append(gs)
+            gs = game_stor[i]
             
             # Append shots and OT info to the season series table
             Season_Series.loc[i, 'home_shots'] = int(gs.SumStats['Game Total'][gs.HomeAbrv]['Shots'])
@@ -470,6 +463,6 @@ class PlayoffRecaps:
         self.PreviewFigure()
 
 # game_id = 2021030151
-game_id = 2021030231
-pp = PlayoffRecaps(game_id, series_recap = False, publish = False)
-pp.All()
+# game_id = 2021030231
+# pp = PlayoffRecaps(game_id, series_recap = False, publish = False)
+# pp.All()
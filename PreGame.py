@@ -18,7 +18,9 @@ from PuckPlot import PuckPlot
 from StatsTables import StatsTables
 # from TeamStats import TeamStats
 from DataPanePost import DataPane
-from nhlstats import list_games
+from Schedule import GetSchedule
+from Teams import GetTeams
+from SeasonSummary import GetSeasonSummary
 
 pd.set_option('display.max_rows', 500)
 pd.set_option('display.max_columns', 12)
@@ -37,40 +39,34 @@ class PreGameReport:
         self.publish      = publish
         
         # Identify the game day, as well as the home and away team for the game
-        Games = pd.DataFrame(
-            list_games(
-                start_date=f'{str(game_id)[:4]}-07-21',
-                end_date=dt.date.today()
-            )
-        )
-        Teams     = Games[Games.game_id == game_id]
-        GameDay   = Teams.date.iloc[0]
-        GameState = Teams.game_state.iloc[0]
-        Home = Teams.home_team.iloc[0]
-        Away = Teams.away_team.iloc[0]
+        Schedule  = GetSchedule(str(game_id)[:4], refresh=True)
+        Games     = Schedule.Games(end_date=dt.date.today())
+        Teams     = Schedule.Game(game_id)
+        if Teams is None:
+            raise ValueError(f'{game_id} is not a game in the NHL schedule')
+        GameDay   = Teams.date
+        GameState = Teams.game_state
+        Home = Teams.home_team
+        Away = Teams.away_team
         
         # Collect the team abbreviations and colors, and direction of attack for the relevant arena
-        # Collect team info provided in teamList.csv file in my github repo.
-        tLUrl = 'https://raw.githubusercontent.com/AmeriFinn/LiveNHLstats/master/teamList.csv'
-        tL = pd.read_csv(tLUrl, index_col=0)
+        # Collect team info provided in the teamList.csv file.
+        Teams = GetTeams()
         
         # Collect team abbreviations recognized by the NHL
-        HomeAbrv = tL[tL.team_name == Home].team_abbrv.values[0]
-        AwayAbrv = tL[tL.team_name == Away].team_abbrv.values[0]
+        HomeAbrv = Teams.Abbrv(Home)
+        AwayAbrv = Teams.Abbrv(Away)
         
         # Collect the two primary colors (in Hex code format) listed in team logo copyright
-        Home_Color1 = tL[tL.team_abbrv == HomeAbrv].home_c.values[0]
-        Home_Color2 = tL[tL.team_abbrv == HomeAbrv].away_c.values[0]
-        
-        Away_Color1 = tL[tL.team_abbrv == AwayAbrv].away_c.values[0]
-        Away_Color2 = tL[tL.team_abbrv == AwayAbrv].home_c.values[0]
+        Home_Color1, Home_Color2 = Teams.Colors(HomeAbrv)
+        Away_Color2, Away_Color1 = Teams.Colors(AwayAbrv)
         
         # Determine if this teams arena records x/y stat data the "normal" way, or backwards.
         # Note: Some arenas are less consistent about x/y stat data.
         # Both within games (where goals/shots/hits/etc. aren't recorded properly by period)
         # or between games (where the home team will have 1st period stats recorded on
         # opposite ends of the rink). This is the best solution I have currently.
-        direct_of_attack = tL[tL.team_abbrv == HomeAbrv].normal_direct_of_play.values[0]
+        direct_of_attack = Teams.DirectOfPlay(HomeAbrv)
         
         # Assign class attributes
         self.GameDay   = GameDay
@@ -120,21 +116,24 @@ class PreGameReport:
         ]
         print(f'GP in season series: {season_series_gp.shape[0]} of {season_series.shape[0]}')
         
-        # Collect the game stats for each game played so far by each team in the season
-        game_dict = dict()
-        play_dict = dict()
-        for game_id in both_team_games.game_id:
-            gs = GameStats(game_id)
-            gs.All()
-            game_dict[game_id] = gs
-            play_dict[game_id] = gs.plays
-            print(f'Processed: {game_id}')
+        # Collect the summary stats for each game played so far by each team in the season
+        # from the season summary index. Only the games missing from the index are run
+        # through GameStats (which saves the summary that the index is updated with).
+        Summary = GetSeasonSummary(str(game_id)[:4])
+        missing = both_team_games.game_id[~both_team_games.game_id.isin(Summary.Games().game_id)]
+        for gid, _ in zip(missing, GameStats.compute_many(missing)):
+            print(f'Processed: {gid}')
+        if len(missing) > 0:
+            Summary.Update()
+        
+        summaries = Summary.Games()
+        self.GameSummaries = summaries[summaries.game_id.isin(both_team_games.game_id)]
         
     def Report(self):
         
         GameStats = self.GameStats
 
-game_id = 2021020871
-pg = PreGameReport(game_id, publish=False)
-pg.Report()
-self = pg
+# game_id = 2021020871
+# pg = PreGameReport(game_id, publish=False)
+# pg.Report()
+# self = pg
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+Season schedule index shared by the recap/report classes.
+
+The schedule for a season is collected with one `list_games` call, saved locally to
+`Data/<season>/schedule.json`, and then kept in memory for the rest of the process.
+When it is refreshed (the first time it is requested, then whenever a recap asks), only the
+days that have been played (or are being played) and are not yet final are collected again. Games that were added to the NHL's schedule after it
+was saved (playoff games, rescheduled games, etc.) are collected by `Extend`, which is called
+when the saved schedule ends before today or a game id is not in the schedule.
+    
+    sched = GetSchedule(2021)
+    sched.Game(2021020221)      # The game's date, teams, scores, and state
+    sched.OnDate('2021-11-13')  # All games played on a day
+    sched.TeamGames('Colorado Avalanche')
+
+Created on Sun Oct 18 12:41:08 2026
+
+@author: grega
+"""
+import os
+import json
+import time
+import datetime as dt
+import pandas as pd
+from threading import Lock
+
+from nhlstats import list_games
+
+from FeedCache import Replace
+
+# Once a game reaches one of these states, its day of the schedule no longer needs refreshing
+SETTLED_STATES = ['Final', 'Postponed']
+
+# The columns provided by `list_games`
+COLUMNS = ['date', 'game_id', 'home_team', 'home_score', 'away_team', 'away_score',
+           'season', 'game_state']
+
+def SeasonOf(date):
+    """
+    Determine the season (the year it started in) that a date falls in.
+    
+    Parameters
+    ----------
+    date : str or datetime.date
+        The date ('YYYY-MM-DD').
+    
+    Returns
+    -------
+    int
+        The season, e.g. 2021 for the 2021-22 season.
+    
+    """
+    date = pd.Timestamp(date)
+    return date.year if (date.month, date.day) >= (7, 21) else date.year - 1
+
+class Schedule:
+    """
+    Schedule of every game in a season with O(1) lookups by game id, date, and team.
+    
+    Parameters
+    ----------
+    season : int
+        The season, e.g. 2021 for the 2021-22 season (the first 4 digits of a game id).
+    data_dir : str, optional
+        The directory the schedule is saved in.
+        The default is None, which uses `Data/<season>` in the current working directory.
+    
+    """
+    
+    def __init__(self, season, data_dir=None):
+        self.season   = int(season)
+        self.data_dir = data_dir or os.path.join(os.getcwd(), 'Data', str(self.season))
+        self.path     = os.path.join(self.data_dir, 'schedule.json')
+        self.start    = f'{self.season}-07-21'
+        self.end      = f'{self.season + 1}-07-20'
+        self.lock     = Lock()
+        self.checked  = 0
+        self.extended = 0
+        
+        # Read the saved schedule, or collect the full season if it has not been saved
+        try:
+            with open(self.path, 'r') as f:
+                games = json.load(f)
+        except (OSError, ValueError):
+            games = list(list_games(self.start, self.end))
+            self.Save(games)
+            self.checked = time.time()
+        
+        self.Index(games)
+    
+    def Index(self, games):
+        """Create the schedule df and the lookup tables for the list of games."""
+        games = pd.DataFrame(list(games), columns=COLUMNS)
+        games['date'] = games.date.astype(str).str.slice(0, 10)
+        games = games.sort_values(['date', 'game_id'], kind='stable').reset_index(drop=True)
+        
+        # Row number(s) of each game id, date, and team
+        self.games   = games
+        self.by_id   = {gid: i for i, gid in enumerate(games.game_id.tolist())}
+        self.by_date = games.groupby('date').indices
+        self.by_team = dict()
+        for col in ['home_team', 'away_team']:
+            for team, rows in games.groupby(col).indices.items():
+                self.by_team.setdefault(team, []).extend(rows.tolist())
+        self.by_team = {team: sorted(rows) for team, rows in self.by_team.items()}
+    
+    def Save(self, games):
+        """Save the list of games (written in full before replacing the old version)."""
+        os.makedirs(self.data_dir, exist_ok=True)
+        Replace(self.path, lambda f: json.dump(list(games), f, default=str), mode='w')
+    
+    def Merge(self, new, first, last):
+        """
+        Replace the days from `first` through `last` (and any of the games in `new`) with the
+        games in `new`, then re-index and save the schedule.
+        """
+        new   = pd.DataFrame(list(new), columns=COLUMNS)
+        new['date'] = new.date.astype(str).str.slice(0, 10)
+        games = self.games
+        keep  = ((games.date < first) | (games.date > last)) & ~games.game_id.isin(new.game_id)
+        games = pd.concat([games[keep], new], ignore_index=True)
+        
+        self.Index(games.to_dict('records'))
+        self.Save(self.games.to_dict('records'))
+    
+    def Extend(self, max_age=60, whole=False):
+        """
+        Collect the games from the last day in the saved schedule through the end of the season.
+        
+        Games that were added to the NHL's schedule after it was saved (e.g. playoff games or
+        rescheduled games) are only found this way.
+        
+        Parameters
+        ----------
+        max_age : float, optional
+            The number of seconds to wait between extensions. The default is 60.
+        whole : bool, optional
+            If True, collect the whole season again instead (a rescheduled game can be moved
+            to any day). The default is False.
+        
+        Returns
+        -------
+        bool
+            True if the schedule was collected again.
+        
+        """
+        with self.lock:
+            if time.time() - self.extended < max_age:
+                return False
+            self.extended = time.time()
+            
+            first = self.games.date.max() if self.games.shape[0] and not whole else self.start
+            self.Merge(list_games(first, self.end), first, self.end)
+            
+            return True
+    
+    def StaleDays(self, today=None):
+        """The days up to today that have games that have not reached a settled state."""
+        today = str(today or dt.date.today())
+        games = self.games
+        stale = (games.date <= today) & ~games.game_state.isin(SETTLED_STATES)
+        return sorted(games.date[stale].unique())
+    
+    def Refresh(self, today=None, max_age=60):
+        """
+        Collect the games for the days that are not yet final again.
+        
+        Parameters
+        ----------
+        today : str, optional
+            The current date. The default is None, which uses today's date.
+        max_age : float, optional
+            The number of seconds to wait between refreshes. The default is 60.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        today = str(today or dt.date.today())
+        with self.lock:
+            if time.time() - self.checked < max_age:
+                return
+            self.checked = time.time()
+            
+            days = self.StaleDays(today)
+            if days:
+                # Collect every day from the first stale day through the last one in one call,
+                # and replace those days in the schedule.
+                # (A postponed game is replaced once it is played on its new date)
+                self.Merge(list_games(days[0], days[-1]), days[0], days[-1])
+            
+            # Check for games added after the last day in the saved schedule
+            last = self.games.date.max() if self.games.shape[0] else self.start
+        
+        if last < today <= self.end:
+            self.Extend(max_age)
+    
+    def Game(self, game_id):
+        """
+        Return the schedule's row for a game as a pd.Series (None if it isn't scheduled).
+        
+        If the game isn't in the saved schedule, the whole season is collected again (see
+        `Extend`) before giving up, since the game may have been added to the NHL's schedule
+        since it was saved.
+        """
+        row = self.by_id.get(int(game_id))
+        if row is None and self.Extend(whole=True):
+            row = self.by_id.get(int(game_id))
+        return None if row is None else self.games.iloc[row]
+    
+    def Games(self, end_date=None):
+        """Return every game scheduled through `end_date` (the default is the whole season)."""
+        if end_date is None:
+            return self.games.copy()
+        return self.games[self.games.date <= str(end_date)[:10]].copy()
+    
+    def OnDate(self, date):
+        """Return every game scheduled on a date."""
+        return self.games.iloc[self.by_date.get(str(date)[:10], [])].copy()
+    
+    def TeamGames(self, team):
+        """Return every game scheduled for a team (the full team name)."""
+        return self.games.iloc[self.by_team.get(team, [])].copy()
+
+# The schedules that have been loaded in this process
+_schedules = dict()
+_schedules_lock = Lock()
+
+def GetSchedule(season, refresh=False):
+    """
+    Return the season's schedule, loading (and refreshing) it the first time it is requested
+    in the process.
+    
+    After that, the schedule is only refreshed when asked to, so every `GameStats` of a batch
+    (or worker process) shares one refresh. A game missing from the schedule is still looked
+    up again by `Schedule.Game`.
+    
+    Parameters
+    ----------
+    season : int or str
+        The season, e.g. 2021 (the first 4 digits of a game id).
+    refresh : bool, optional
+        If True, refresh the days of the schedule that are not final yet even if the schedule
+        has already been loaded (at most once every 60 seconds, see `Schedule.Refresh`).
+        The default is False.
+    
+    Returns
+    -------
+    Schedule
+    
+    """
+    season = int(season)
+    with _schedules_lock:
+        loaded = season in _schedules
+        if not loaded:
+            _schedules[season] = Schedule(season)
+        sched = _schedules[season]
+    
+    if refresh or not loaded:
+        sched.Refresh()
+    
+    return sched
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Season summary index: one row per game with the summary stats (`GameStats.DataDict`) that
+`GameStats.All` saves to each game's `summary_data.bin` file.
+
+The index is saved as a columnar table in `Data/<season>/season_summary.npz` (see
+`Artifacts.SaveTable`). Each time it is requested, only the games whose `summary_data.bin`
+file is new or has changed since the last update are read, so questions like "how has a team
+done over its last 10 games" can be answered without opening every game's files or running
+`GameStats` again.
+    
+    Summary = GetSeasonSummary(2021)
+    Summary.Games(team='COL', start='2021-11-01', end='2021-11-30')
+    Summary.LastN('COL', 10, before='2021-12-02')
+    Summary.Record('COL', n=10)  # (wins, losses, OT losses)
+
+Created on Sun Oct 18 16:05:31 2026
+
+@author: grega
+"""
+import os
+import pickle
+import numpy as np
+import pandas as pd
+from threading import Lock
+
+from Artifacts import SaveTable, ReadTable
+from FeedCache import ReadMeta
+from Teams import GetTeams
+
+class SeasonSummary:
+    """
+    Summary stats of every game in a season that `GameStats.All` has been run for.
+    
+    Parameters
+    ----------
+    season : int
+        The season, e.g. 2021 for the 2021-22 season (the first 4 digits of a game id).
+    data_dir : str, optional
+        The season's data directory.
+        The default is None, which uses `Data/<season>` in the current working directory.
+    
+    """
+    
+    def __init__(self, season, data_dir=None):
+        self.season   = int(season)
+        self.data_dir = data_dir or os.path.join(os.getcwd(), 'Data', str(self.season))
+        self.path     = os.path.join(self.data_dir, 'season_summary.npz')
+        self.lock     = Lock()
+        
+        # Read the saved index (created by the first update if it has not been saved)
+        try:
+            self.games = ReadTable(self.path)
+        except (OSError, ValueError, KeyError):
+            self.games = None
+    
+    def Update(self):
+        """
+        Add (or replace) the games whose `summary_data.bin` file is new or has changed.
+        
+        Returns
+        -------
+        int
+            The number of games that were added or replaced.
+        
+        """
+        with self.lock:
+            games = self.games
+            seen  = dict() if games is None else dict(zip(games.game_id, games.mtime))
+            
+            if not os.path.isdir(self.data_dir):
+                return 0
+            
+            rows = []
+            with os.scandir(self.data_dir) as it:
+                for entry in it:
+                    if not (entry.is_dir() and entry.name.isdigit()):
+                        continue
+                    
+                    path = os.path.join(entry.path, 'summary_data.bin')
+                    try:
+                        mtime = os.stat(path).st_mtime
+                    except OSError:
+                        continue
+                    
+                    game_id = int(entry.name)
+                    if seen.get(game_id) == mtime:
+                        continue
+                    
+                    with open(path, 'rb') as f:
+                        DataDict = pickle.load(f)
+                    meta = ReadMeta(entry.path) or dict()
+                    rows.append(
+                        dict(game_id=game_id, game_state=meta.get('game_state'), mtime=mtime,
+                             **DataDict)
+                    )
+            
+            if not rows:
+                return 0
+            
+            new = pd.DataFrame(rows)
+            new['GameDay'] = new.GameDay.astype(str).str.slice(0, 10)
+            if games is not None:
+                new = pd.concat([games[~games.game_id.isin(new.game_id)], new], ignore_index=True)
+            
+            new = new.sort_values(['GameDay', 'game_id'], kind='stable').reset_index(drop=True)
+            self.games = new
+            SaveTable(self.path, new)
+            
+            return len(rows)
+    
+    def Games(self, team=None, start=None, end=None, game_type=None, final=True):
+        """
+        Filter the games in the index.
+        
+        Parameters
+        ----------
+        team : str, optional
+            Only include a team's games (the full team name or abbreviation).
+            The default is None.
+        start : str, optional
+            Only include games on or after this date ('YYYY-MM-DD'). The default is None.
+        end : str, optional
+            Only include games on or before this date ('YYYY-MM-DD'). The default is None.
+        game_type : str, optional
+            Only include 'Pre-Season', 'Regular Season', or 'Post-Season' games.
+            The default is None.
+        final : bool, optional
+            Only include games that are final. The default is True.
+        
+        Returns
+        -------
+        pd.DataFrame
+            The summary stats of the games, ordered by date.
+        
+        """
+        games = self.games
+        if games is None:
+            return pd.DataFrame(columns=['game_id', 'game_state', 'mtime', 'GameDay'])
+        
+        keep = np.ones(games.shape[0], dtype=bool)
+        if team is not None:
+            team  = GetTeams().Abbrv(team)
+            keep &= ((games.HomeAbrv == team) | (games.AwayAbrv == team)).to_numpy()
+        if start is not None:
+            keep &= (games.GameDay >= str(start)[:10]).to_numpy()
+        if end is not None:
+            keep &= (games.GameDay <= str(end)[:10]).to_numpy()
+        if game_type is not None:
+            keep &= (games.GameType == game_type).to_numpy()
+        if final:
+            keep &= (games.game_state == 'Final').to_numpy()
+        
+        return games[keep]
+    
+    def LastN(self, team, n, before=None, game_type='Regular Season'):
+        """
+        Collect a team's last `n` final games.
+        
+        Parameters
+        ----------
+        team : str
+            The full team name or abbreviation.
+        n : int
+            The number of games (None includes every game).
+        before : str, optional
+            Only include games played before this date ('YYYY-MM-DD').
+            The default is None, which includes every game played so far.
+        game_type : str, optional
+            The type of games to include. The default is 'Regular Season'.
+        
+        Returns
+        -------
+        pd.DataFrame
+        
+        """
+        games = self.Games(team=team, game_type=game_type)
+        if before is not None:
+            games = games[games.GameDay < str(before)[:10]]
+        
+        return games if n is None else games.tail(n)
+    
+    def Record(self, team, n=None, before=None, game_type='Regular Season'):
+        """
+        Determine a team's record (over its last `n` games, or the whole season).
+        
+        Returns
+        -------
+        tuple
+            The team's (wins, losses, OT losses). Only regular season games that went to
+            OT or a shootout count as OT losses.
+        
+        """
+        team  = GetTeams().Abbrv(team)
+        games = self.LastN(team, n, before, game_type)
+        if games.empty:
+            return 0, 0, 0
+        
+        won   = (games.Winner == team).to_numpy()
+        OT    = games.WentToOT.astype(bool) | games.WentToSO.astype(bool)
+        OT    = (OT & (games.GameType == 'Regular Season')).to_numpy()
+        
+        return int(won.sum()), int((~won & ~OT).sum()), int((~won & OT).sum())
+
+# The season summaries that have been loaded in this process
+_summaries = dict()
+_summaries_lock = Lock()
+
+def GetSeasonSummary(season, update=True):
+    """
+    Return the season's summary index, reading it the first time it is requested.
+    
+    Parameters
+    ----------
+    season : int or str
+        The season, e.g. 2021 (the first 4 digits of a game id).
+    update : bool, optional
+        If True, add the games that have been summarized since the last update.
+        The default is True.
+    
+    Returns
+    -------
+    SeasonSummary
+    
+    """
+    season = int(season)
+    with _summaries_lock:
+        if season not in _summaries:
+            _summaries[season] = SeasonSummary(season)
+        summary = _summaries[season]
+    
+    if update:
+        summary.Update()
+    
+    return summary
@@ -8,6 +8,7 @@ Created on Thu Dec  2 22:12:42 2021
 from GameStats import GameStats
 from FigureFrames import FigureFrames
 from nhlstats import list_games
+from Teams import GetTeams
 
 import pandas as pd
 import datetime as dt
@@ -36,12 +37,10 @@ class NHLstandings:
         self.raw_standings = api_standings
         
         # Read in standard tL
-        tLUrl = 'https://raw.githubusercontent.com/AmeriFinn/LiveNHLstats/master/teamList.csv'
-        tL = pd.read_csv(tLUrl, index_col=0)
-        self.tL = tL
+        self.tL = GetTeams()
         
     def Full_to_Abbrv(self, tL, team):
-        return tL.loc[tL.team_name == team, 'team_abbrv'].values[0]
+        return tL.Abbrv(team)
     
     def collect(self):
         
@@ -9,6 +9,7 @@ Created on Sun Aug  8 13:31:12 2021
 @author: grega
 """
 import pandas as pd
+from Teams import GetTeams
 import plotly.graph_objects as go
 from PIL import ImageColor as IC  # For converting hex color codes to RGB codes
 
@@ -33,20 +34,13 @@ class StatsTables:
         # First load in the full df of team names and colors
         Home  = gs.HomeAbrv
         Away  = gs.AwayAbrv
-        tLUrl = 'https://raw.githubusercontent.com/AmeriFinn/LiveNHLstats/master/teamList.csv'
-        tL = pd.read_csv(tLUrl, index_col=0)
+        Teams = GetTeams()
         
-        HomeCols = tL[tL.team_abbrv == Home][['home_c', 'away_c']]
-        if HCol == HomeCols['home_c'].values[0]:
-            HCol_text = HomeCols['away_c'].values[0]
-        else:
-            HCol_text = HomeCols['home_c'].values[0]
+        Home_c, Away_c = Teams.Colors(Home)
+        HCol_text = Away_c if HCol == Home_c else Home_c
             
-        AwayCols = tL[tL.team_abbrv == Away][['home_c', 'away_c']]
-        if ACol == AwayCols['home_c'].values[0]:
-            ACol_text = AwayCols['away_c'].values[0]
-        else:
-            ACol_text = AwayCols['home_c'].values[0]
+        Home_c, Away_c = Teams.Colors(Away)
+        ACol_text = Away_c if ACol == Home_c else Home_c
         
         self.HCol_text = HCol_text
         self.ACol_text = ACol_text
@@ -6,29 +6,38 @@ Created on Sun Nov 14 17:35:37 2021
 """
 # Import necessary modules
 import os
+import json
 import pickle
+import numpy as np
 import pandas as pd
 from math import floor
 from datetime import *
-import requests, re
 from datetime import datetime
 
 # import nhlstats
-from nhlstats import list_plays, list_shots, list_games, list_shifts
+from nhlstats import list_games
 
 from GameStats import GameStats
+from Teams import GetTeams
+from Players import GetPlayers, PlayerIndex
+from Artifacts import SaveTable, ReadTable, Replace
+from FeedCache import GameDir, ReadMeta
 
 # Adjust pandas display options for working with IPython consoles
 pd.set_option('display.max_rows', 500)
 pd.set_option('display.max_columns', 20)
 pd.set_option('display.width', 1500)
 
+# Increment whenever the player stats `Summarize_Game` creates for each game change, so games
+# saved by an older version in a `SeasonPlayers` table are summarized again
+SEASON_PLAYERS_VERSION = 1
+
 class TeamStats:
     """Calculate player stats (G, A, SA, Hits, etc.) for an individual game or entire season."""
     
     def PuckPlot_Points(gs):
         """
-        Create a summary df of points in an individual game.
+        Create a summary df of points in an individual game (or a group of games).
         
         The summary df can then be manipulated to visualize points in the puck plots / sunburst
         charts used in the game recap visualizations.
@@ -37,6 +46,8 @@ class TeamStats:
         ----------
         gs : Gamestats.Gamestats
             The Gamestats class that has been fully executed and has the necessary attributes.
+            Only the `plays` attribute is used, which can also be the concatenated plays of
+            several games.
 
         Returns
         -------
@@ -44,43 +55,208 @@ class TeamStats:
             The aggregated pandas dataframe.
 
         """
-        # Collect and refine the relevant data
-        plays = gs.plays.copy()
-        plays = plays[plays.event_type == 'GOAL']
-        plays.reset_index(drop=True, inplace=True)
-        cols  = ['team_for', 'period'] + \
-                [f'player_{i}' for i in range(1, 4)] + \
-                [f'player_{i}_type' for i in range(1, 4)]
-        plays = plays[[c for c in cols if c in plays.columns]]
-        plays['count'] = 1
+        # Collect the goals. Each goal is numbered by its position (rather than the index),
+        # so the plays of several games can be concatenated together (e.g. a playoff series)
+        goals = gs.plays[gs.plays.event_type == 'GOAL']
+        ptype_dict = {'player_1': 'GOAL', 'player_2': 'PRIMARY A', 'player_3': 'SECONDARY A'}
+        ptype_dict = {col: ptype for col, ptype in ptype_dict.items() if col in goals.columns}
+        plays = goals[['team_for', 'period'] + list(ptype_dict)].reset_index(drop=True)
+        plays['goal'] = np.arange(plays.shape[0])
         
         # Filter out any instances of a goalie being mentioned
-        for i in plays.index:
-            for j in [2, 3]:
-                if plays.loc[i, f'player_{j}_type'] == 'Goalie':
-                    plays.loc[i, f'player_{j}_type'] = None
-                    plays.loc[i, f'player_{j}'] = None
-        plays = plays[[col for col in plays.columns if 'type' not in col]]
-        
-        # Pivot the table so that each goal and assist has its own row
-        ptype_dict = {1: 'GOAL', 2: 'PRIMARY A', 3: 'SECONDARY A'}
-        df_dict    = dict()
-        x = 0
-        for i in plays.index:
-            team_for, period = plays.loc[i, ['team_for', 'period']]
-            for j in [1, 2, 3]:
-                if plays.loc[i, f'player_{j}'] is not None:
-                    event_type = ptype_dict[j]
-                    player     = plays.loc[i, f'player_{j}']
-                    stor_lst   = [team_for, period, event_type, player]
-                    df_dict[x] = stor_lst
-                    x += 1
-        
-        points = pd.DataFrame.from_dict(df_dict, orient = 'index')
-        points.columns = ['team_for', 'period', 'event_type', 'player']
+        for col in list(ptype_dict)[1:]:
+            if f'{col}_type' in goals.columns:
+                plays[col] = plays[col].mask((goals[f'{col}_type'] == 'Goalie').to_numpy())
+        
+        # Melt the table so that each goal and assist has its own row, ordered by goal and
+        # then by the goal scorer, primary assist, and secondary assist
+        points = plays.melt(
+            id_vars    = ['goal', 'team_for', 'period'],
+            value_vars = list(ptype_dict),
+            var_name   = 'event_type',
+            value_name = 'player'
+        )
+        points = points[points.player.notna()].sort_values('goal', kind='stable')
+        points['event_type'] = points.event_type.map(ptype_dict)
+        points = points[['team_for', 'period', 'event_type', 'player']].reset_index(drop=True)
         
         return points
         
+    def Clock_Seconds(clock):
+        """Convert a series of 'MM:SS' times (or durations) into seconds (missing values are NaN)."""
+        clock = clock.str.extract(r'(\d+):(\d+)').astype(float)
+        return 60 * clock[0] + clock[1]
+    
+    def Strength_TOI(plays, shift, teams):
+        """
+        Split each players TOI into even strength (EV), power play (PP), and penalty kill (PK).
+        
+        The strength of each team is taken from the `Men On Ice` columns that
+        `GameStats.MenOnIce` adds to the plays df. Those columns only change at the plays, so
+        the game is divided into intervals of constant strength, and the seconds of each
+        strength are accumulated at the start of every interval. The seconds a shift spends at
+        each strength are then the difference of the accumulated seconds at the end and the
+        start of the shift, which is computed for every shift at once.
+        
+        Parameters
+        ----------
+        plays : pd.DataFrame
+            The plays df (see `GameStats.plays`), with the `elapsed_s` and
+            `<team> Men On Ice` columns.
+        
+        shift : pd.DataFrame
+            The shift df, with each players full name in a `player` column.
+        
+        teams : list
+            The abbreviations of the two teams in the game.
+
+        Returns
+        -------
+        pd.DataFrame
+            The seconds each player spent on the ice at 'EV', 'PP', and 'PK' (from their teams
+            perspective), indexed by player name. Shifts with a missing start, end, or duration
+            are not included (the same as the TOI in `Box_Score`).
+
+        """
+        Team1, Team2 = teams
+        
+        # The strength at the start of each interval (the state after the last play in a second)
+        state = plays[['elapsed_s', f'{Team1} Men On Ice', f'{Team2} Men On Ice']]
+        state = state.drop_duplicates(subset='elapsed_s', keep='last')
+        start = state.elapsed_s.to_numpy(dtype=np.int64)
+        diff  = np.sign(
+            state[f'{Team1} Men On Ice'].to_numpy() - state[f'{Team2} Men On Ice'].to_numpy()
+        )
+        
+        # Both teams are at even strength until the first play
+        if start.size == 0 or start[0] > 0:
+            start, diff = np.r_[0, start], np.r_[0, diff]
+        
+        # Collect the game time (in seconds) each shift starts and ends
+        shift  = shift.dropna(subset=['duration'])
+        offset = 1200 * (shift.period.astype(int) - 1)
+        on     = (offset + TeamStats.Clock_Seconds(shift.start_time)).to_numpy()
+        off    = (offset + TeamStats.Clock_Seconds(shift.end_time)).to_numpy()
+        valid  = ~(np.isnan(on) | np.isnan(off))
+        on, off, shift = on[valid], off[valid], shift[valid]
+        
+        # The interval each shift starts and ends in
+        on_k  = np.searchsorted(start, on, side='right') - 1
+        off_k = np.searchsorted(start, off, side='right') - 1
+        
+        # The seconds `Team1` spent at each strength (1 = PP, -1 = PK, 0 = EV) before each
+        # interval, and then in each shift
+        length = np.diff(start, append=start[-1])
+        splits = dict()
+        for name, sign in zip(['EV', 'PP', 'PK'], [0, 1, -1]):
+            at    = diff == sign
+            accum = np.r_[0, np.cumsum(length * at)[:-1]]
+            splits[name] = (accum[off_k] + (off - start[off_k]) * at[off_k]) - \
+                           (accum[on_k] + (on - start[on_k]) * at[on_k])
+        
+        # A power play for `Team1` is a penalty kill for `Team2`
+        splits = pd.DataFrame(splits, index=shift.index)
+        second = (shift.team_abbreviation == Team2).to_numpy()
+        splits.loc[second, ['PP', 'PK']] = splits.loc[second, ['PK', 'PP']].to_numpy()
+        
+        return splits.groupby(shift.player.to_numpy()).sum()
+    
+    def Box_Score(plays, shift, teams):
+        """
+        Count each players G, 1A, 2A, P, S, SA, H, TA, GA, TOI, PPG, and SHG in a game.
+        
+        Rather than filtering `plays` for every player and stat, the player columns
+        (`player_1` to `player_4`) are stacked into a long table with one row for each player
+        mentioned in a play, along with their role (the player column they were in).
+        Each stat is then a flag on those rows, and a single groupby by player counts every
+        stat at once. TOI is summed from the `shift` df with one more groupby, and split by
+        strength with `Strength_TOI`.
+        
+        Parameters
+        ----------
+        plays : pd.DataFrame
+            The plays df (see `GameStats.plays`).
+        
+        shift : pd.DataFrame
+            The shift df, with each players full name in a `player` column.
+        
+        teams : list
+            The abbreviations of the two teams in the game.
+
+        Returns
+        -------
+        box : dict
+            Each teams box score (indexed by player name), by team abbreviation. TOI is in
+            seconds, and split into the seconds at 'EV TOI', 'PP TOI', and 'PK TOI'.
+            Assists, PPG, and SHG only count for the team the player is on, so the box scores
+            include every player, and need to be refined to the players on the team.
+
+        """
+        # Stack the player columns into a long table of (player, role) rows
+        cols = ['event_type', 'team_for'] + \
+               [f'{team} {flag}' for team in teams for flag in ['is_ppg', 'is_shg']]
+        long = []
+        for i in range(1, 5):
+            if f'player_{i}' in plays.columns:
+                temp = plays[cols + [f'player_{i}']].rename(columns={f'player_{i}': 'player'})
+                temp['role'] = i
+                long.append(temp)
+        long = pd.concat(long, ignore_index=True)
+        long = long[long.player.notna()]
+        
+        # Flag the stats each row counts towards
+        event = long.event_type
+        first = long.role == 1
+        goal  = first & (event == 'GOAL')
+        flags = pd.DataFrame({
+            'G':  goal,
+            'S':  first & event.isin(['GOAL', 'SHOT']),
+            'SA': (first & event.isin(['GOAL', 'SHOT', 'MISSED_SHOT'])) |
+                  ((long.role == 2) & (event == 'BLOCKED_SHOT')),
+            'H':  first & (event == 'HIT'),
+            'TA': first & (event == 'TAKEAWAY'),
+            'GA': first & (event == 'GIVEAWAY')
+        })
+        for team in teams:
+            scored = (event == 'GOAL') & (long.team_for == team)
+            flags[f'{team} 1A']  = scored & (long.role == 2)
+            flags[f'{team} 2A']  = scored & (long.role == 3)
+            flags[f'{team} PPG'] = goal & (long[f'{team} is_ppg'] == True)
+            flags[f'{team} SHG'] = goal & (long[f'{team} is_shg'] == True)
+        
+        # Count every stat for every player at once
+        counts = flags.groupby(long.player.to_numpy()).sum()
+        
+        # Sum the duration of each players shifts (parsed into seconds once for every shift)
+        temp = shift.dropna(subset=['duration'])
+        TOI  = TeamStats.Clock_Seconds(temp.duration).groupby(temp.player.to_numpy()).sum()
+        
+        # Split each players TOI by strength (if the men on ice have been collected)
+        if all(f'{team} Men On Ice' in plays.columns for team in teams):
+            splits = TeamStats.Strength_TOI(plays, shift, teams)
+        else:
+            splits = pd.DataFrame(columns=['EV', 'PP', 'PK'], dtype=float)
+        
+        # Create the box score for each team
+        box = dict()
+        for team in teams:
+            df = pd.DataFrame(index=counts.index.union(TOI.index))
+            df['G']   = counts.G
+            df['1A']  = counts[f'{team} 1A']
+            df['2A']  = counts[f'{team} 2A']
+            df['P']   = df.G + df['1A'] + df['2A']
+            for col in ['S', 'SA', 'H', 'TA', 'GA']:
+                df[col] = counts[col]
+            df        = df.fillna(0).astype(int)
+            df['TOI'] = TOI.reindex(df.index, fill_value=0.0)
+            df['PPG'] = counts[f'{team} PPG'].reindex(df.index, fill_value=0).astype(int)
+            df['SHG'] = counts[f'{team} SHG'].reindex(df.index, fill_value=0).astype(int)
+            for col in ['EV', 'PP', 'PK']:
+                df[f'{col} TOI'] = splits[col].reindex(df.index, fill_value=0.0)
+            box[team] = df
+        
+        return box
+    
     def Summarize_Game(self, game_id, gs, ping_nhl=True):
         """
         Summarize stats for all players on both teams that had at least 1 shift.
@@ -106,10 +282,18 @@ class TeamStats:
         -------
         None.
         
+        Any players in the shift df that could not be matched to an id in the plays df are
+        left out of the summary tables, and listed (by 'game_id', 'Team', and 'Player') in
+        the `unidentified` attribute.
+        
+        Each players TOI split into even strength, power play, and penalty kill time is
+        saved in the `TOI_splits` attribute (a df for each team, in the same order and
+        format as the summary tables).
+        
         """
         # Collect relevant stats for the game
         plays = gs.plays.copy()
-        shift = pd.DataFrame(list_shifts(game_id))
+        shift = gs.shift.copy()
         
         # Define the columns that will be displayed in the dataframe
         df_cols = [
@@ -136,28 +320,19 @@ class TeamStats:
             self.plays = plays
             self.shift = shift
             
-            # Create a dictionary of player ids
-            players_lst  = list(shift.player.unique())
-            players_dict = {}
-            for player in players_lst:
-                
-                for i in range(1, 5):
-                    if f'player_{i}' in plays.columns:
-                        if player in plays[f'player_{i}'].unique():
-                            players_dict[player] = int(
-                                plays[plays[f'player_{i}'] == player][f'player_{i}_id'].values[0]
-                            )
-                    
-            # Print a list of any players who did not have a player_id identified
-            print_lst = []
-            if len(players_dict) != len(players_lst):
-                
-                # Notify users of unidentified players
-                print_lst = [p for p in players_lst if p not in players_dict.keys()]
-                print(f'Game: {game_id}\nPlayers with no id identified:\n\t', print_lst[0])
-                for i in print_lst[1:]:
-                    print('\t', i)
-                print('\n')
+            # Index the player ids by name (in one pass over the plays df)
+            self.players = PlayerIndex(plays)
+            players_ids  = self.players.ids
+            
+            # Record any players who did not have a player_id identified
+            unidentified = shift[['team_abbreviation', 'player']].drop_duplicates(subset='player')
+            unidentified = unidentified[unidentified.player.isin(
+                self.players.Missing(unidentified.player)
+            )]
+            unidentified.columns = ['Team', 'Player']
+            unidentified.insert(0, 'game_id', game_id)
+            self.unidentified = unidentified.reset_index(drop=True)
+            print_lst = list(unidentified.Player)
             
             # Create a storage df of player stats for each team
             Team1 = shift.team_abbreviation.unique()[0]
@@ -167,7 +342,7 @@ class TeamStats:
             )
             Team1_df['Player'] = shift[shift.team_abbreviation == Team1]['player'].unique()
             Team1_df = Team1_df[~Team1_df.Player.isin(print_lst)]  # Drop unidentified players
-            Team1_df['ID'] = Team1_df.Player.apply(lambda x: players_dict[x])
+            Team1_df['ID'] = Team1_df.Player.map(players_ids)
             
             Team2 = shift.team_abbreviation.unique()[1]
             Team2_df = pd.DataFrame(
@@ -176,164 +351,64 @@ class TeamStats:
             )
             Team2_df['Player'] = shift[shift.team_abbreviation == Team2]['player'].unique()
             Team2_df = Team2_df[~Team2_df.Player.isin(print_lst)]  # Drop unidentified players
-            Team2_df['ID'] = Team2_df.Player.apply(lambda x: players_dict[x])
+            Team2_df['ID'] = Team2_df.Player.map(players_ids)
             
             if ping_nhl:
-                # Collect each players jersey number and position
-                NHL_url = 'https://www.nhl.com/player/'
+                # Collect each players jersey number and position from the local player
+                # store. The game's roster is only collected from the NHL API if a player's
+                # info is missing or stale.
+                Players = GetPlayers()
+                Players.FromPlays(plays)
+                info = Players.Lookup(
+                    pd.concat([Team1_df.ID, Team2_df.ID]), game_ids=[game_id]
+                )
                 for df in [Team1_df, Team2_df]:
-                    for i in df.index:
-                        
-                        # Determine the appropriate NHL url to ping
-                        player = df.loc[i, 'Player']
-                        player = player.replace(' ', '-').lower()
-                        ID     = df.loc[i, 'ID']
-                        player_url = NHL_url + player + '-' + str(ID)
-                        
-                        # Collect the relevant info for the player
-                        page = requests.get(player_url).text
-                        page = page.replace('\n', '..')
-                        
-                        # Determine the players jersey number
-                        search_me = r'<h3 class="player-jumbotron-vitals__name-num">.*?</h3>'
-                        info = re.search(search_me, page).group(0)
-                        
-                        info = re.sub('<.*?>| {1,}|\.{1,}|#', ' ', info)
-                        try:
-                            jersey = info.split('|')[1].strip()
-                        except IndexError:
-                            jersey = ''
-                        df.loc[i, '#'] = jersey
-                        
-                        # Determine the players position
-                        search_me = r'<div class="player-jumbotron-vitals__attributes">.*?</div>'
-                        info = re.search(search_me, page).group(0)
-                        
-                        info = re.sub('<.*?>| {1,}|\.{1,}', ' ', info)
-                        position = info.split('|')[0].strip()
-                        df.loc[i, 'Pos.'] = position
+                    df['#']    = df.ID.map(info['#'])
+                    df['Pos.'] = df.ID.map(info['Pos.'])
                     
-            # Now get into collecting player specific stats
+            # Count every players stats (for both teams) at once
+            box = TeamStats.Box_Score(plays, shift, [Team1, Team2])
+            toi_cols = ['TOI', 'EV TOI', 'PP TOI', 'PK TOI']
             for team, df in zip([Team1, Team2], [Team1_df, Team2_df]):
-                for i in df.index:
-                    
-                    # Determine which player stats are being recorded for
-                    player = df.loc[i, 'Player']
-                    player_id = df.loc[i, 'ID']
-                    
-                    ### Goals Calculation
-                    temp = plays[
-                        (plays.player_1 == player) & (plays.event_type == 'GOAL')
-                    ]
-                    goals = temp.shape[0]
-                    df.loc[i, 'G'] = goals
-                    
-                    ### Primary Assists Calculation
-                    temp = plays[
-                        (plays.player_2 == player) &
-                        (plays.event_type == 'GOAL') &
-                        (plays.team_for == team)
-                    ]
-                    primaries = temp.shape[0]
-                    df.loc[i, '1A'] = primaries
-                    
-                    ### Secondary Assists Calculation
-                    if 'player_3' in plays.columns:
-                        temp = plays[
-                            (plays.player_3 == player) &
-                            (plays.event_type == 'GOAL') &
-                            (plays.team_for == team)
-                        ]
-                        secondaries = temp.shape[0]
-                    else:
-                        secondaries = 0
-                    df.loc[i, '2A'] = secondaries
-                    
-                    ### Points Calculation
-                    df.loc[i, 'P'] = goals + primaries + secondaries
-                    
-                    ### +/- Calculation
-                    # Really not sure how to go about this yet...
-                    
-                    ### Shots Calculation
-                    temp = plays[
-                        (plays.player_1 == player) & (plays.event_type == 'SHOT')
-                    ]
-                    shots = goals + temp.shape[0]
-                    df.loc[i, 'S'] = shots
-                    
-                    ### Shot Attempts Calculation
-                    temp = plays[
-                        ((plays.player_1 == player) & (plays.event_type == 'MISSED_SHOT')) |
-                        ((plays.player_2 == player) & (plays.event_type == 'BLOCKED_SHOT'))
-                    ]
-                    attempts = shots + temp.shape[0]
-                    df.loc[i, 'SA'] = attempts
-                    
-                    ### Hits calculation
-                    temp = plays[
-                        (plays.player_1 == player) & (plays.event_type == 'HIT')
-                    ]
-                    hits = temp.shape[0]
-                    df.loc[i, 'H'] = hits
-                    
-                    ### Takeaways calculation
-                    temp = plays[
-                        (plays.player_1 == player) & (plays.event_type == 'TAKEAWAY')
-                    ]
-                    takes = temp.shape[0]
-                    df.loc[i, 'TA'] = takes
-                    
-                    ### Giveaways calculation
-                    temp = plays[
-                        (plays.player_1 == player) & (plays.event_type == 'GIVEAWAY')
-                    ]
-                    gives = temp.shape[0]
-                    df.loc[i, 'GA'] = gives
-                    
-                    ### TOI Calculation
-                    temp = shift[shift.player == player].copy()
-                    temp = temp.dropna(subset=['duration'])
-                    temp['duration'] = temp['duration'].apply(lambda x: '00:' + x)
-                    temp['duration'] = pd.to_timedelta(temp['duration'])
-                    TOI = temp.duration.sum()
-                    TOI = TOI.total_seconds()
-                    if ping_nhl:
-                        # Presumably, if `ping_nhl` is True, Summarize_Game must be
-                        # being called from outside of `Summarize_Season` and we can
-                        # go straight to returning the TOI calculation as a string
-                        TOI = datetime.utcfromtimestamp(TOI).strftime('%H:%M:%S')
-                    df.loc[i, 'TOI'] = TOI
-                    
-                    ### PIM Calculation
-                    # Have a thought on how to do this. May be tedious
-                    
-                    ### PPG Calculation
-                    temp = plays[
-                        (plays.player_1 == player) &
-                        (plays.event_type == 'GOAL') &
-                        (plays[f'{team} is_ppg'] == True)
-                    ]
-                    goals = temp.shape[0]
-                    df.loc[i, 'PPG'] = goals
-                    
-                    ### SHG Calculation
-                    temp = plays[
-                        (plays.player_1 == player) &
-                        (plays.event_type == 'GOAL') &
-                        (plays[f'{team} is_shg'] == True)
-                    ]
-                    goals = temp.shape[0]
-                    df.loc[i, 'SHG'] = goals
+                stats = box[team].reindex(df.Player, fill_value=0)
+                if ping_nhl:
+                    # Presumably, if `ping_nhl` is True, Summarize_Game must be
+                    # being called from outside of `Summarize_Season` and we can
+                    # go straight to returning the TOI calculation as a string
+                    for col in toi_cols:
+                        stats[col] = stats[col].apply(
+                            lambda x: datetime.utcfromtimestamp(x).strftime('%H:%M:%S')
+                        )
+                box[team] = stats
+                
+                ### +/- and PIM Calculations
+                # Not calculated yet, so these columns are left empty
+                for col in df_cols:
+                    if col in stats.columns:
+                        df[col] = stats[col].to_numpy()
             
             # Sort each teams df
             for df in [Team1_df, Team2_df]:
                 df.sort_values(by=['P', 'G', '1A', '2A', 'S', '#'], ascending=False, inplace=True)
                 df.reset_index(inplace = True, drop = True)
+            
+            # Collect each players TOI split by strength (in the same order as the summary tables)
+            self.TOI_splits = dict()
+            for team, df in zip([Team1, Team2], [Team1_df, Team2_df]):
+                splits = box[team].loc[df.Player, toi_cols].reset_index(drop=True)
+                splits.columns = ['TOI', 'EV', 'PP', 'PK']
+                splits.insert(0, 'Player', df.Player)
+                splits.insert(1, 'ID', df.ID)
+                self.TOI_splits[team] = splits
         else:
             # Create the placeholder tables in the event the game is currently being played
             Team1, Team1_df = gs.HomeAbrv, pd.DataFrame(columns = df_cols)
             Team2, Team2_df = gs.AwayAbrv, pd.DataFrame(columns = df_cols)
+            self.unidentified = pd.DataFrame(columns = ['game_id', 'Team', 'Player'])
+            self.TOI_splits = {
+                team: pd.DataFrame(columns = ['Player', 'ID', 'TOI', 'EV', 'PP', 'PK'])
+                for team in [Team1, Team2]
+            }
             
         # Assign team dfs as class attributes
         self.Team1 = [Team1, Team1_df]
@@ -379,15 +454,10 @@ class TeamStats:
         
         # Collect the teams color that is not used as the primary fill color.
         # Will be used in `StatsTable.TeamSummary` as the hyperlink text color
-        tLUrl = 'https://raw.githubusercontent.com/AmeriFinn/LiveNHLstats/master/teamList.csv'
-        tL = pd.read_csv(tLUrl, index_col=0)
+        Home_c, Away_c = GetTeams().Colors(teamAbbrv)
         
         # Use the alternate color for a team as the text color
-        TeamCols = tL[tL.team_abbrv == teamAbbrv][['home_c', 'away_c']]
-        if teamCol == TeamCols['home_c'].values[0]:
-            teamCol_text = TeamCols['away_c'].values[0]
-        else:
-            teamCol_text = TeamCols['home_c'].values[0]
+        teamCol_text = Away_c if teamCol == Home_c else Home_c
         
         self.teamCol_text = teamCol_text
         
@@ -397,26 +467,35 @@ class TeamStats:
             (allGames.game_state == 'Final')
         ]
         
-        # Iterate over all the games to collect player stats for each game played in the season
-        team_dfs = []
-        for game_id in allGames.game_id.unique():
-            # Create a temp reference to GameStats
-            temp = GameStats(game_id)
-            temp.All()
-            
-            # Create a summary table of player stats for each game
-            TS = TeamStats()
-            TS.Summarize_Game(game_id, temp, False)
-            
-            # Collect the player stats for the relevant team from the game and store
-            df = TS.Team1[1] if TS.Team1[0] == teamAbbrv else TS.Team2[1]
-            team_dfs.append(df)
-            
+        # Add the player stats of any games that haven't been summarized yet (usually just the
+        # most recent game) to the teams season table, then collect every game's stats
+        game_ids = allGames.game_id.unique()
+        season   = SeasonPlayers(str(game_ids[0])[:4], teamAbbrv)
+        season.Fold(game_ids)
+        games    = season.players[season.players.game_id.isin(game_ids)]
+        
+        # Split the player stats back into a table for each game (games without any player
+        # stats, e.g. if there was no shift data, have an empty table)
+        by_game  = dict(tuple(games.drop(columns=SeasonPlayers.KEYS).groupby(games.game_id)))
+        team_dfs = [
+            by_game.get(game_id, season.Empty()).reset_index(drop=True) for game_id in game_ids
+        ]
         self.team_dfs = team_dfs
         
-        # Concat the team dfs and group the player stats
-        full_df = pd.concat(team_dfs, axis = 0)
-        full_df = full_df.groupby(['Player', 'ID']).sum()
+        # Collect the players who could not be identified in any of the games
+        unidentified = season.unidentified
+        self.unidentified = unidentified[unidentified.game_id.isin(game_ids)][
+            season.columns['unidentified']
+        ].reset_index(drop=True)
+        
+        # Group the player stats.
+        # Only the counted stats are summed. The player info (`#`, `Pos.`) is collected below,
+        # and the columns that aren't calculated yet (`+/-`, `PIM`) are left empty
+        stat_cols = ['G', '1A', '2A', 'P', 'S', 'SA', 'H', 'TA', 'GA', 'TOI', 'PPG', 'SHG']
+        full_df = games.groupby(['Player', 'ID'])[stat_cols].sum()
+        full_df = full_df.reindex(
+            columns=[c for c in season.columns['players'] if c not in ['Player', 'ID']]
+        )
         full_df.reset_index(inplace = True, drop = False)
         full_df.sort_values(
             by=['P', 'G', 'PPG', 'SHG', '1A', '2A', 'H'],
@@ -425,16 +504,9 @@ class TeamStats:
         )
         full_df.reset_index(inplace=True, drop=True)
         
-        # Calculate the games played for each player
-        for i in full_df.index:
-            player = full_df.loc[i, 'Player']
-            GP = 0
-            for df in team_dfs:
-                if player in df.Player.unique():
-                    GP += 1
-                    
-            full_df.loc[i, 'GP'] = int(GP)
-        full_df['GP'] = full_df.GP.astype('int')
+        # Calculate the games played for each player (each player has one row per game)
+        GP = games.groupby('ID').size()
+        full_df['GP'] = full_df.ID.map(GP).astype('int')
         
         # Reorder columns so GP is after the player info columns
         start_cols = ['Player', 'ID', '#', 'Pos.', 'GP']
@@ -446,55 +518,169 @@ class TeamStats:
             lambda x: datetime.utcfromtimestamp(x).strftime('%H:%M:%S')
         )
         
-        # Collect each players jersey number and position
-        NHL_url = 'https://www.nhl.com/player/'
-        for i in full_df.index:
-            
-            # Determine the appropriate NHL url to ping
-            player = full_df.loc[i, 'Player']
-            player = player.replace(' ', '-').lower()
-            ID     = full_df.loc[i, 'ID']
-            player_url = NHL_url + player + '-' + str(ID)
-            
-            # Collect the relevant info for the player
-            page = requests.get(player_url).text
-            page = page.replace('\n', '..')
-            
-            # Determine the players jersey number
-            search_me = r'<h3 class="player-jumbotron-vitals__name-num">.*?</h3>'
-            info = re.search(search_me, page).group(0)
-            
-            info = re.sub('<.*?>| {1,}|\.{1,}|#', ' ', info)
-            try:
-                jersey = info.split('|')[1].strip()
-            except IndexError:
-                jersey = ''
-            full_df.loc[i, '#'] = jersey
-            
-            # Determine the players position
-            search_me = r'<div class="player-jumbotron-vitals__attributes">.*?</div>'
-            info = re.search(search_me, page).group(0)
+        # Collect each players jersey number and position from the local player store.
+        # Missing or stale info is collected from the rosters of the team's most recent
+        # games first, which should cover everyone within a few calls to the NHL API.
+        info = GetPlayers().Lookup(full_df.ID, game_ids=allGames.game_id.unique()[::-1])
+        full_df['#']    = full_df.ID.map(info['#'])
+        full_df['Pos.'] = full_df.ID.map(info['Pos.'])
+        
+        self.full_df = full_df
+
+class SeasonPlayers:
+    """
+    The player stats (see `TeamStats.Summarize_Game`) from every game a team has played in a
+    season, saved locally so that each game only needs to be summarized once.
+    
+    The stats are saved with one row per player per game in
+    `Data/<season>/season_players_<team>.npz` (see `Artifacts.SaveTable`). The games that
+    have been summarized are recorded separately in `season_players_<team>.json`, along with
+    the hash of each game's cached feeds and the `SEASON_PLAYERS_VERSION` it was summarized
+    with, so a game is summarized again if its feeds have changed or the stats have been
+    updated. (A game can be summarized without adding any rows, e.g. if it has no shifts)
+    
+    Parameters
+    ----------
+    season : int or str
+        The season, e.g. 2021 (the first 4 digits of a game id).
+    team : str
+        The team's abbreviation.
+    data_dir : str, optional
+        The season's data directory.
+        The default is None, which uses `Data/<season>` in the current working directory.
+    
+    """
+    
+    # The column added to each game's player stats to keep track of the game
+    KEYS = ['game_id']
+    
+    def __init__(self, season, team, data_dir=None):
+        self.team     = team
+        self.data_dir = data_dir or os.path.join(os.getcwd(), 'Data', str(season))
+        self.path     = os.path.join(self.data_dir, f'season_players_{team}.json')
+        self.paths    = {
+            name: os.path.join(self.data_dir, f'season_{name}_{team}.npz')
+            for name in ['players', 'unidentified']
+        }
+        
+        # Read the manifest of the summarized games
+        try:
+            with open(self.path, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = dict()
+        self.games   = {int(game_id): rec for game_id, rec in manifest.get('games', {}).items()}
+        self.columns = manifest.get('columns', dict())
+        
+        # Read the saved tables (the tables are only used with the manifest they were saved
+        # with, and every game is summarized again if they can't be read)
+        try:
+            tables = {name: ReadTable(path) for name, path in self.paths.items()}
+        except (OSError, ValueError, KeyError):
+            tables = dict()
+        if not (self.games and tables):
+            self.games = dict()
+            tables = {name: pd.DataFrame(columns=self.Columns(name)) for name in self.paths}
+        for name, df in tables.items():
+            setattr(self, name, df)
+    
+    def Columns(self, name):
+        """The columns of a saved table (the `KEYS` and then the columns of a single game)."""
+        return list(dict.fromkeys(SeasonPlayers.KEYS + self.columns.get(name, [])))
+    
+    def Empty(self, name='players'):
+        """An empty table of player stats (or unidentified players) for a single game."""
+        return pd.DataFrame(columns=self.columns.get(name, []))
+    
+    def Stale(self, game_ids):
+        """
+        Determine which games need to be summarized.
+        
+        Returns the games (in the order given) that haven't been summarized, were
+        summarized from feeds that have since changed, or were summarized by a different
+        `SEASON_PLAYERS_VERSION`.
+        
+        """
+        stale = []
+        for game_id in game_ids:
+            feed_hash = (ReadMeta(GameDir(game_id)) or dict()).get('hash')
+            rec = self.games.get(int(game_id))
+            if rec is None or rec != dict(feed_hash=feed_hash, version=SEASON_PLAYERS_VERSION):
+                stale.append(game_id)
+        
+        return stale
+    
+    def Fold(self, game_ids):
+        """
+        Add the player stats of any of the games that need to be summarized (see `Stale`).
+        
+        Parameters
+        ----------
+        game_ids : list
+            The (final) games the team played in.
+        
+        Returns
+        -------
+        int
+            The number of games that were summarized.
+        
+        """
+        stale = self.Stale(game_ids)
+        if not stale:
+            return 0
+        
+        # Summarize the games (the GameStats for each game are computed in parallel)
+        players, unidentified, games = [], [], dict()
+        for game_id, gs in zip(stale, GameStats.compute_many(stale)):
+            TS = TeamStats()
+            TS.Summarize_Game(game_id, gs, False)
             
-            info = re.sub('<.*?>| {1,}|\.{1,}', ' ', info)
-            position = info.split('|')[0].strip()
-            full_df.loc[i, 'Pos.'] = position
+            # Collect the player stats for the team and tag them with the game
+            df = TS.Team1[1] if TS.Team1[0] == self.team else TS.Team2[1]
+            missing = TS.unidentified[TS.unidentified.Team == self.team]
+            self.columns = dict(players=list(df.columns), unidentified=list(missing.columns))
+            players.append(df.assign(game_id=int(game_id)))
+            unidentified.append(missing.assign(game_id=int(game_id)))
             
-        self.full_df = full_df
+            games[int(game_id)] = dict(
+                feed_hash = (ReadMeta(gs.data_dir) or dict()).get('hash'),
+                version   = SEASON_PLAYERS_VERSION
+            )
+        
+        # Replace any old stats for the games, and save the tables
+        os.makedirs(self.data_dir, exist_ok=True)
+        for name, new in zip(['players', 'unidentified'], [players, unidentified]):
+            df = getattr(self, name)
+            df = df[~df.game_id.isin(stale)]
+            df = pd.concat(([] if df.empty else [df]) + new, ignore_index=True)
+            df = df[self.Columns(name)].astype({'game_id': int})
+            SaveTable(self.paths[name], df)
+            setattr(self, name, df)
+        
+        # The manifest is written last, so games are only recorded once their stats are saved
+        self.games.update(games)
+        manifest = dict(
+            columns = self.columns,
+            games   = {str(game_id): rec for game_id, rec in self.games.items()}
+        )
+        Replace(self.path, lambda f: json.dump(manifest, f), mode='w')
+        
+        return len(stale)
 
-game_id = 2021020221
+# game_id = 2021020221
 # game_id = 2021020030
 # game_id = 2021021052
 
-gs = GameStats(game_id)
-gs.All()
+# gs = GameStats(game_id)
+# gs.All()
 
-TS = TeamStats()
+# TS = TeamStats()
 
-TS.Summarize_Game(game_id, gs)
+# TS.Summarize_Game(game_id, gs)
 # TS.Team1
 # TS.Team2
 
-team = gs.Away
-allGames = gs.Games
-teamCol = '#236192'
-TS.Summarize_Season(team, gs, teamCol)
+# team = gs.Away
+# allGames = gs.Games
+# teamCol = '#236192'
+# TS.Summarize_Season(team, gs, teamCol)
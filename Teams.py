@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Registry of the team info in `teamList.csv` (names, abbreviations, conference, division,
+colors, and the direction of play recorded in each team's arena).
+
+The csv file that ships with the repo is read once per process, and each team can then be
+looked up by its full name or its abbreviation.
+    
+    Teams = GetTeams()
+    Teams.Abbrv('Colorado Avalanche')  # 'COL'
+    Teams.Colors('COL')                # (home color, away color)
+    Teams.Team('COL')['division']      # 'Central'
+
+Created on Sun Oct 18 13:20:44 2026
+
+@author: grega
+"""
+import os
+import pandas as pd
+from functools import lru_cache
+
+# The team list that ships with the repo
+TEAM_LIST = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'teamList.csv')
+
+class TeamRegistry:
+    """
+    Lookup tables for the team info in `teamList.csv`.
+    
+    Parameters
+    ----------
+    path : str, optional
+        The path to the team list. The default is the `teamList.csv` file in the repo.
+    
+    """
+    
+    def __init__(self, path=TEAM_LIST):
+        tL = pd.read_csv(path, index_col=0, encoding='utf-8-sig')
+        self.tL = tL
+        
+        # Index each team's info by its full name and by its abbreviation
+        records       = tL.to_dict('records')
+        self.by_name  = {rec['team_name']: rec for rec in records}
+        self.by_abbrv = {rec['team_abbrv']: rec for rec in records}
+    
+    def Team(self, team):
+        """
+        Collect a team's info.
+        
+        Parameters
+        ----------
+        team : str
+            The team's full name (e.g. 'Colorado Avalanche') or abbreviation (e.g. 'COL').
+        
+        Returns
+        -------
+        dict
+            The team's row of `teamList.csv`.
+        
+        """
+        try:
+            return self.by_name[team] if team in self.by_name else self.by_abbrv[team]
+        except KeyError:
+            raise KeyError(f'{team} is not a team in teamList.csv') from None
+    
+    def Abbrv(self, team):
+        """The team's abbreviation recognized by the NHL."""
+        return self.Team(team)['team_abbrv']
+    
+    def Name(self, team):
+        """The team's full name."""
+        return self.Team(team)['team_name']
+    
+    def Colors(self, team):
+        """The team's (home, away) colors (in Hex code format)."""
+        rec = self.Team(team)
+        return rec['home_c'], rec['away_c']
+    
+    def DirectOfPlay(self, team):
+        """
+        Determine if the team's arena records x/y stat data the "normal" way, or backwards.
+        (Only meaningful for the home team of a game)
+        """
+        return self.Team(team)['normal_direct_of_play']
+
+@lru_cache(maxsize=None)
+def GetTeams(path=TEAM_LIST):
+    """
+    Return the team registry, reading `teamList.csv` the first time it is requested.
+    
+    Parameters
+    ----------
+    path : str, optional
+        The path to the team list. The default is the `teamList.csv` file in the repo.
+    
+    Returns
+    -------
+    TeamRegistry
+    
+    """
+    return TeamRegistry(path)
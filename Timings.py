@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+Opt-in timing and memory instrumentation for the stages of `GameStats.All` and the calls
+made to the NHL API through the nhlstats module.
+
+Each stage/call is recorded with its wall time, CPU time, peak memory (from tracemalloc),
+and the number of rows it produced. The records are kept on `gs.timings` and can be written
+out as JSON lines so a nightly run can be profiled after the fact.
+
+Stages can be nested (e.g. the network calls made inside of `LoadFeeds`). Each record names
+its `parent` stage and the time spent in its nested stages (`child_wall_s`, `child_cpu_s`),
+so `summary` only counts the time of a nested stage once.
+    
+    timings = Timings(path='Data/timings.jsonl')
+    gs = GameStats(game_id, timings=timings)
+    gs.All()
+    gs.timings.records
+
+Created on Sun Oct 18 10:12:37 2026
+
+@author: grega
+"""
+import json
+import time
+import threading
+import tracemalloc
+import datetime as dt
+import pandas as pd
+from contextlib import contextmanager
+
+class Timings:
+    """
+    Collect timing records for the stages and network calls of one or more games.
+    
+    A disabled `Timings` object (the default for `GameStats`) records nothing and adds
+    no overhead beyond a function call per stage.
+    
+    Parameters
+    ----------
+    enabled : bool, optional
+        If False, nothing is recorded. The default is True.
+    path : str, optional
+        A JSON lines file that each record is appended to as it is made. The default is None.
+    memory : bool, optional
+        If True, peak memory is recorded with tracemalloc (which slows down the code being
+        measured). Tracing is stopped again once the outermost stage ends. Since the peak is
+        shared by every thread, memory is only recorded for stages run in the main thread
+        (not e.g. the network calls of `FeedCache.Prefetch`). The default is True.
+    
+    """
+    
+    def __init__(self, enabled=True, path=None, memory=True):
+        self.enabled = enabled
+        self.path    = path
+        self.memory  = memory
+        self.records = []
+        self.local   = threading.local()
+    
+    def __getstate__(self):
+        # The stages open in each thread aren't sent to other processes
+        state = self.__dict__.copy()
+        state.pop('local', None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.local = threading.local()
+    
+    def open_stages(self):
+        """The stages currently open in this thread (outermost first)."""
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = []
+        return self.local.stack
+    
+    @contextmanager
+    def stage(self, name, game_id=None, kind='stage'):
+        """
+        Time the code run inside of a `with` block.
+        
+        The record is yielded so the row count can be filled in before the block ends:
+            
+            with timings.stage('SumDF', game_id) as rec:
+                gs.SumDF()
+                rec['rows'] = gs.SumStats.shape[0]
+        
+        Parameters
+        ----------
+        name : str
+            The name of the stage.
+        game_id : int, optional
+            The game the stage was run for. The default is None.
+        kind : str, optional
+            'stage' or 'network'. The default is 'stage'.
+        
+        Yields
+        ------
+        rec : dict
+            The record for the stage.
+        
+        """
+        rec = dict(game_id=game_id, kind=kind, name=name, rows=None)
+        if not self.enabled:
+            yield rec
+            return
+        
+        stack  = self.open_stages()
+        parent = stack[-1] if stack else None
+        frame  = dict(child_wall=0.0, child_cpu=0.0, started=False)
+        frame['memory'] = self.memory and threading.current_thread() is threading.main_thread()
+        rec['parent']   = parent['name'] if parent else None
+        frame['name']   = name
+        
+        if frame['memory']:
+            # Start tracing memory allocations if no one else already is
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                frame['started'] = True
+            
+            # The peak is reset for this stage, so save the enclosing stage's peak first
+            current, peak = tracemalloc.get_traced_memory()
+            if parent is not None and parent['memory']:
+                parent['peak'] = max(parent['peak'], peak)
+            tracemalloc.reset_peak()
+            frame['base'] = frame['peak'] = current
+        
+        stack.append(frame)
+        rec['started'] = dt.datetime.now().isoformat(timespec='milliseconds')
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield rec
+        finally:
+            stack.pop()
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            rec['wall_s'] = round(wall, 6)
+            rec['cpu_s']  = round(cpu, 6)
+            
+            # The time spent in nested stages (which have their own records)
+            rec['child_wall_s'] = round(frame['child_wall'], 6)
+            rec['child_cpu_s']  = round(frame['child_cpu'], 6)
+            if parent is not None:
+                parent['child_wall'] += wall
+                parent['child_cpu']  += cpu
+            
+            if frame['memory']:
+                # Peak memory allocated above what was already in use when the stage started
+                peak = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+                rec['peak_mb'] = round(max(peak - frame['base'], 0) / 2**20, 3)
+                if parent is not None and parent['memory']:
+                    parent['peak'] = max(parent['peak'], peak)
+                if frame['started']:
+                    tracemalloc.stop()
+            self.add(rec)
+    
+    def call(self, func, *args, game_id=None, **kwargs):
+        """
+        Time a call to the NHL API (e.g. `list_plays`) and record the number of rows returned.
+        
+        Parameters
+        ----------
+        func : function
+            The function to call.
+        *args, **kwargs
+            Passed to `func`.
+        game_id : int, optional
+            The game the call was made for. The default is None.
+        
+        Returns
+        -------
+        The result of `func`.
+        
+        """
+        with self.stage(func.__name__, game_id, kind='network') as rec:
+            result = func(*args, **kwargs)
+            rec['rows'] = len(result)
+        return result
+    
+    def add(self, rec):
+        """Add a record and append it to the JSON lines file (if one was given)."""
+        self.records.append(rec)
+        if self.path is not None:
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(rec, default=str) + '\n')
+    
+    def write(self, path):
+        """Write all of the records to a JSON lines file."""
+        with open(path, 'w') as f:
+            for rec in self.records:
+                f.write(json.dumps(rec, default=str) + '\n')
+    
+    def summary(self):
+        """
+        Total the wall time, CPU time, and rows of each stage/call by name.
+        
+        The time spent in nested stages is only counted for the nested stages, so the times
+        of a stage exclude e.g. the network calls made inside of it.
+        """
+        df = pd.DataFrame(self.records)
+        if df.empty:
+            return df
+        
+        for col in ['wall_s', 'cpu_s']:
+            if f'child_{col}' in df.columns:
+                df[col] = df[col] - df[f'child_{col}'].fillna(0)
+        
+        cols  = [c for c in ['wall_s', 'cpu_s', 'rows'] if c in df.columns]
+        group = df.groupby(['kind', 'name'], sort=False)
+        summ  = group[cols].sum()
+        summ.insert(0, 'count', group.size())
+        if 'peak_mb' in df.columns:
+            summ['peak_mb'] = group['peak_mb'].max()
+        
+        return summ
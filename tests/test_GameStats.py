@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Regression tests for the vectorized helpers in GameStats, compared against the row by row
+versions that they replaced.
+
+Created on Sun Oct 18 18:41:09 2026
+
+@author: grega
+"""
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# GameStats collects its feeds through the nhlstats module (see FeedCache)
+pytest.importorskip('nhlstats')
+
+from GameStats import in_house, InHouse, TallyEvents
+
+# The plays df (after `GameStats.ModifyDFs`) of saved games, with the columns the event
+# tallies are built from
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+GAMES = ['plays_regulation.csv', 'plays_overtime.csv']
+
+def OldInHouse(x, y):
+    """The original scalar check for an event occuring within "the house"."""
+    
+    # Define a useful function for determining if an event falls within the triangular
+    # portions of the house
+    def point_on_line(x):
+        return 22 - ((x - 69) * (18 / 20))
+    
+    # Standardize the x input
+    x = 0 if x is None else x
+    y = 0 if y is None else y
+    x = abs(x)
+    
+    # 1st Rectangle | Domain: [54, 69],    Range: [-22, 22]
+    if 54 <= x <= 69:
+        if -22 <= y <= 22:
+            return True
+    
+    # 2nd Rectangle | Domain: (69, 89],    Range: [-4, 4]
+    # 1st Triangele | Domain: (69, 89],    Range: [4, 22]
+    # 2nd Triangele | Domain: (69, 89],    Range: [-22, -4]
+    if 69 < x <= 89:
+        if -4 <= y <= 4:
+            return True
+        
+        elif 4 < abs(y) <= 22:
+            y = abs(y)
+            if y <= point_on_line(x):
+                return True
+    
+    return False
+
+# A grid over the whole rink (every 0.5 ft), plus each boundary of the house (and just
+# either side of it), and a few points on the line bounding the triangles
+BOUNDS = [4, 22, 54, 69, 89]
+XS = np.unique(np.concatenate([
+    np.arange(-100, 100.5, 0.5),
+    [s * (b + d) for b in BOUNDS for d in [-1e-9, 0, 1e-9] for s in [-1, 1]]
+]))
+YS = np.unique(np.concatenate([
+    np.arange(-43, 43.5, 0.5),
+    [s * (b + d) for b in BOUNDS for d in [-1e-9, 0, 1e-9] for s in [-1, 1]]
+]))
+LINE = [(x, 22 - ((x - 69) * (18 / 20))) for x in [70, 74, 79, 84, 88.5]]
+
+def test_in_house_grid():
+    x, y = np.meshgrid(XS, YS)
+    x, y = x.ravel(), y.ravel()
+    expected = np.array([OldInHouse(a, b) for a, b in zip(x, y)])
+    
+    assert expected.any()
+    np.testing.assert_array_equal(in_house(x, y), expected)
+
+def test_in_house_triangle_line():
+    points = LINE + [(-x, -y) for x, y in LINE] + [(x, y + 1e-9) for x, y in LINE]
+    x, y = zip(*points)
+    expected = np.array([OldInHouse(a, b) for a, b in points])
+    
+    np.testing.assert_array_equal(in_house(x, y), expected)
+
+def test_in_house_missing():
+    # None is treated as 0, while NaN never falls within the house
+    points = [
+        (None, None), (None, 0), (0, None), (60, None), (None, 10), (80, None),
+        (np.nan, np.nan), (np.nan, 0), (60, np.nan), (np.nan, 10), (80, np.nan)
+    ]
+    x, y = zip(*points)
+    expected = np.array([OldInHouse(a, b) for a, b in points])
+    
+    np.testing.assert_array_equal(in_house(list(x), list(y)), expected)
+    np.testing.assert_array_equal(
+        in_house(np.array(x, dtype=float), np.array(y, dtype=float)),
+        [OldInHouse(*p) for p in zip(np.array(x, dtype=float), np.array(y, dtype=float))]
+    )
+    assert [InHouse(a, b) for a, b in points] == expected.tolist()
+
+def OldTally(plays, Home, Away):
+    """The original row by row event tallies of `GameStats.AggregateData`."""
+    Both = [Away, Home]
+    plays = plays.reset_index(drop=True)
+    
+    # Away: Even index numbs, Home: Odd index numbs
+    newC = [
+        f'{team} {stat}' for stat in [
+            'Goals', 'Shots', 'Hits', 'Shot Attempts', 'Blocked Shots', 'Missed Shots',
+            'Takeaways', 'Giveaways', 'Faceoff Wins', 'House Shots', 'House Attempts'
+        ] for team in Both
+    ]
+    for S in newC:
+        plays[S] = 0
+    
+    for i in plays.index:
+        event = plays.loc[i, 'event_type']
+        team  = plays.loc[i, 'team_for']
+        x, y  = plays.loc[i, ['x', 'y']]
+        
+        if event == 'GOAL':
+            plays.loc[i, team + ' Goals'] = 1
+            if OldInHouse(x, y):
+                plays.loc[i, [team + ' House Shots']] = 1
+        
+        if event in ['SHOT', 'GOAL']:
+            plays.loc[i, team + ' Shots'] = 1
+            if OldInHouse(x, y):
+                plays.loc[i, [team + ' House Shots']] = 1
+        
+        if event in ['MISSED_SHOT', 'SHOT', 'GOAL']:
+            plays.loc[i, team + ' Shot Attempts'] = 1
+            if OldInHouse(x, y):
+                plays.loc[i, [team + ' House Attempts']] = 1
+        
+        # The shot attempt of a blocked shot goes to the team that had it blocked
+        if event == 'BLOCKED_SHOT':
+            oppo = Both[0] if team != Both[0] else Both[1]
+            plays.loc[i, team + ' Blocked Shots'] = 1
+            plays.loc[i, oppo + ' Shot Attempts'] = 1
+            if OldInHouse(x, y):
+                plays.loc[i, [oppo + ' House Attempts']] = 1
+        
+        if event == 'MISSED_SHOT':
+            plays.loc[i, team + ' Missed Shots'] = 1
+        
+        if event == 'HIT':
+            plays.loc[i, team + ' Hits'] = 1
+        
+        if event == 'TAKEAWAY':
+            plays.loc[i, team + ' Takeaways'] = 1
+        
+        if event == 'GIVEAWAY':
+            plays.loc[i, team + ' Giveaways'] = 1
+        
+        if event == 'FACEOFF':
+            plays.loc[i, team + ' Faceoff Wins'] = 1
+    
+    return plays[newC].cumsum(axis=0)
+
+@pytest.mark.parametrize('game', GAMES)
+def test_tally_events_saved_games(game):
+    plays = pd.read_csv(os.path.join(DATA_DIR, game))
+    Home, Away = 'COL', 'ARI'
+    
+    expected = OldTally(plays, Home, Away)
+    tally    = TallyEvents(plays, Home, Away)
+    
+    assert expected.iloc[-1].sum() > 0
+    assert sorted(tally.columns) == sorted(expected.columns)
+    for col in expected.columns:
+        np.testing.assert_array_equal(tally[col].to_numpy(), expected[col].to_numpy(), col)